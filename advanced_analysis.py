@@ -5,6 +5,8 @@
 Advanced Display Analysis Module
 """
 
+import os
+import threading
 import cv2
 import numpy as np
 from scipy import ndimage
@@ -12,11 +14,119 @@ from skimage import measure, morphology, filters
 from typing import Tuple, List, Dict, Optional
 import matplotlib.pyplot as plt
 
+from color_lut import LabLookupTable, bgr_to_lab
+from histogram_statistics import HistogramStatistics
+
+class AnalysisWorkspace:
+    """분석용 작업 버퍼 풀 (ROI 크기가 커질 때만 재할당, 스레드 간 공유 불가)"""
+    
+    def __init__(self):
+        self.buffers = {}
+        self.allocations = 0  # 누적 재할당 횟수 (정상 상태에서는 증가하지 않아야 함)
+    
+    def get(self, name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """
+        이름별 버퍼를 요청한 크기의 뷰로 반환
+        
+        기존 버퍼가 요청 크기 이상이면 그 일부 뷰를 반환하므로,
+        프레임마다 ROI 크기가 조금씩 흔들려도 재할당하지 않습니다.
+        
+        Args:
+            name: 버퍼 이름
+            shape: 요청 크기
+            dtype: 데이터 타입
+        
+        Returns:
+            요청 크기의 버퍼 뷰
+        """
+        buffer = self.buffers.get(name)
+        if (buffer is None or buffer.dtype != np.dtype(dtype) or buffer.ndim != len(shape)
+                or any(have < need for have, need in zip(buffer.shape, shape))):
+            if buffer is not None and buffer.ndim == len(shape):
+                shape_alloc = tuple(max(have, need) for have, need in zip(buffer.shape, shape))
+            else:
+                shape_alloc = tuple(shape)
+            buffer = np.empty(shape_alloc, dtype=dtype)
+            self.buffers[name] = buffer
+            self.allocations += 1
+        
+        return buffer[tuple(slice(0, n) for n in shape)]
+    
+    def release(self):
+        """모든 버퍼 해제"""
+        self.buffers.clear()
+
+
 class AdvancedDisplayAnalyzer:
-    """고급 디스플레이 분석 클래스"""
+    """
+    고급 디스플레이 분석 클래스
+    
+    작업 버퍼(workspace)는 스레드마다 따로 두므로 한 분석기를 검사 스레드 여러 개가
+    공유해도 됩니다 (스레드당 버퍼 한 벌씩 할당).
+    """
+    
+    # 보고서에 기본으로 보관하지 않는 대용량 결과 (검사 항목: 키 목록)
+    HEAVY_ARTIFACTS = {
+        'dead_pixels': ('mask',),
+        'bright_spots': ('labels',),
+        'mura_defects': ('mask', 'mura_image'),
+    }
+    
+    # 보고서에 보관할 데드 픽셀 좌표 / 밝은 점 / 무라 결함 목록 최대 개수
+    MAX_REPORT_COORDINATES = 100
+    
+    # 압축 보고서에서 개수를 제한할 목록 (검사 항목: 목록 키)
+    REPORT_LISTS = {
+        'bright_spots': 'spots',
+        'mura_defects': 'defects',
+    }
     
     def __init__(self):
         self.debug_mode = False
+        self.lab_lut = None  # ΔE 픽셀 단위 모드에서 지연 로드
+        self._local = threading.local()  # 스레드별 작업 버퍼
+        self._box_kernel = (5, 5)
+        self._open_kernel = np.ones((3, 3), np.uint8)
+    
+    @property
+    def workspace(self) -> AnalysisWorkspace:
+        """현재 스레드의 작업 버퍼 (처음 사용할 때 생성)"""
+        workspace = getattr(self._local, 'workspace', None)
+        if workspace is None:
+            workspace = self._local.workspace = AnalysisWorkspace()
+        return workspace
+    
+    def _to_gray(self, image: np.ndarray) -> np.ndarray:
+        """작업 버퍼에 그레이스케일 변환 (이미 그레이스케일이면 그대로 반환)"""
+        if image.ndim == 2:
+            return image
+        gray = self.workspace.get('gray', image.shape[:2], np.uint8)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=gray)
+    
+    def _dead_pixel_mask(self, gray: np.ndarray, threshold: float) -> np.ndarray:
+        """로컬 평균과의 차이가 큰 픽셀 마스크 (작업 버퍼, 0/255)"""
+        shape = gray.shape
+        gray_f = self.workspace.get('gray_f32', shape, np.float32)
+        local_mean = self.workspace.get('local_mean', shape, np.float32)
+        diff = self.workspace.get('diff_f32', shape, np.float32)
+        mask = self.workspace.get('dead_mask', shape, np.uint8)
+        
+        gray_f[...] = gray
+        cv2.blur(gray_f, self._box_kernel, dst=local_mean)
+        cv2.absdiff(gray_f, local_mean, dst=diff)
+        return cv2.compare(diff, threshold * 255, cv2.CMP_GT, dst=mask)
+    
+    def _bright_spot_components(self, gray: np.ndarray) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+        """적응적 임계값 + 열림 연산 후 연결 요소 (라벨은 작업 버퍼)"""
+        shape = gray.shape
+        adaptive_thresh = self.workspace.get('adaptive', shape, np.uint8)
+        cleaned = self.workspace.get('cleaned', shape, np.uint8)
+        labels = self.workspace.get('labels', shape, np.int32)
+        
+        cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+                              11, 2, dst=adaptive_thresh)
+        cv2.morphologyEx(adaptive_thresh, cv2.MORPH_OPEN, self._open_kernel, dst=cleaned)
+        return cv2.connectedComponentsWithStats(cleaned, labels=labels, connectivity=8)
     
     def detect_dead_pixels(self, image: np.ndarray, threshold: float = 0.1) -> Dict:
         """
@@ -30,15 +140,10 @@ class AdvancedDisplayAnalyzer:
             데드 픽셀 정보 딕셔너리
         """
         # 그레이스케일 변환
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = self._to_gray(image)
         
-        # 로컬 평균 계산
-        kernel = np.ones((5, 5), np.float32) / 25
-        local_mean = cv2.filter2D(gray.astype(np.float32), -1, kernel)
-        
-        # 데드 픽셀 후보 찾기 (로컬 평균과의 차이가 큰 픽셀)
-        diff = np.abs(gray.astype(np.float32) - local_mean)
-        dead_pixel_mask = diff > (threshold * 255)
+        # 데드 픽셀 후보 찾기 (5x5 로컬 평균과의 차이가 큰 픽셀)
+        dead_pixel_mask = self._dead_pixel_mask(gray, threshold) > 0
         
         # 데드 픽셀 좌표 추출
         dead_pixels = np.where(dead_pixel_mask)
@@ -63,19 +168,10 @@ class AdvancedDisplayAnalyzer:
             밝은 점 정보 딕셔너리
         """
         # 그레이스케일 변환
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = self._to_gray(image)
         
-        # 적응적 임계값 적용
-        adaptive_thresh = cv2.adaptiveThreshold(
-            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-        )
-        
-        # 모폴로지 연산으로 노이즈 제거
-        kernel = np.ones((3, 3), np.uint8)
-        cleaned = cv2.morphologyEx(adaptive_thresh, cv2.MORPH_OPEN, kernel)
-        
-        # 연결된 구성 요소 찾기
-        num_labels, labels, stats, centroids = cv2.connectedComponentsWithStats(cleaned, connectivity=8)
+        # 적응적 임계값 + 모폴로지 노이즈 제거 후 연결된 구성 요소 찾기
+        num_labels, labels, stats, centroids = self._bright_spot_components(gray)
         
         bright_spots = []
         for i in range(1, num_labels):  # 0은 배경
@@ -91,9 +187,92 @@ class AdvancedDisplayAnalyzer:
         return {
             'count': len(bright_spots),
             'spots': bright_spots,
-            'labels': labels
+            'labels': labels.copy()  # 작업 버퍼는 다음 호출에서 재사용됨
         }
-    
+
+    def detect_scratches(self, image: np.ndarray, min_length: int = 30,
+                         min_contrast: int = 25, max_width: float = 5.0) -> Dict:
+        """
+        스크래치(선형 결함) 감지
+
+        실시간 검사 루프(10 FPS)에서 호출되므로 픽셀 단위 파이썬 루프 없이
+        모폴로지 탑햇/블랙햇 + 연결 요소 통계만으로 후보를 걸러냅니다.
+
+        Args:
+            image: 입력 이미지 (BGR 또는 그레이스케일)
+            min_length: 최소 스크래치 길이 (픽셀)
+            min_contrast: 배경 대비 최소 밝기 차이 (0-255)
+            max_width: 최대 평균 선 폭 (픽셀)
+
+        Returns:
+            스크래치 정보 딕셔너리
+        """
+        # 그레이스케일 변환
+        gray = self._to_gray(image)
+        shape = gray.shape
+        dark = self.workspace.get('blackhat', shape, np.uint8)
+        bright = self.workspace.get('tophat', shape, np.uint8)
+        mask = self.workspace.get('line_mask', shape, np.uint8)
+        labels = self.workspace.get('labels', shape, np.int32)
+
+        # 선 폭보다 큰 커널의 탑햇/블랙햇으로 밝은/어두운 가는 구조만 추출
+        ksize = int(2 * np.ceil(max_width) + 1)
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (ksize, ksize))
+        cv2.morphologyEx(gray, cv2.MORPH_BLACKHAT, kernel, dst=dark)
+        cv2.morphologyEx(gray, cv2.MORPH_TOPHAT, kernel, dst=bright)
+        cv2.max(dark, bright, dst=dark)
+        cv2.threshold(dark, min_contrast, 255, cv2.THRESH_BINARY, dst=mask)
+
+        # 연결된 구성 요소 통계로 후보 선별 (길이, 평균 폭)
+        num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(mask, labels=labels,
+                                                                        connectivity=8)
+
+        widths = stats[1:, cv2.CC_STAT_WIDTH].astype(np.float32)
+        heights = stats[1:, cv2.CC_STAT_HEIGHT].astype(np.float32)
+        areas = stats[1:, cv2.CC_STAT_AREA].astype(np.float32)
+        diagonals = np.hypot(widths, heights)
+
+        candidates = np.nonzero(
+            (diagonals >= min_length) & (areas <= diagonals * max_width)
+        )[0] + 1
+
+        segments = []
+        for i in candidates:
+            x = stats[i, cv2.CC_STAT_LEFT]
+            y = stats[i, cv2.CC_STAT_TOP]
+            w = stats[i, cv2.CC_STAT_WIDTH]
+            h = stats[i, cv2.CC_STAT_HEIGHT]
+
+            # 후보 영역 내부 좌표만 추출해 최소 외접 사각형 계산
+            ys, xs = np.nonzero(labels[y:y+h, x:x+w] == i)
+            points = np.column_stack((xs + x, ys + y)).astype(np.float32)
+            (cx, cy), (rw, rh), angle = cv2.minAreaRect(points)
+
+            length = max(rw, rh)
+            width = min(rw, rh)
+            if length < min_length or width > max_width:
+                continue
+
+            # 긴 변 방향으로 양 끝점 계산
+            direction = angle if rw >= rh else angle + 90
+            theta = np.deg2rad(direction)
+            dx = 0.5 * length * np.cos(theta)
+            dy = 0.5 * length * np.sin(theta)
+
+            segments.append({
+                'start': (int(round(cx - dx)), int(round(cy - dy))),
+                'end': (int(round(cx + dx)), int(round(cy + dy))),
+                'length': float(length),
+                'width': float(width),
+                'angle': float(direction % 180),
+                'bbox': (int(x), int(y), int(w), int(h))
+            })
+
+        return {
+            'count': len(segments),
+            'segments': segments
+        }
+
     def analyze_color_uniformity(self, image: np.ndarray, grid_size: int = 10) -> Dict:
         """
         색상 균일성 분석
@@ -105,31 +284,9 @@ class AdvancedDisplayAnalyzer:
         Returns:
             색상 균일성 분석 결과
         """
-        height, width = image.shape[:2]
-        
-        # 그리드 생성
-        grid_h = height // grid_size
-        grid_w = width // grid_size
-        
-        grid_colors = []
-        grid_positions = []
-        
-        for i in range(grid_size):
-            for j in range(grid_size):
-                # 그리드 영역 추출
-                y1 = i * grid_h
-                y2 = min((i + 1) * grid_h, height)
-                x1 = j * grid_w
-                x2 = min((j + 1) * grid_w, width)
-                
-                grid_region = image[y1:y2, x1:x2]
-                
-                # 평균 색상 계산
-                mean_color = np.mean(grid_region.reshape(-1, 3), axis=0)
-                grid_colors.append(mean_color)
-                grid_positions.append((x1, y1, x2, y2))
-        
-        grid_colors = np.array(grid_colors)
+        # 그리드 셀 평균 색상 (한 번의 블록 축소)
+        grid_colors = self._block_means(image, grid_size).reshape(-1, 3)
+        grid_positions = self._grid_positions(image.shape, grid_size)
         
         # 색상 분산 계산
         color_variance = np.var(grid_colors, axis=0)
@@ -147,6 +304,99 @@ class AdvancedDisplayAnalyzer:
             'uniformity_score': 1.0 - (np.mean(color_variance) / 255.0)
         }
     
+    def _block_means(self, image: np.ndarray, grid_size: int) -> np.ndarray:
+        """
+        그리드 셀별 평균 계산 (블록 축소)
+
+        각 셀 크기는 (height // grid_size, width // grid_size)이며
+        나머지 행/열은 제외합니다.
+
+        Args:
+            image: 입력 이미지 (H, W, C)
+            grid_size: 그리드 크기
+
+        Returns:
+            (grid_size, grid_size, C) 셀 평균 배열 (float64)
+        """
+        height, width = image.shape[:2]
+        grid_h = height // grid_size
+        grid_w = width // grid_size
+        channels = image.shape[2] if image.ndim == 3 else 1
+
+        # 행 블록마다 cv2.reduce로 열 합계를 구한 뒤 열 블록끼리 합산
+        # (채널 수별로 버퍼를 따로 두어야 행 뷰가 연속 메모리로 유지되어 dst로 쓸 수 있음)
+        column_sums = self.workspace.get(f'column_sums_{channels}', (grid_size, width, channels), np.float64)
+        for i in range(grid_size):
+            row_block = image[i * grid_h:(i + 1) * grid_h]
+            cv2.reduce(row_block, 0, cv2.REDUCE_SUM, dst=column_sums[i].reshape(1, width, channels),
+                       dtype=cv2.CV_64F)
+
+        blocks = column_sums[:, :grid_w * grid_size].reshape(grid_size, grid_size, grid_w, channels)
+        return blocks.sum(axis=2) / (grid_h * grid_w)
+
+    def _grid_positions(self, shape: Tuple, grid_size: int) -> List[Tuple[int, int, int, int]]:
+        """그리드 셀 좌표 목록 (x1, y1, x2, y2)"""
+        grid_h = shape[0] // grid_size
+        grid_w = shape[1] // grid_size
+        return [(j * grid_w, i * grid_h, (j + 1) * grid_w, (i + 1) * grid_h)
+                for i in range(grid_size) for j in range(grid_size)]
+
+    def analyze_color_uniformity_delta_e(self, image: np.ndarray, grid_size: int = 10,
+                                         reference: str = 'center',
+                                         per_pixel: bool = False) -> Dict:
+        """
+        CIE 1976 ΔE 색상 균일성 분석
+
+        기본 모드는 그리드 셀 평균 색상만 Lab으로 변환하므로 BGR 분산 계산과
+        비슷한 비용이 듭니다. per_pixel 모드는 디스크에 캐시된 양자화 3D LUT로
+        모든 픽셀을 Lab으로 변환한 뒤 셀 평균을 구합니다.
+
+        Args:
+            image: 입력 이미지 (BGR)
+            grid_size: 그리드 크기
+            reference: 기준 색상 ('center': 중앙 셀, 'mean': 전체 평균)
+            per_pixel: 픽셀 단위 LUT 변환 사용 여부
+
+        Returns:
+            ΔE 균일성 분석 결과
+        """
+        if per_pixel:
+            if self.lab_lut is None:
+                self.lab_lut = LabLookupTable()
+            grid_lab = self._block_means(self.lab_lut.convert(image), grid_size)
+        else:
+            grid_lab = bgr_to_lab(self._block_means(image, grid_size))
+
+        grid_lab = grid_lab.reshape(-1, 3).astype(np.float64)
+
+        if reference == 'center':
+            center = grid_size // 2
+            reference_lab = grid_lab[center * grid_size + center]
+        else:
+            reference_lab = grid_lab.mean(axis=0)
+
+        delta_e = np.linalg.norm(grid_lab - reference_lab, axis=1)
+        max_delta_e = float(np.max(delta_e))
+
+        # CIE 1976 기준 판정 (quality_standards.md)
+        if max_delta_e < 3:
+            grade = '우수'
+        elif max_delta_e <= 6:
+            grade = '양호'
+        else:
+            grade = '불량'
+
+        return {
+            'grid_lab': grid_lab.tolist(),
+            'grid_positions': self._grid_positions(image.shape, grid_size),
+            'reference_lab': reference_lab.tolist(),
+            'delta_e': delta_e.reshape(grid_size, grid_size).tolist(),
+            'max_delta_e': max_delta_e,
+            'mean_delta_e': float(np.mean(delta_e)),
+            'p95_delta_e': float(np.percentile(delta_e, 95)),
+            'grade': grade
+        }
+    
     def detect_mura_defects(self, image: np.ndarray, sigma: float = 1.0) -> Dict:
         """
         무라(Mura) 결함 감지 (불균일한 밝기 영역)
@@ -209,36 +459,94 @@ class AdvancedDisplayAnalyzer:
         # 그레이스케일 변환
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         
-        # 히스토그램 분석
-        hist = cv2.calcHist([gray], [0], None, [256], [0, 256])
-        
-        # 픽셀 강도 분포 통계
-        pixel_intensities = gray.flatten()
+        # 히스토그램 한 번으로 픽셀 강도 분포 통계 계산
+        intensity_stats = HistogramStatistics.from_image(gray)
+        stats = intensity_stats.channel_stats()
         
         # 응답 곡선 분석 (선형성)
         if test_pattern is not None:
             # 테스트 패턴과의 상관관계 분석
             correlation = cv2.matchTemplate(gray, test_pattern, cv2.TM_CCOEFF_NORMED)
-            response_quality = np.max(correlation)
+            response_quality = float(np.max(correlation))
         else:
             response_quality = None
         
         return {
-            'histogram': hist.flatten().tolist(),
-            'mean_intensity': float(np.mean(pixel_intensities)),
-            'std_intensity': float(np.std(pixel_intensities)),
-            'min_intensity': int(np.min(pixel_intensities)),
-            'max_intensity': int(np.max(pixel_intensities)),
+            'histogram': intensity_stats.histogram().astype(np.float32).tolist(),
+            'mean_intensity': stats['mean'],
+            'std_intensity': stats['std'],
+            'min_intensity': stats['min'],
+            'max_intensity': stats['max'],
+            'median_intensity': stats['median'],
+            'percentiles': stats['percentiles'],
             'response_quality': response_quality,
-            'dynamic_range': int(np.max(pixel_intensities)) - int(np.min(pixel_intensities))
+            'dynamic_range': stats['max'] - stats['min']
         }
     
-    def create_analysis_report(self, image: np.ndarray) -> Dict:
+    def analyze_gamma_response(self, image: np.ndarray, target_gamma: float = 2.2) -> Dict:
+        """
+        감마 / 계조 응답 분석 (계단형 계조 패턴 캡처)
+
+        Args:
+            image: 원근 보정된 계조 패턴 캡처 (BGR)
+            target_gamma: 목표 감마 값
+
+        Returns:
+            감마 및 선형성 분석 결과
+        """
+        from gamma_response import GammaResponseAnalyzer
+        return GammaResponseAnalyzer(target_gamma=target_gamma).measure_stepped_pattern(image)
+
+    def quick_inspection(self, image: np.ndarray, dead_threshold: float = 0.1,
+                         min_area: int = 10) -> Dict:
+        """
+        실시간 검사 루프용 빠른 검사 (개수/점수만 계산)
+
+        그레이스케일 변환은 한 번만 수행하고 모든 전체 해상도 중간 결과는
+        작업 버퍼를 재사용하므로, ROI 크기가 커지지 않는 한 프레임마다
+        전체 해상도 배열을 새로 할당하지 않습니다.
+
+        Args:
+            image: ROI 이미지 (BGR)
+            dead_threshold: 데드 픽셀 임계값 (0-1)
+            min_area: 밝은 점 최소 영역 크기
+
+        Returns:
+            'scratches', 'defects', 'uniformity' 딕셔너리
+        """
+        gray = self._to_gray(image)
+
+        # 스크래치 검사
+        scratches = self.detect_scratches(gray)
+
+        # 불량화소 검사 (좌표 목록 없이 개수만)
+        dead_count = cv2.countNonZero(self._dead_pixel_mask(gray, dead_threshold))
+        _, _, stats, _ = self._bright_spot_components(gray)
+        bright_count = int(np.count_nonzero(stats[1:, cv2.CC_STAT_AREA] >= min_area))
+
+        # 색상 균일성 (그리드 셀 평균의 채널별 분산)
+        grid_colors = self._block_means(image, 10).reshape(-1, 3)
+        color_variance = np.var(grid_colors, axis=0)
+
+        return {
+            'scratches': scratches['count'],
+            'defects': dead_count + bright_count,
+            'uniformity': float(1.0 - (np.mean(color_variance) / 255.0))
+        }
+
+    def create_analysis_report(self, image: np.ndarray, include_artifacts: bool = False) -> Dict:
         """
         종합 분석 보고서 생성
         
+        기본적으로 보고서에는 스칼라 값과 요약 정보만 보관하고(JSON 저장 가능),
+        마스크/라벨 같은 대용량 결과는 get_artifacts() 또는 export_artifacts()를
+        호출할 때 다시 계산합니다. 시각화/내보내기까지 할 때는 include_artifacts=True로
+        만든 뒤 compact_report()로 떼어낸 결과를 artifacts=로 넘기면 다시 계산하지 않습니다
+        (분석기는 대용량 결과를 보관하지 않음).
+        
         Args:
             image: 입력 이미지 (BGR)
+            include_artifacts: 대용량 결과(마스크, 라벨, 무라 영상) 포함 여부
         
         Returns:
             종합 분석 결과
@@ -246,7 +554,7 @@ class AdvancedDisplayAnalyzer:
         report = {
             'timestamp': None,  # 호출 시점에서 설정
             'image_info': {
-                'shape': image.shape,
+                'shape': list(image.shape),
                 'dtype': str(image.dtype)
             },
             'dead_pixels': self.detect_dead_pixels(image),
@@ -256,12 +564,108 @@ class AdvancedDisplayAnalyzer:
             'pixel_response': self.analyze_pixel_response(image)
         }
         
+        if not include_artifacts:
+            self.compact_report(report)
+        
         # 전체 품질 점수 계산
         quality_score = self.calculate_quality_score(report)
-        report['overall_quality_score'] = quality_score
+        report['overall_quality_score'] = float(quality_score)
         
         return report
     
+    def compact_report(self, report: Dict) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        보고서에서 대용량 결과를 제거하고 요약 정보만 남김
+        
+        Args:
+            report: include_artifacts=True로 생성한 분석 보고서 (제자리 수정)
+        
+        Returns:
+            제거한 대용량 결과 (visualize_results/export_artifacts의 artifacts=로 전달)
+        """
+        artifacts = {}
+        for section, keys in self.HEAVY_ARTIFACTS.items():
+            artifacts[section] = {key: report[section].pop(key) for key in keys if key in report[section]}
+        
+        dead_pixels = report['dead_pixels']
+        coordinates = dead_pixels['coordinates']
+        dead_pixels['coordinates'] = [
+            (int(x), int(y)) for x, y in coordinates[:self.MAX_REPORT_COORDINATES]
+        ]
+        dead_pixels['coordinates_truncated'] = len(coordinates) > self.MAX_REPORT_COORDINATES
+        
+        # 노이즈가 많은 고해상도 프레임에서도 보고서 크기가 일정하도록 목록 개수 제한 (count는 전체 개수)
+        for section, key in self.REPORT_LISTS.items():
+            items = report[section][key]
+            report[section][key] = items[:self.MAX_REPORT_COORDINATES]
+            report[section][f'{key}_truncated'] = len(items) > self.MAX_REPORT_COORDINATES
+        return artifacts
+    
+    def get_artifacts(self, image: np.ndarray, report: Dict) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        보고서의 대용량 결과 반환 (보고서에 없으면 원본 이미지로 다시 계산)
+        
+        Args:
+            image: 보고서를 생성한 원본 이미지
+            report: 분석 보고서
+        
+        Returns:
+            검사 항목별 대용량 결과 딕셔너리
+        """
+        detectors = {
+            'dead_pixels': lambda: self.detect_dead_pixels(
+                image, report['dead_pixels'].get('threshold', 0.1)),
+            'bright_spots': lambda: self.detect_bright_spots(image),
+            'mura_defects': lambda: self.detect_mura_defects(image),
+        }
+        
+        artifacts = {}
+        for section, keys in self.HEAVY_ARTIFACTS.items():
+            stored = report.get(section, {})
+            if all(key in stored for key in keys):
+                source = stored
+            else:
+                source = detectors[section]()
+            artifacts[section] = {key: source[key] for key in keys}
+        
+        return artifacts
+    
+    def export_artifacts(self, image: np.ndarray, report: Dict, output_dir: str,
+                         prefix: str = "analysis",
+                         artifacts: Optional[Dict[str, Dict[str, np.ndarray]]] = None) -> Dict[str, str]:
+        """
+        대용량 결과를 파일로 내보내기 (마스크는 PNG, 무라 영상은 NPY)
+        
+        Args:
+            image: 보고서를 생성한 원본 이미지
+            report: 분석 보고서
+            output_dir: 저장 디렉토리
+            prefix: 파일명 접두사
+            artifacts: 미리 구한 대용량 결과 (None이면 get_artifacts)
+        
+        Returns:
+            항목별 저장 경로 딕셔너리
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        
+        if artifacts is None:
+            artifacts = self.get_artifacts(image, report)
+        paths = {
+            'dead_pixels_mask': os.path.join(output_dir, f"{prefix}_dead_pixels_mask.png"),
+            'bright_spots_labels': os.path.join(output_dir, f"{prefix}_bright_spots_labels.png"),
+            'mura_mask': os.path.join(output_dir, f"{prefix}_mura_mask.png"),
+            'mura_image': os.path.join(output_dir, f"{prefix}_mura_image.npy"),
+        }
+        
+        cv2.imwrite(paths['dead_pixels_mask'],
+                    artifacts['dead_pixels']['mask'].astype(np.uint8) * 255)
+        cv2.imwrite(paths['bright_spots_labels'],
+                    np.clip(artifacts['bright_spots']['labels'], 0, 65535).astype(np.uint16))
+        cv2.imwrite(paths['mura_mask'], artifacts['mura_defects']['mask'] * 255)
+        np.save(paths['mura_image'], artifacts['mura_defects']['mura_image'])
+        
+        return paths
+    
     def calculate_quality_score(self, report: Dict) -> float:
         """
         전체 품질 점수 계산 (0-100)
@@ -297,61 +701,43 @@ class AdvancedDisplayAnalyzer:
         
         return max(0, score)
     
-    def visualize_results(self, image: np.ndarray, report: Dict, save_path: Optional[str] = None):
+    def visualize_results(self, image: np.ndarray, report: Dict, save_path: Optional[str] = None,
+                          output_size: Tuple[int, int] = (1500, 1000), show: bool = False,
+                          artifacts: Optional[Dict[str, Dict[str, np.ndarray]]] = None) -> np.ndarray:
         """
         분석 결과 시각화
         
+        OpenCV로 6개 패널을 한 이미지에 합성하므로 헤드리스 환경이나
+        작업 스레드에서도 호출할 수 있습니다.
+        
         Args:
             image: 원본 이미지
             report: 분석 보고서
             save_path: 저장 경로 (선택사항)
+            output_size: 합성 이미지 크기 (width, height)
+            show: matplotlib 창으로 표시 여부 (블로킹)
+            artifacts: 미리 구한 대용량 결과 (None이면 get_artifacts)
+        
+        Returns:
+            합성된 결과 이미지 (BGR)
         """
-        fig, axes = plt.subplots(2, 3, figsize=(15, 10))
-        fig.suptitle('디스플레이 분석 결과', fontsize=16)
-        
-        # 원본 이미지
-        axes[0, 0].imshow(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-        axes[0, 0].set_title('원본 이미지')
-        axes[0, 0].axis('off')
-        
-        # 데드 픽셀
-        dead_pixel_mask = report['dead_pixels']['mask']
-        axes[0, 1].imshow(dead_pixel_mask, cmap='hot')
-        axes[0, 1].set_title(f'데드 픽셀 ({report["dead_pixels"]["count"]}개)')
-        axes[0, 1].axis('off')
-        
-        # 밝은 점
-        bright_labels = report['bright_spots']['labels']
-        axes[0, 2].imshow(bright_labels, cmap='viridis')
-        axes[0, 2].set_title(f'밝은 점 ({report["bright_spots"]["count"]}개)')
-        axes[0, 2].axis('off')
-        
-        # 색상 균일성
-        grid_colors = np.array(report['color_uniformity']['grid_colors'])
-        grid_image = grid_colors.reshape(10, 10, 3) / 255.0
-        axes[1, 0].imshow(grid_image)
-        axes[1, 0].set_title(f'색상 균일성 ({report["color_uniformity"]["uniformity_score"]:.2f})')
-        axes[1, 0].axis('off')
-        
-        # 무라 결함
-        mura_mask = report['mura_defects']['mask']
-        axes[1, 1].imshow(mura_mask, cmap='gray')
-        axes[1, 1].set_title(f'무라 결함 ({report["mura_defects"]["count"]}개)')
-        axes[1, 1].axis('off')
-        
-        # 픽셀 응답 히스토그램
-        hist = report['pixel_response']['histogram']
-        axes[1, 2].plot(hist)
-        axes[1, 2].set_title('픽셀 강도 분포')
-        axes[1, 2].set_xlabel('픽셀 강도')
-        axes[1, 2].set_ylabel('빈도')
-        
-        plt.tight_layout()
+        from report_renderer import ReportRenderer
+        
+        renderer = ReportRenderer(output_size)
+        if artifacts is None:
+            artifacts = self.get_artifacts(image, report)
+        canvas = renderer.render(image, report, artifacts)
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            renderer.save(canvas, save_path)
+        
+        if show:
+            plt.figure(figsize=(output_size[0] / 100, output_size[1] / 100))
+            plt.imshow(cv2.cvtColor(canvas, cv2.COLOR_BGR2RGB))
+            plt.axis('off')
+            plt.show()
         
-        plt.show()
+        return canvas
 
 # 사용 예제
 if __name__ == "__main__":
@@ -368,6 +754,6 @@ if __name__ == "__main__":
         print(f"무라 결함: {report['mura_defects']['count']}개")
         
         # 결과 시각화
-        analyzer.visualize_results(test_image, report)
+        analyzer.visualize_results(test_image, report, show=True)
     else:
         print("테스트 이미지를 찾을 수 없습니다.")
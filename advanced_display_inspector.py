@@ -31,6 +31,7 @@ class AdvancedDisplayInspector:
         self.inspection_thread = None
         self.display_area = None
         self.test_pattern = None
+        self.analyzer = None  # 검사 루프에서 재사용하는 분석기 (작업 버퍼 보유)
         self.setup_ui()
         
     def setup_ui(self):
@@ -771,25 +772,13 @@ F급 (60점 미만): 데드픽셀 11개 이상, 핫픽셀 11개 이상"""
     def quick_inspection(self, roi_image):
         """빠른 검사 실행"""
         try:
-            from advanced_analysis import AdvancedDisplayAnalyzer
-            analyzer = AdvancedDisplayAnalyzer()
-            
-            results = {}
-            
-            # 스크래치 검사
-            scratches = analyzer.detect_scratches(roi_image)
-            results['scratches'] = scratches['count']
-            
-            # 불량화소 검사
-            dead_pixels = analyzer.detect_dead_pixels(roi_image)
-            bright_spots = analyzer.detect_bright_spots(roi_image)
-            results['defects'] = dead_pixels['count'] + bright_spots['count']
-            
-            # 색상 균일성
-            color_uniformity = analyzer.analyze_color_uniformity(roi_image)
-            results['uniformity'] = color_uniformity['uniformity_score']
+            # 분석기는 한 번만 생성하여 작업 버퍼를 프레임 간에 재사용
+            if self.analyzer is None:
+                from advanced_analysis import AdvancedDisplayAnalyzer
+                self.analyzer = AdvancedDisplayAnalyzer()
             
-            return results
+            # 스크래치 / 불량화소 / 색상 균일성 검사
+            return self.analyzer.quick_inspection(roi_image)
             
         except Exception as e:
             self.log_result(f"빠른 검사 오류: {str(e)}")
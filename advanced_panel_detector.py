@@ -8,7 +8,7 @@ Advanced Panel Detection and Calibration System
 import cv2
 import numpy as np
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from PIL import Image, ImageTk
 import threading
 import time
@@ -16,6 +16,9 @@ from datetime import datetime
 import json
 import os
 
+from fixture_lock import FixtureLock
+from frame_source import open_capture
+
 class AdvancedPanelDetector:
     """고급 패널 감지 시스템"""
     
@@ -25,6 +28,7 @@ class AdvancedPanelDetector:
         self.current_frame = None
         self.panel_contour = None
         self.calibration_data = None
+        self.fixture_lock = FixtureLock(self.detect_panel_contour)  # 고정 지그 모드 잠금
         self.setup_ui()
         
     def setup_ui(self):
@@ -61,6 +65,11 @@ class AdvancedPanelDetector:
         ttk.Button(calib_frame, text="캘리브레이션 로드", 
                   command=self.load_calibration).pack(side=tk.LEFT, padx=2)
         
+        # 고정 지그 모드: 저장된 패널 위치 사용, 패널이 움직였을 때만 재감지
+        self.fixture_lock_enabled = tk.BooleanVar(value=False)
+        ttk.Checkbutton(calib_frame, text="고정 지그 모드",
+                       variable=self.fixture_lock_enabled).pack(side=tk.LEFT, padx=5)
+        
         # 검사 제어
         inspect_frame = ttk.Frame(control_frame)
         inspect_frame.pack(side=tk.LEFT, padx=20)
@@ -126,7 +135,7 @@ class AdvancedPanelDetector:
     def start_camera(self):
         """카메라 시작"""
         try:
-            self.camera = cv2.VideoCapture(0)
+            self.camera = open_capture()
             if not self.camera.isOpened():
                 messagebox.showerror("오류", "카메라를 열 수 없습니다.")
                 return
@@ -162,6 +171,8 @@ class AdvancedPanelDetector:
                 ret, frame = self.camera.read()
                 if ret:
                     self.current_frame = frame.copy()
+                    if self.fixture_lock_enabled.get() and self.panel_contour is not None:
+                        self.check_fixture_lock(frame)
                     self.update_camera_display(frame)
                 time.sleep(0.03)  # 30 FPS
             except Exception as e:
@@ -243,6 +254,7 @@ class AdvancedPanelDetector:
             
             if panel_contour is not None:
                 self.panel_contour = panel_contour
+                self.fixture_lock.lock(self.current_frame, panel_contour)
                 self.update_panel_info()
                 self.log_result("패널이 성공적으로 감지되었습니다.")
             else:
@@ -363,7 +375,8 @@ class AdvancedPanelDetector:
         """검사 루프"""
         while self.inspection_running and self.camera_running:
             try:
-                if self.current_frame is not None and self.panel_contour is not None:
+                fixture_flagged = self.fixture_lock_enabled.get() and self.fixture_lock.flagged
+                if self.current_frame is not None and self.panel_contour is not None and not fixture_flagged:
                     # 패널 영역 추출
                     panel_region = self.extract_panel_region(self.current_frame, self.panel_contour)
                     
@@ -378,6 +391,26 @@ class AdvancedPanelDetector:
                 self.log_result(f"검사 루프 오류: {str(e)}")
                 break
     
+    def check_fixture_lock(self, frame):
+        """고정 지그 모드: 경계 픽셀 시그니처만 확인하고, 패널이 움직였으면 다시 감지"""
+        redetections = self.fixture_lock.redetections
+        was_flagged = self.fixture_lock.flagged
+        contour = self.fixture_lock.update(frame)
+        if self.fixture_lock.flagged:
+            # 저장된 윤곽선은 유지 (잠금 해제 없음), 이 상태의 프레임은 검사하지 않음
+            if not was_flagged:
+                self.log_result("지그 경계가 저장된 상태와 다르고 다시 감지하지 못했습니다. 저장된 패널 위치를 유지합니다.")
+            return
+        if self.fixture_lock.redetections == redetections:
+            return
+        
+        self.panel_contour = contour
+        if contour is not None:
+            self.update_panel_info()
+            self.log_result("패널 위치 변경이 감지되어 다시 감지했습니다.")
+        else:
+            self.log_result("패널 위치가 변경되었으나 다시 감지하지 못했습니다.")
+    
     def extract_panel_region(self, frame, contour):
         """패널 영역 추출"""
         try:
@@ -610,6 +643,7 @@ class AdvancedPanelDetector:
         try:
             calibration_data = {
                 'panel_contour': self.panel_contour.tolist(),
+                'fixture_signature': self.fixture_lock.to_dict(),
                 'timestamp': datetime.now().isoformat()
             }
             
@@ -641,6 +675,7 @@ class AdvancedPanelDetector:
                     calibration_data = json.load(f)
                 
                 self.panel_contour = np.array(calibration_data['panel_contour'], dtype=np.int32)
+                self.fixture_lock.load(self.panel_contour, calibration_data.get('fixture_signature'))
                 self.update_panel_info()
                 self.log_result(f"캘리브레이션이 로드되었습니다: {file_path}")
                 
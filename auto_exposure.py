@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+하드웨어 자동 노출 모듈
+Closed-Loop Hardware Auto-Exposure Module
+
+서브샘플링한 프레임 히스토그램의 백분위 밝기가 목표값이 되도록
+CAP_PROP_EXPOSURE/CAP_PROP_GAIN을 몇 프레임에 걸쳐 조정
+(소프트웨어 밝기 스케일링과 달리 프레임마다 추가 연산이 없고 다이내믹 레인지를 보존)
+"""
+
+import math
+import cv2
+import numpy as np
+from typing import Tuple
+
+
+DEFAULT_TARGET = 128.0  # 기본 목표 밝기 (중앙값)
+
+
+def brightness_target(scale: float, base: float = DEFAULT_TARGET) -> float:
+    """밝기 슬라이더 배율(1.0 = 기본 목표)을 목표 밝기로 변환 (16~240으로 제한)"""
+    return float(np.clip(base * scale, 16.0, 240.0))
+
+
+class AutoExposureController:
+    """백분위 밝기 목표 폐루프 노출/게인 제어 클래스"""
+
+    def __init__(self, cap, target: float = DEFAULT_TARGET, percentile: float = 0.5,
+                 exposure_range: Tuple[float, float] = (-13.0, 0.0), exposure_scale: str = 'log2',
+                 gain_range: Tuple[float, float] = (0.0, 100.0), gain_per_stop: float = 8.0,
+                 damping: float = 0.7, deadband: float = 0.15, settle_frames: int = 3, subsample: int = 8):
+        """
+        자동 노출 제어기 초기화
+
+        Args:
+            cap: 노출/게인을 설정할 캡처 장치 (cv2.VideoCapture 호환 get/set)
+            target: 목표 밝기 (0~255)
+            percentile: 목표를 맞출 히스토그램 백분위 (0.5=중앙값, 0.98=하이라이트 기준)
+            exposure_range: CAP_PROP_EXPOSURE 허용 범위
+            exposure_scale: 노출값 단위 ('log2': DirectShow식 2의 지수, 'linear': V4L2식 시간 단위)
+            gain_range: CAP_PROP_GAIN 허용 범위
+            gain_per_stop: 1스톱(밝기 2배)에 해당하는 게인 증가량
+            damping: 한 번에 보정할 오차 비율 (진동 방지)
+            deadband: 조정하지 않는 오차 범위 (스톱)
+            settle_frames: 설정 변경 후 측정 전에 기다릴 프레임 수 (드라이버 반영 지연)
+            subsample: 히스토그램 계산 시 가로/세로 샘플 간격
+        """
+        if exposure_scale not in ('log2', 'linear'):
+            raise ValueError(f"지원하지 않는 노출 단위: {exposure_scale}")
+        self.cap = cap
+        self.target = target
+        self.percentile = percentile
+        self.exposure_range = exposure_range
+        self.exposure_scale = exposure_scale
+        self.gain_range = gain_range
+        self.gain_per_stop = gain_per_stop
+        self.damping = damping
+        self.deadband = deadband
+        self.settle_frames = settle_frames
+        self.subsample = subsample
+        self.reset()
+
+    def reset(self):
+        """현재 장치 설정에서 다시 수렴 시작"""
+        self.exposure = float(np.clip(self.cap.get(cv2.CAP_PROP_EXPOSURE), *self.exposure_range))
+        self.gain = float(np.clip(self.cap.get(cv2.CAP_PROP_GAIN), *self.gain_range))
+        self.supported = True  # 장치가 노출 설정을 거부하면 False
+        self.converged = False
+        self.saturated = False  # 노출/게인이 모두 한계에 도달
+        self.frames_since_change = self.settle_frames
+        self.adjustments = 0
+        self.level = None  # 마지막 측정 백분위 밝기
+
+    def measure(self, frame: np.ndarray) -> float:
+        """서브샘플링한 그레이 히스토그램의 백분위 밝기"""
+        sample = np.ascontiguousarray(frame[::self.subsample, ::self.subsample])
+        if sample.ndim == 3:
+            sample = cv2.cvtColor(sample, cv2.COLOR_BGR2GRAY)
+        cumulative = np.cumsum(np.bincount(sample.ravel(), minlength=256))
+        return float(np.searchsorted(cumulative, self.percentile * cumulative[-1]))
+
+    def update(self, frame: np.ndarray) -> bool:
+        """
+        새 프레임으로 노출/게인 조정 (설정 반영 대기 중이거나 목표 범위 안이면 조정 없음)
+
+        Args:
+            frame: 캡처된 BGR 프레임
+
+        Returns:
+            bool: 장치 설정 변경 여부
+        """
+        if not self.supported:
+            return False
+        self.frames_since_change += 1
+        if self.frames_since_change <= self.settle_frames:
+            return False
+
+        self.level = self.measure(frame)
+        if self.level >= 254:
+            stops = -1.0  # 포화: 실제 밝기를 알 수 없으므로 1스톱씩 감소
+        else:
+            stops = math.log2(self.target / max(self.level, 1.0))
+        if abs(stops) < self.deadband:
+            self.converged = True
+            return False
+
+        self.converged = False
+        return self._apply(float(np.clip(stops * self.damping, -2.0, 2.0)))
+
+    def _apply(self, stops: float) -> bool:
+        """밝게는 노출 → 게인 순, 어둡게는 게인 → 노출 순으로 stops만큼 조정"""
+        exposure_stops = self._to_stops(self.exposure)
+        low, high = (self._to_stops(v) for v in self.exposure_range)
+        gain = self.gain
+        if stops > 0:
+            new_stops = min(exposure_stops + stops, high)
+            gain += (stops - (new_stops - exposure_stops)) * self.gain_per_stop
+        else:
+            gain_available = (gain - self.gain_range[0]) / self.gain_per_stop
+            gain_used = max(stops, -gain_available)
+            gain += gain_used * self.gain_per_stop
+            new_stops = max(exposure_stops + stops - gain_used, low)
+        gain = float(np.clip(gain, *self.gain_range))
+        exposure = self._from_stops(new_stops)
+
+        if abs(exposure - self.exposure) < 1e-6 and abs(gain - self.gain) < 1e-6:
+            self.saturated = True
+            return False
+        self.saturated = False
+        if exposure != self.exposure and not self.cap.set(cv2.CAP_PROP_EXPOSURE, exposure):
+            print("자동 노출 오류: 장치가 노출 설정을 지원하지 않습니다.")
+            self.supported = False
+            return False
+        if gain != self.gain:
+            self.cap.set(cv2.CAP_PROP_GAIN, gain)
+        self.exposure, self.gain = exposure, gain
+        self.frames_since_change = 0
+        self.adjustments += 1
+        return True
+
+    def _to_stops(self, value: float) -> float:
+        if self.exposure_scale == 'log2':
+            return value
+        return math.log2(max(value, 1e-6))
+
+    def _from_stops(self, stops: float) -> float:
+        if self.exposure_scale == 'log2':
+            return stops
+        return 2.0 ** stops
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다중 카메라 동기 캡처 모듈
+Synchronized Multi-Camera Capture Module
+
+대형 패널을 여러 카메라가 타일로 나누어 촬영할 때, 카메라별 캡처 스레드의 프레임을
+타임스탬프 허용 오차 안에서 짝지어 동기 프레임 세트를 만들고, 보정된 호모그래피로
+하나의 패널 캔버스에 합성 (CameraArray 자체가 FrameSource라 기존 검사 파이프라인에 그대로 연결)
+"""
+
+import time
+import cv2
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+from camera_module import CameraModule
+from frame_pool import PooledFrame
+from frame_source import FrameSource
+
+
+@dataclass
+class FrameSet:
+    """동기화된 카메라별 프레임 세트 (버퍼는 release로 반납)"""
+    frames: List[np.ndarray]
+    timestamps: List[float]
+    seqs: List[int]
+    buffers: List[PooledFrame] = field(default_factory=list, repr=False)
+
+    @property
+    def timestamp(self) -> float:
+        """세트 기준 시각 (카메라 시각 평균)"""
+        return float(np.mean(self.timestamps))
+
+    @property
+    def skew(self) -> float:
+        """카메라 간 최대 시각 차이 (초)"""
+        return float(max(self.timestamps) - min(self.timestamps))
+
+    def release(self):
+        """빌려온 캡처 버퍼 반납"""
+        for buffer in self.buffers:
+            buffer.release()
+        self.buffers = []
+
+    def __enter__(self) -> 'FrameSet':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class CameraArray(FrameSource):
+    """타임스탬프 동기화 + 호모그래피 합성 다중 카메라 클래스"""
+
+    def __init__(self, cameras: Sequence[CameraModule], tolerance: float = 0.010,
+                 homographies: Optional[Sequence[np.ndarray]] = None,
+                 canvas_size: Optional[Tuple[int, int]] = None, max_workers: Optional[int] = None):
+        """
+        카메라 배열 초기화
+
+        Args:
+            cameras: 카메라 목록 (각자 캡처 스레드 사용, 링 버퍼가 있으면 더 정확히 짝지음)
+            tolerance: 같은 세트로 인정할 최대 타임스탬프 차이 (초)
+            homographies: 카메라 프레임 → 패널 캔버스 호모그래피 (보정 결과, 카메라 순서)
+            canvas_size: 합성 패널 캔버스 크기 (width, height)
+            max_workers: 합성 병렬 스레드 수 (None이면 카메라 수)
+        """
+        self.cameras = list(cameras)
+        self.tolerance = tolerance
+        self.canvas_size = canvas_size
+        self.homographies = None
+        self.maps = []  # 카메라별 (캔버스 ROI, map1, map2, 유효 마스크)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or len(self.cameras),
+                                           thread_name_prefix="camera_array")
+        self.last_seqs = [0] * len(self.cameras)
+        self.timestamp = None
+        self.frame_sets = 0  # 전달한 동기 세트 수
+        self.dropped_sets = 0  # 허용 오차 안에서 짝을 찾지 못해 건너뛴 시도 수
+        if homographies is not None and canvas_size is not None:
+            self.set_homographies(homographies, canvas_size)
+
+    def connect(self) -> bool:
+        """모든 카메라 연결 (각 카메라의 캡처 스레드 시작)"""
+        connected = [camera.connect() for camera in self.cameras]
+        if not all(connected):
+            print(f"카메라 배열 연결 실패: {connected}")
+            self.disconnect()
+            return False
+        self.last_seqs = [0] * len(self.cameras)
+        return True
+
+    def disconnect(self):
+        """모든 카메라 연결 해제"""
+        for camera in self.cameras:
+            camera.disconnect()
+
+    def is_connected(self) -> bool:
+        return bool(self.cameras) and all(camera.is_connected() for camera in self.cameras)
+
+    def shutdown(self):
+        """연결 해제 및 합성 작업 풀 종료"""
+        self.disconnect()
+        self.executor.shutdown(wait=True)
+
+    def set_homographies(self, homographies: Sequence[np.ndarray], canvas_size: Tuple[int, int]):
+        """
+        카메라별 호모그래피 설정 및 합성 remap 맵 생성 (보정 시 한 번만)
+
+        Args:
+            homographies: 카메라 프레임 → 패널 캔버스 호모그래피 (카메라 순서)
+            canvas_size: 패널 캔버스 크기 (width, height)
+        """
+        if len(homographies) != len(self.cameras):
+            raise ValueError("호모그래피 수가 카메라 수와 다릅니다.")
+        self.homographies = [np.asarray(h, dtype=np.float64) for h in homographies]
+        self.canvas_size = tuple(canvas_size)
+        self.maps = []
+
+    def get_frame_set(self, timeout: float = 1.0) -> Optional[FrameSet]:
+        """
+        동기 프레임 세트 가져오기 (이전 세트 이후의 새 프레임, 사용 후 release)
+
+        가장 늦은 카메라의 최신 프레임 시각을 기준으로 각 카메라에서 가장 가까운
+        프레임을 고르고, 모두 허용 오차 안이면 세트로 반환합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            FrameSet 또는 None (시간 초과)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            recent = [self._borrow_recent(camera) for camera in self.cameras]
+            try:
+                frame_set = self._match(recent)
+            finally:
+                for entries in recent:
+                    for _, _, buffer in entries:
+                        buffer.release()
+            if frame_set is not None:
+                self.frame_sets += 1
+                return frame_set
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # 가장 뒤처진 카메라의 다음 프레임을 기다렸다가 다시 짝짓기
+            lagging = self._lagging_camera(recent)
+            borrowed = self.cameras[lagging].borrow_frame(self.cameras[lagging].frame_seq, remaining)
+            if borrowed is not None:
+                borrowed[0].release()
+
+    def stitch(self, frame_set: FrameSet, dst: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        프레임 세트를 패널 캔버스로 합성 (카메라별 ROI remap을 병렬 실행)
+
+        겹치는 영역은 카메라 순서가 앞선 쪽이 우선합니다.
+
+        Args:
+            frame_set: 동기 프레임 세트
+            dst: 결과를 쓸 재사용 캔버스 버퍼
+
+        Returns:
+            합성된 패널 캔버스 또는 None (호모그래피 미설정)
+        """
+        if self.homographies is None:
+            return None
+        if not self.maps:
+            self._build_maps(frame_set.frames)
+
+        width, height = self.canvas_size
+        channels = frame_set.frames[0].shape[2:] if frame_set.frames[0].ndim == 3 else ()
+        shape = (height, width) + tuple(channels)
+        if dst is None or dst.shape != shape or dst.dtype != frame_set.frames[0].dtype:
+            dst = np.zeros(shape, dtype=frame_set.frames[0].dtype)
+
+        tiles = list(self.executor.map(self._warp_tile, frame_set.frames, self.maps))
+        for (roi, _, _, mask), tile in reversed(list(zip(self.maps, tiles))):
+            if roi is None:
+                continue
+            x0, y0, x1, y1 = roi
+            cv2.copyTo(tile, mask, dst[y0:y1, x0:x1])
+        return dst
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """FrameSource 인터페이스: 다음 동기 세트를 합성한 패널 캔버스"""
+        frame_set = self.get_frame_set()
+        if frame_set is None:
+            return False, None
+        with frame_set:
+            canvas = self.stitch(frame_set, image)
+        if canvas is None:
+            return False, None
+        self.timestamp = frame_set.timestamp
+        return True, canvas
+
+    def _borrow_recent(self, camera: CameraModule) -> List[Tuple[int, float, PooledFrame]]:
+        """카메라의 최근 프레임 (링 버퍼가 없으면 최신 프레임 하나)"""
+        recent = camera.borrow_recent_frames()
+        if recent:
+            return recent
+        borrowed = camera.borrow_frame()
+        if borrowed is None:
+            return []
+        buffer, seq, timestamp = borrowed
+        return [(seq, timestamp, buffer)]
+
+    def _match(self, recent: List[List[Tuple[int, float, PooledFrame]]]) -> Optional[FrameSet]:
+        """최근 프레임들에서 허용 오차 안의 새 동기 세트 찾기"""
+        if not all(recent):
+            return None
+        reference = min(entries[-1][1] for entries in recent)
+        picks = [min(entries, key=lambda entry: abs(entry[1] - reference)) for entries in recent]
+        if any(abs(timestamp - reference) > self.tolerance for _, timestamp, _ in picks):
+            self.dropped_sets += 1
+            return None
+        if any(seq <= last for (seq, _, _), last in zip(picks, self.last_seqs)):
+            return None
+
+        self.last_seqs = [seq for seq, _, _ in picks]
+        return FrameSet(frames=[buffer.array for _, _, buffer in picks],
+                        timestamps=[timestamp for _, timestamp, _ in picks],
+                        seqs=list(self.last_seqs),
+                        buffers=[buffer.retain() for _, _, buffer in picks])
+
+    def _lagging_camera(self, recent: List[List[Tuple[int, float, PooledFrame]]]) -> int:
+        """최신 프레임 시각이 가장 늦은 (또는 프레임이 없는) 카메라 번호"""
+        latest = [entries[-1][1] if entries else -np.inf for entries in recent]
+        return int(np.argmin(latest))
+
+    def _build_maps(self, frames: List[np.ndarray]):
+        """카메라별 캔버스 ROI와 역호모그래피 remap 맵 생성"""
+        width, height = self.canvas_size
+        self.maps = []
+        for frame, homography in zip(frames, self.homographies):
+            frame_h, frame_w = frame.shape[:2]
+            outline = np.float32([[0, 0], [frame_w, 0], [frame_w, frame_h], [0, frame_h]]) - 0.5
+            projected = cv2.perspectiveTransform(outline.reshape(-1, 1, 2), homography).reshape(-1, 2)
+            x0, y0 = np.maximum(np.floor(projected.min(axis=0)).astype(int), 0)
+            x1 = min(int(np.ceil(projected[:, 0].max())) + 1, width)
+            y1 = min(int(np.ceil(projected[:, 1].max())) + 1, height)
+            if x1 <= x0 or y1 <= y0:
+                self.maps.append((None, None, None, None))
+                continue
+
+            # 캔버스 ROI 픽셀 → 카메라 프레임 좌표
+            xs, ys = np.meshgrid(np.arange(x0, x1, dtype=np.float32), np.arange(y0, y1, dtype=np.float32))
+            points = np.stack([xs, ys], axis=-1).reshape(-1, 1, 2)
+            source = cv2.perspectiveTransform(points, np.linalg.inv(homography)).reshape(y1 - y0, x1 - x0, 2)
+            map_x, map_y = source[..., 0], source[..., 1]
+            mask = ((map_x >= -0.5) & (map_x <= frame_w - 0.5) &
+                    (map_y >= -0.5) & (map_y <= frame_h - 0.5)).astype(np.uint8)
+            map1, map2 = cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+            self.maps.append(((x0, y0, x1, y1), map1, map2, mask))
+
+    @staticmethod
+    def _warp_tile(frame: np.ndarray, tile_map) -> Optional[np.ndarray]:
+        """카메라 프레임을 캔버스 ROI로 remap"""
+        roi, map1, map2, _ = tile_map
+        if roi is None:
+            return None
+        return cv2.remap(frame, map1, map2, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
@@ -5,27 +5,84 @@
 Camera Module
 
 USB 카메라 연결 및 실시간 영상 캡처
+(백그라운드 캡처 스레드가 최신 프레임 슬롯을 계속 갱신하여 get_frame은 블로킹 없이 반환,
+ 캡처 버퍼는 FramePool에서 재사용하여 정상 상태에서는 프레임당 메모리 할당 없음,
+ CaptureTelemetry로 실효 fps/드롭 프레임/read·변환 지연 시간 집계,
+ 선택적으로 AutoExposureController가 하드웨어 노출/게인을 목표 밝기로 폐루프 제어,
+ 재생 소스는 소비자가 가져간 뒤에만 다음 프레임을 읽고 끝에 도달하면 캡처 스레드 종료)
 """
 
+import threading
+import time
+from collections import deque
 import cv2
 import numpy as np
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
+from auto_exposure import DEFAULT_TARGET, AutoExposureController
+from capture_format import FormatCache, apply_format, fourcc_to_str, negotiate_format
+from capture_telemetry import CaptureTelemetry
+from frame_pool import FramePool, PooledFrame
+from frame_source import FrameSource, ReplaySource, default_source, open_capture
+from panel_geometry import (DEFAULT_CALIBRATION_FILE, calibrate_chessboard, find_chessboard,
+                            load_calibration, save_calibration)
 
-class CameraModule:
-    def __init__(self, camera_index: int = 0):
+
+class CameraModule(FrameSource):
+    def __init__(self, camera_index: int = 0, threaded: bool = True, ring_size: int = 0,
+                 source=None, negotiate: bool = True, format_cache: Optional[FormatCache] = None,
+                 calibration_file: Optional[str] = DEFAULT_CALIBRATION_FILE, lossless: Optional[bool] = None):
         """
         카메라 모듈 초기화
         
         Args:
             camera_index: 카메라 인덱스 (기본값: 0)
+            threaded: 백그라운드 캡처 스레드 사용 여부 (False면 get_frame에서 직접 read)
+            ring_size: 최근 프레임 보관 개수 (0이면 최신 프레임만 보관)
+            source: 카메라 대신 사용할 프레임 소스 (재생 경로 또는 FrameSource,
+                    None이면 FRAME_SOURCE 환경 변수, 없으면 camera_index 카메라)
+            negotiate: 연결 시 FOURCC/fps 협상 여부 (카메라 장치만, 결과는 장치별 캐시)
+            format_cache: 포맷 협상 결과 캐시 (None이면 기본 파일)
+            calibration_file: 카메라 보정 결과 저장 파일 (생성 시 로드, 보정 성공 시 저장, None이면 저장 안 함)
+            lossless: 캡처 스레드가 이전 프레임을 소비자가 가져간 뒤에만 다음 프레임을 읽음
+                      (None이면 재생 소스일 때만, 실행할 때마다 같은 프레임 순서 보장)
         """
         self.camera_index = camera_index
+        self.source = source
+        self.read_seq = 0  # read()로 마지막에 반환한 프레임 순번
         self.cap = None
         self.is_connected_flag = False
         self.current_frame = None
         self.resolution = (1920, 1080)
         self.fps = 30
+        self.calibration_file = calibration_file
+        self.calibration = load_calibration(calibration_file) if calibration_file else None  # 카메라 보정 결과
+        self.negotiate = negotiate
+        self.format_cache = format_cache or FormatCache()
+        self.capture_format = None  # 협상된 캡처 포맷 (fourcc, fps, measured_fps, decode_ms)
+        
+        # 백그라운드 캡처 (최신 프레임 슬롯 + 선택적 링 버퍼)
+        self.threaded = threaded
+        self.lossless = lossless
+        self.lossless_capture = False  # 연결된 소스에 적용된 lossless 여부
+        self.capture_thread = None
+        self.capture_running = False
+        self.frame_condition = threading.Condition()
+        self.frame_seq = 0  # 캡처된 프레임 순번 (1부터 증가)
+        self.consumed_seq = 0  # 소비자가 가져간 최신 프레임 순번 (lossless 캡처 대기 기준)
+        self.eof = False  # 재생 소스가 끝에 도달하여 캡처 스레드 종료
+        self.frame_timestamp = None  # 최신 프레임 캡처 시각 (time.monotonic)
+        self.frame_ring = deque() if ring_size > 0 else None
+        self.ring_size = ring_size
+        self.latest_buffer = None  # 최신 프레임 슬롯 (PooledFrame)
+        self.frame_pool = None  # 캡처 버퍼 풀 (첫 프레임 크기로 생성)
+        self.telemetry = CaptureTelemetry()  # 캡처 통계 (get_camera_info의 'telemetry')
+        self.auto_exposure = None  # 하드웨어 자동 노출 제어기 (enable_auto_exposure)
+        
+        # 포맷 협상 (측정 중에는 device_lock으로 다른 스레드의 장치 read를 막음)
+        self.device_lock = threading.Lock()
+        self.negotiation_thread = None
+        self.negotiation_cancel = threading.Event()
         
     def connect(self) -> bool:
         """
@@ -35,12 +92,13 @@ class CameraModule:
             bool: 연결 성공 여부
         """
         try:
-            self.cap = cv2.VideoCapture(self.camera_index)
+            source = self.source if self.source is not None else default_source(self.camera_index)
+            self.cap = open_capture(source)
             
             if not self.cap.isOpened():
                 return False
                 
-            # 카메라 설정
+            # 카메라 설정 (요청 포맷으로 시작, 카메라 장치의 FOURCC/fps 협상은 연결 후 진행)
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
             self.cap.set(cv2.CAP_PROP_FPS, self.fps)
@@ -52,15 +110,211 @@ class CameraModule:
             # 자동 초점 설정
             self.cap.set(cv2.CAP_PROP_AUTOFOCUS, 0)  # 수동 초점
             
+            self.telemetry.reset(self.cap.get(cv2.CAP_PROP_FPS) or self.fps)
+            self.lossless_capture = (self.lossless if self.lossless is not None
+                                     else isinstance(self.cap, ReplaySource))
             self.is_connected_flag = True
+            if self.threaded:
+                self.start_capture()
+                
+            # 캐시된 협상 결과는 바로 적용, 없으면 작업 스레드에서 측정 (GUI 스레드를 막지 않음)
+            if self.negotiate and isinstance(self.cap, cv2.VideoCapture):
+                self.negotiate_format(background=True)
             return True
             
         except Exception as e:
             print(f"카메라 연결 오류: {e}")
             return False
             
+    def negotiate_format(self, force: bool = False, background: bool = False) -> Optional[dict]:
+        """
+        요청 해상도에서 처리량이 가장 높은 FOURCC/fps 조합 선택 및 적용
+        
+        장치별 캐시에 결과가 있으면 측정 없이 바로 적용합니다.
+        측정 중에는 device_lock으로 캡처 스레드의 read를 막고, 선택에 성공한 결과만 캐시합니다.
+        
+        Args:
+            force: 캐시를 무시하고 다시 측정
+            background: 측정이 필요하면 작업 스레드에서 진행하고 바로 반환
+                        (측정 동안은 요청 포맷으로 캡처, 결과는 capture_format)
+            
+        Returns:
+            dict: 선택된 포맷 (fourcc, fps, measured_fps, decode_ms) 또는 None (협상 실패/측정 진행 중)
+        """
+        width, height = self.resolution
+        key = FormatCache.device_key(self.cap, self.camera_index, width, height, self.fps)
+        negotiation = None if force else self.format_cache.get(key)
+        if negotiation is not None:
+            with self.device_lock:
+                return self._apply_negotiation(negotiation)
+                
+        if background:
+            if self.negotiation_thread is None or not self.negotiation_thread.is_alive():
+                self.negotiation_cancel.clear()
+                self.negotiation_thread = threading.Thread(target=self._run_negotiation, args=(key,),
+                                                           daemon=True, name="format_negotiation")
+                self.negotiation_thread.start()
+            return None
+        return self._run_negotiation(key)
+        
+    def _run_negotiation(self, key: str) -> Optional[dict]:
+        """FOURCC/fps 측정 → 성공한 선택만 캐시 → 적용 (연결 해제 시 중단)"""
+        width, height = self.resolution
+        with self.device_lock:
+            negotiation = negotiate_format(self.cap, width, height, self.fps, cancel=self.negotiation_cancel)
+            if self.negotiation_cancel.is_set():
+                return None
+            if negotiation['selected'] is not None:
+                self.format_cache.put(key, negotiation)
+            return self._apply_negotiation(negotiation)
+            
+    def _apply_negotiation(self, negotiation: dict) -> Optional[dict]:
+        """협상 결과의 선택 포맷 적용 (선택이 없으면 요청 포맷, device_lock 보유 상태에서 호출)"""
+        width, height = self.resolution
+        self.capture_format = negotiation.get('selected')
+        if self.capture_format is None:
+            print(f"캡처 포맷 협상 실패, 기본 설정 사용: {width}x{height}@{self.fps}")
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+            return None
+            
+        selected = self.capture_format
+        apply_format(self.cap, selected['fourcc'], width, height, selected['fps'])
+        self.telemetry.reset(selected['fps'])
+        print(f"캡처 포맷: {selected['fourcc']} {width}x{height}@{selected['fps']:g} "
+              f"(측정 {selected['measured_fps']:.1f}fps, 디코드 {selected['decode_ms']:.1f}ms/프레임)")
+        return selected
+        
+    def start_capture(self):
+        """백그라운드 캡처 스레드 시작"""
+        if self.capture_running:
+            return
+        self.capture_running = True
+        self.eof = False
+        self.consumed_seq = self.frame_seq
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True,
+                                               name="camera_capture")
+        self.capture_thread.start()
+        
+    def stop_capture(self):
+        """백그라운드 캡처 스레드 중지"""
+        with self.frame_condition:
+            self.capture_running = False
+            self.frame_condition.notify_all()
+        if self.capture_thread is not None:
+            self.capture_thread.join(timeout=2.0)
+            self.capture_thread = None
+            
+    def _capture_loop(self):
+        """캡처 스레드: 드라이버 버퍼가 쌓이지 않도록 계속 읽어 최신 프레임 슬롯 갱신"""
+        while self.capture_running:
+            if self.lossless_capture:
+                # 재생 소스: 소비자가 최신 프레임을 가져갈 때까지 다음 프레임을 읽지 않음
+                with self.frame_condition:
+                    self.frame_condition.wait_for(
+                        lambda: self.consumed_seq >= self.frame_seq or not self.capture_running)
+                if not self.capture_running:
+                    break
+            buffer = self.frame_pool.acquire() if self.frame_pool is not None else None
+            read_start = time.perf_counter()
+            try:
+                with self.device_lock:
+                    if buffer is not None:
+                        ret, frame = self.cap.read(image=buffer.array)
+                    else:
+                        ret, frame = self.cap.read()
+            except Exception as e:
+                print(f"프레임 캡처 오류: {e}")
+                ret, frame = False, None
+            if not ret:
+                if buffer is not None:
+                    buffer.release()
+                if isinstance(self.cap, ReplaySource) and self.cap.eof:
+                    # 재생 끝: 캡처를 멈추고 대기 중인 소비자를 깨움 (read는 (False, None) 반환)
+                    with self.frame_condition:
+                        self.eof = True
+                        self.capture_running = False
+                        self.frame_condition.notify_all()
+                    break
+                time.sleep(0.01)
+                continue
+                
+            if buffer is not None and frame is not buffer.array:
+                if self.frame_pool.matches(frame):
+                    # image= 인자를 무시하고 새 배열을 반환하는 백엔드 → 풀 버퍼로 복사
+                    np.copyto(buffer.array, frame)
+                else:
+                    # 해상도 변경 → 풀 재생성
+                    buffer.release()
+                    buffer = None
+            if buffer is None:
+                # 첫 프레임 또는 해상도 변경
+                self.frame_pool = FramePool(frame.shape, frame.dtype, size=self.ring_size + 4)
+                buffer = self.frame_pool.acquire()
+                np.copyto(buffer.array, frame)
+                
+            timestamp = self._frame_time()
+            self.telemetry.record_frame(time.monotonic(), (time.perf_counter() - read_start) * 1000)
+            auto_exposure = self.auto_exposure
+            if auto_exposure is not None:
+                auto_exposure.update(buffer.array)
+            released = []
+            with self.frame_condition:
+                self.frame_seq += 1
+                self.frame_timestamp = timestamp
+                if self.latest_buffer is not None:
+                    released.append(self.latest_buffer)
+                self.latest_buffer = buffer
+                self.current_frame = buffer.array
+                if self.frame_ring is not None:
+                    self.frame_ring.append((self.frame_seq, timestamp, buffer.retain()))
+                    if len(self.frame_ring) > self.ring_size:
+                        released.append(self.frame_ring.popleft()[2])
+                self.frame_condition.notify_all()
+            for old in released:
+                old.release()
+                
+    def _frame_time(self) -> float:
+        """프레임 시각 (재생 소스는 결정적인 재생 시각, 카메라는 time.monotonic)"""
+        if isinstance(self.cap, FrameSource) and self.cap.timestamp is not None:
+            return self.cap.timestamp
+        return time.monotonic()
+        
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        FrameSource 인터페이스: 이전 read 이후의 새 BGR 프레임 (cv2.VideoCapture.read 호환)
+        
+        Args:
+            image: 결과를 쓸 재사용 버퍼
+            
+        Returns:
+            (성공 여부, 프레임)
+        """
+        if not self.is_connected():
+            return False, None
+        latest = self.wait_for_frame(self.read_seq, dst=image)
+        if latest is None:
+            return False, None
+        frame, self.read_seq, _ = latest
+        return True, frame
+        
     def disconnect(self):
         """카메라 연결 해제"""
+        if self.negotiation_thread is not None:
+            self.negotiation_cancel.set()
+            self.negotiation_thread.join()
+            self.negotiation_thread = None
+        self.stop_capture()
+        with self.frame_condition:
+            if self.latest_buffer is not None:
+                self.latest_buffer.release()
+                self.latest_buffer = None
+                self.current_frame = None
+            if self.frame_ring is not None:
+                for _, _, buffer in self.frame_ring:
+                    buffer.release()
+                self.frame_ring.clear()
         if self.cap is not None:
             self.cap.release()
             self.cap = None
@@ -75,12 +329,14 @@ class CameraModule:
         """
         return self.is_connected_flag and self.cap is not None and self.cap.isOpened()
         
-    def get_frame(self, convert_to_rgb: bool = True) -> Optional[np.ndarray]:
+    def get_frame(self, convert_to_rgb: bool = True,
+                  dst: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         현재 프레임 가져오기
         
         Args:
             convert_to_rgb: BGR을 RGB로 변환할지 여부
+            dst: 결과를 쓸 재사용 버퍼 (크기가 맞으면 새로 할당하지 않음)
             
         Returns:
             np.ndarray: 현재 프레임 (RGB 또는 BGR 형식)
@@ -88,12 +344,31 @@ class CameraModule:
         if not self.is_connected():
             return None
             
+        if self.capture_running:
+            # 캡처 스레드가 채운 최신 프레임 (첫 프레임이 들어오기 전에만 잠시 대기)
+            latest = self.get_latest(convert_to_rgb, dst)
+            return latest[0] if latest is not None else None
+            
+        if not self.device_lock.acquire(blocking=False):
+            return None  # 포맷 측정 중
         try:
-            ret, frame = self.cap.read()
+            read_start = time.perf_counter()
+            try:
+                ret, frame = self.cap.read()
+            finally:
+                self.device_lock.release()
             if ret:
                 # BGR을 RGB로 변환 (OpenCV는 BGR 형식 사용)
+                self.frame_seq += 1
+                self.frame_timestamp = self._frame_time()
+                self.telemetry.record_frame(time.monotonic(), (time.perf_counter() - read_start) * 1000)
+                self.telemetry.record_consume(self.frame_seq)
+                if self.auto_exposure is not None:
+                    self.auto_exposure.update(frame)
                 if convert_to_rgb:
+                    convert_start = time.perf_counter()
                     frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    self.telemetry.record_convert((time.perf_counter() - convert_start) * 1000)
                 self.current_frame = frame
                 return frame
             else:
@@ -102,6 +377,123 @@ class CameraModule:
             print(f"프레임 캡처 오류: {e}")
             return None
             
+    def get_latest(self, convert_to_rgb: bool = False, dst: Optional[np.ndarray] = None,
+                   timeout: float = 1.0) -> Optional[Tuple[np.ndarray, int, float]]:
+        """
+        최신 프레임과 순번/타임스탬프 (캡처 스레드가 없으면 직접 read)
+        
+        Args:
+            convert_to_rgb: BGR을 RGB로 변환할지 여부
+            dst: 결과를 쓸 재사용 버퍼 (크기가 맞으면 새로 할당하지 않음)
+            timeout: 캡처 스레드의 첫 프레임이 아직 없을 때 최대 대기 시간 (초, 이후에는 대기 없음)
+            
+        Returns:
+            (프레임, 순번, 캡처 시각) 또는 None (시간 안에 프레임 없음)
+        """
+        if not self.capture_running:
+            frame = self.get_frame(convert_to_rgb)
+            return (frame, self.frame_seq, self.frame_timestamp) if frame is not None else None
+            
+        borrowed = self.borrow_frame(self.frame_seq if self.latest_buffer is None else None, timeout)
+        if borrowed is None:
+            return None
+        return self._consume(borrowed, convert_to_rgb, dst)
+            
+    def borrow_frame(self, after_seq: Optional[int] = None,
+                     timeout: float = 1.0) -> Optional[Tuple[PooledFrame, int, float]]:
+        """
+        최신 캡처 버퍼를 복사 없이 빌려오기 (사용 후 반드시 release, 내용 수정 금지)
+        
+        Args:
+            after_seq: 주어지면 이 순번보다 새로운 프레임이 들어올 때까지 대기
+            timeout: 최대 대기 시간 (초)
+            
+        Returns:
+            (BGR 프레임 버퍼, 순번, 캡처 시각) 또는 None (캡처 스레드 미실행/시간 초과)
+        """
+        def ready() -> bool:
+            # after_seq까지의 프레임은 건너뛰므로 소비한 것으로 보고 lossless 캡처를 진행시킴
+            self._mark_consumed(min(after_seq, self.frame_seq))
+            return self.frame_seq > after_seq or not self.capture_running
+            
+        with self.frame_condition:
+            if after_seq is not None:
+                self.frame_condition.wait_for(ready, timeout)
+                if self.frame_seq <= after_seq:
+                    return None
+            if not self.capture_running or self.latest_buffer is None:
+                return None
+            self._mark_consumed(self.frame_seq)
+            return self.latest_buffer.retain(), self.frame_seq, self.frame_timestamp
+        
+    def wait_for_frame(self, after_seq: int, timeout: float = 1.0, convert_to_rgb: bool = False,
+                       dst: Optional[np.ndarray] = None) -> Optional[Tuple[np.ndarray, int, float]]:
+        """
+        순번 after_seq보다 새로운 프레임이 들어올 때까지 대기
+        
+        Args:
+            after_seq: 이미 처리한 프레임 순번
+            timeout: 최대 대기 시간 (초)
+            convert_to_rgb: BGR을 RGB로 변환할지 여부
+            dst: 결과를 쓸 재사용 버퍼 (크기가 맞으면 새로 할당하지 않음)
+            
+        Returns:
+            (프레임, 순번, 캡처 시각) 또는 None (시간 초과/캡처 중지)
+        """
+        if not self.capture_running:
+            return self.get_latest(convert_to_rgb, dst)
+            
+        borrowed = self.borrow_frame(after_seq, timeout)
+        if borrowed is None:
+            return None
+        return self._consume(borrowed, convert_to_rgb, dst)
+        
+    def borrow_recent_frames(self) -> List[Tuple[int, float, PooledFrame]]:
+        """
+        링 버퍼의 최근 프레임을 복사 없이 빌려오기 (오래된 순, 각 버퍼 사용 후 release)
+        
+        Returns:
+            List[Tuple[int, float, PooledFrame]]: (순번, 캡처 시각, BGR 프레임 버퍼) 목록
+        """
+        with self.frame_condition:
+            if self.frame_ring is None:
+                return []
+            if self.frame_ring:
+                self._mark_consumed(self.frame_ring[-1][0])
+            return [(seq, timestamp, buffer.retain()) for seq, timestamp, buffer in self.frame_ring]
+            
+    def _mark_consumed(self, seq: int):
+        """소비한 프레임 순번 기록 (frame_condition 보유 상태에서 호출, lossless 캡처 스레드 재개)"""
+        if seq > self.consumed_seq:
+            self.consumed_seq = seq
+            self.frame_condition.notify_all()
+            
+    def _consume(self, borrowed: Tuple[PooledFrame, int, float], convert_to_rgb: bool,
+                 dst: Optional[np.ndarray]) -> Tuple[np.ndarray, int, float]:
+        """빌려온 버퍼를 호출자 배열로 변환/복사하고 반납 (변환 시간/건너뛴 프레임 집계)"""
+        buffer, seq, timestamp = borrowed
+        try:
+            convert_start = time.perf_counter()
+            frame = self._output_frame(buffer.array, convert_to_rgb, dst)
+            self.telemetry.record_convert((time.perf_counter() - convert_start) * 1000)
+        finally:
+            buffer.release()
+        self.telemetry.record_consume(seq)
+        return frame, seq, timestamp
+        
+    @staticmethod
+    def _output_frame(frame: np.ndarray, convert_to_rgb: bool,
+                      dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """캡처 버퍼를 호출자 소유 배열로 복사/변환 (dst 크기가 맞으면 재사용)"""
+        if dst is not None and (dst.shape != frame.shape or dst.dtype != frame.dtype):
+            dst = None
+        if convert_to_rgb:
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=dst)
+        if dst is None:
+            return frame.copy()
+        np.copyto(dst, frame)
+        return dst
+            
     def set_resolution(self, width: int, height: int) -> bool:
         """
         해상도 설정
@@ -166,6 +558,33 @@ class CameraModule:
             print(f"노출 설정 오류: {e}")
             return False
             
+    def enable_auto_exposure(self, target: float = DEFAULT_TARGET, percentile: float = 0.5,
+                             **options) -> bool:
+        """
+        하드웨어 자동 노출 시작 (캡처되는 프레임으로 노출/게인을 몇 프레임에 걸쳐 조정)
+        
+        Args:
+            target: 목표 밝기 (0~255)
+            percentile: 목표를 맞출 히스토그램 백분위
+            **options: AutoExposureController 옵션 (exposure_range, gain_range 등)
+            
+        Returns:
+            bool: 시작 성공 여부
+        """
+        if not self.is_connected():
+            return False
+            
+        try:
+            self.auto_exposure = AutoExposureController(self.cap, target, percentile, **options)
+            return True
+        except Exception as e:
+            print(f"자동 노출 설정 오류: {e}")
+            return False
+            
+    def disable_auto_exposure(self):
+        """하드웨어 자동 노출 중지 (마지막 노출/게인 유지)"""
+        self.auto_exposure = None
+        
     def set_brightness(self, brightness: float) -> bool:
         """
         밝기 설정
@@ -224,8 +643,18 @@ class CameraModule:
                 'exposure': self.cap.get(cv2.CAP_PROP_EXPOSURE),
                 'brightness': self.cap.get(cv2.CAP_PROP_BRIGHTNESS),
                 'contrast': self.cap.get(cv2.CAP_PROP_CONTRAST),
-                'gain': self.cap.get(cv2.CAP_PROP_GAIN)
+                'gain': self.cap.get(cv2.CAP_PROP_GAIN),
+                'fourcc': fourcc_to_str(self.cap.get(cv2.CAP_PROP_FOURCC))
             }
+            if self.capture_format is not None:
+                info['measured_fps'] = self.capture_format['measured_fps']
+                info['decode_ms'] = self.capture_format['decode_ms']
+            if self.auto_exposure is not None:
+                info['auto_exposure'] = {'target': self.auto_exposure.target,
+                                         'level': self.auto_exposure.level,
+                                         'converged': self.auto_exposure.converged,
+                                         'saturated': self.auto_exposure.saturated}
+            info['telemetry'] = self.telemetry.snapshot()
             return info
         except Exception as e:
             print(f"카메라 정보 가져오기 오류: {e}")
@@ -254,27 +683,53 @@ class CameraModule:
                 return False
         return False
         
-    def calibrate_camera(self) -> dict:
+    def calibrate_camera(self, images: Optional[List[np.ndarray]] = None,
+                         pattern_size: Tuple[int, int] = (9, 6), square_size: float = 1.0,
+                         num_views: int = 15, max_frames: int = 300,
+                         min_interval: float = 0.5) -> dict:
         """
-        카메라 보정
+        체스보드 패턴을 이용한 카메라 보정
+        
+        이미지가 주어지지 않으면 카메라에서 체스보드가 보이는 프레임을
+        num_views장 수집합니다 (프레임 간 최소 간격으로 서로 다른 자세 확보).
         
+        Args:
+            images: 체스보드 이미지 목록 (None이면 카메라에서 수집)
+            pattern_size: 체스보드 내부 코너 수 (가로, 세로)
+            square_size: 체스보드 칸 크기
+            num_views: 수집할 체스보드 이미지 수
+            max_frames: 수집 시 최대 시도 프레임 수
+            min_interval: 수집 이미지 간 최소 간격 (초)
+            
         Returns:
-            dict: 보정 결과
+            dict: 보정 결과 (camera_matrix, distortion_coefficients, rms_error, calibrated)
         """
-        if not self.is_connected():
-            return {}
-            
-        # 체스보드 패턴을 이용한 카메라 보정
-        # 실제 구현에서는 체스보드 이미지들을 캡처하여 보정
+        if images is None:
+            if not self.is_connected():
+                return {}
+                
+            images = []
+            last_capture = 0.0
+            seq = 0
+            for _ in range(max_frames):
+                latest = self.wait_for_frame(seq)
+                if latest is None:
+                    continue
+                frame, seq, _ = latest
+                now = time.monotonic()
+                if now - last_capture < min_interval or find_chessboard(frame, pattern_size) is None:
+                    continue
+                images.append(frame)
+                last_capture = now
+                if len(images) >= num_views:
+                    break
+                    
         try:
-            # 보정 매트릭스와 왜곡 계수 계산
-            # 여기서는 예시로 더미 데이터 반환
-            calibration_result = {
-                'camera_matrix': np.eye(3),
-                'distortion_coefficients': np.zeros(5),
-                'rms_error': 0.0,
-                'calibrated': True
-            }
+            calibration_result = calibrate_chessboard(images, pattern_size, square_size)
+            if calibration_result.get('calibrated'):
+                self.calibration = calibration_result
+                if self.calibration_file:
+                    save_calibration(calibration_result, self.calibration_file)
             return calibration_result
         except Exception as e:
             print(f"카메라 보정 오류: {e}")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+캡처 포맷 협상 모듈
+Capture Format Negotiation Module
+
+요청 해상도에서 FOURCC(MJPG/YUYV)와 fps 조합을 실제로 캡처해 보고
+측정 fps가 가장 높은 조합을 선택 (프레임당 디코드 비용 함께 측정),
+선택에 성공한 결과만 장치별로 캐시하여 다음 연결 시 바로 적용
+"""
+
+import json
+import os
+import threading
+import time
+import cv2
+from typing import Dict, List, Optional, Sequence
+
+
+FORMAT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'display_inspection',
+                                 'camera_formats.json')  # 장치별 협상 결과 캐시
+DEFAULT_FOURCCS = ('MJPG', 'YUYV')
+
+
+def fourcc_to_str(value: float) -> str:
+    """CAP_PROP_FOURCC 값을 4문자 코드로 변환"""
+    code = int(value)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00')
+
+
+def apply_format(cap, fourcc: str, width: int, height: int, fps: float):
+    """캡처 장치에 FOURCC/해상도/fps 설정 (FOURCC를 먼저 설정해야 해상도가 적용되는 드라이버가 많음)"""
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_FPS, fps)
+
+
+def probe_format(cap, fourcc: str, width: int, height: int, fps: float,
+                 frames: int = 30, warmup: int = 5, max_seconds: float = 2.0) -> Optional[Dict]:
+    """
+    포맷 하나를 설정하고 실제 캡처 속도/디코드 비용 측정
+
+    Args:
+        cap: cv2.VideoCapture
+        fourcc: 4문자 코드 ('MJPG', 'YUYV' 등)
+        width: 요청 가로 해상도
+        height: 요청 세로 해상도
+        fps: 요청 fps
+        frames: 측정 프레임 수
+        warmup: 측정 전 버릴 프레임 수 (포맷 전환 직후 버퍼 제거)
+        max_seconds: 조합당 최대 측정 시간
+
+    Returns:
+        측정 결과 딕셔너리 또는 None (장치가 해당 조합을 지원하지 않음)
+    """
+    apply_format(cap, fourcc, width, height, fps)
+    actual = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+    if actual != (width, height) or fourcc_to_str(cap.get(cv2.CAP_PROP_FOURCC)) != fourcc:
+        return None
+
+    for _ in range(warmup):
+        if not cap.read()[0]:
+            return None
+
+    # grab = 전송 대기, retrieve = 디코드/색 변환
+    grab_times, decode_times = [], []
+    start = time.perf_counter()
+    while len(decode_times) < frames and time.perf_counter() - start < max_seconds:
+        t0 = time.perf_counter()
+        if not cap.grab():
+            break
+        t1 = time.perf_counter()
+        ret, _ = cap.retrieve()
+        t2 = time.perf_counter()
+        if not ret:
+            break
+        grab_times.append(t1 - t0)
+        decode_times.append(t2 - t1)
+    elapsed = time.perf_counter() - start
+    if not decode_times:
+        return None
+
+    decode_times.sort()
+    return {
+        'fourcc': fourcc,
+        'width': width,
+        'height': height,
+        'fps': fps,
+        'measured_fps': len(decode_times) / elapsed,
+        'decode_ms': decode_times[len(decode_times) // 2] * 1000,
+        'grab_ms': sum(grab_times) / len(grab_times) * 1000
+    }
+
+
+def negotiate_format(cap, width: int, height: int, fps: float,
+                     fourccs: Sequence[str] = DEFAULT_FOURCCS,
+                     fps_candidates: Optional[Sequence[float]] = None,
+                     cancel: Optional[threading.Event] = None, **probe_options) -> Dict:
+    """
+    요청 해상도에서 FOURCC × fps 조합을 측정하고 처리량이 가장 높은 조합 선택
+
+    측정 fps가 5% 이내로 비슷하면 디코드 비용이 낮은 쪽을 선택합니다.
+
+    Args:
+        cap: cv2.VideoCapture
+        width: 요청 가로 해상도
+        height: 요청 세로 해상도
+        fps: 요청 fps
+        fourccs: 시험할 FOURCC 목록
+        fps_candidates: 시험할 fps 목록 (None이면 요청 fps와 60/30)
+        cancel: 설정되면 남은 조합 측정을 건너뜀 (연결 해제 등)
+        **probe_options: probe_format 옵션
+
+    Returns:
+        'selected' (선택된 측정 결과 또는 None)와 'probes' (전체 측정 결과) 딕셔너리
+    """
+    if fps_candidates is None:
+        fps_candidates = sorted({float(fps), 60.0, 30.0}, reverse=True)
+
+    probes: List[Dict] = []
+    for fourcc in fourccs:
+        for candidate_fps in fps_candidates:
+            if cancel is not None and cancel.is_set():
+                break
+            result = probe_format(cap, fourcc, width, height, candidate_fps, **probe_options)
+            if result is not None:
+                probes.append(result)
+
+    selected = None
+    for result in probes:
+        if (selected is None or result['measured_fps'] > selected['measured_fps'] * 1.05
+                or (result['measured_fps'] >= selected['measured_fps'] * 0.95
+                    and result['decode_ms'] < selected['decode_ms'])):
+            selected = result
+
+    if selected is not None:
+        apply_format(cap, selected['fourcc'], width, height, selected['fps'])
+    return {'selected': selected, 'probes': probes}
+
+
+class FormatCache:
+    """장치별 포맷 협상 결과 JSON 캐시"""
+
+    def __init__(self, filepath: str = FORMAT_CACHE_FILE):
+        self.filepath = filepath
+
+    @staticmethod
+    def device_key(cap, camera_index: int, width: int, height: int, fps: float) -> str:
+        """캐시 키 (백엔드, 장치 번호, 요청 해상도/fps)"""
+        try:
+            backend = cap.getBackendName()
+        except cv2.error:
+            backend = "unknown"
+        return f"{backend}:{camera_index}:{width}x{height}@{fps:g}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시된 협상 결과 (없으면 None)"""
+        return self._load().get(key)
+
+    def put(self, key: str, negotiation: Dict):
+        """협상 결과 저장"""
+        entries = self._load()
+        entries[key] = negotiation
+        try:
+            directory = os.path.dirname(self.filepath)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.filepath, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"포맷 캐시 저장 오류: {e}")
+
+    def _load(self) -> Dict:
+        if not os.path.exists(self.filepath):
+            return {}
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"포맷 캐시 로드 오류: {e}")
+            return {}
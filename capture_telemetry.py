@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+캡처 통계 모듈
+Capture Telemetry Module
+
+프레임별 캡처 시각(time.monotonic)으로 실효 fps와 드롭 프레임을 계산하고,
+read/색 변환 지연 시간 히스토그램과 소비자가 건너뛴 프레임 수를 집계
+(검사 스테이션 처리량 산정, USB 대역폭 부족 진단용)
+"""
+
+import threading
+from collections import deque
+import cv2
+import numpy as np
+from typing import Dict, Optional
+
+
+LATENCY_BINS_MS = (1, 2, 5, 10, 20, 33, 50, 100, 200)  # 히스토그램 구간 경계 (마지막 구간은 200ms 이상)
+DROP_FACTOR = 1.5  # 프레임 간격이 예상 간격의 이 배수를 넘으면 드롭으로 판정
+
+
+class CaptureTelemetry:
+    """캡처 스레드/소비자 공용 통계 집계 클래스"""
+
+    def __init__(self, nominal_fps: Optional[float] = None, window: int = 120):
+        """
+        통계 초기화
+
+        Args:
+            nominal_fps: 장치 설정 fps (드롭 판정 기준, None이면 최근 간격 중앙값 사용)
+            window: 실효 fps/백분위 계산에 쓰는 최근 프레임 수
+        """
+        self.window = window
+        self.lock = threading.Lock()
+        self.reset(nominal_fps)
+
+    def reset(self, nominal_fps: Optional[float] = None):
+        """통계 초기화 (연결할 때마다)"""
+        with self.lock:
+            self.nominal_fps = nominal_fps if nominal_fps and nominal_fps > 0 else None
+            self.frames = 0
+            self.dropped = 0  # 프레임 간격으로 추정한 장치/드라이버 드롭 수
+            self.skipped = 0  # 캡처되었지만 소비자가 가져가지 않은 프레임 수
+            self.last_timestamp = None
+            self.last_consumed = None
+            self.timestamps = deque(maxlen=self.window)
+            self.read_samples = deque(maxlen=self.window)
+            self.convert_samples = deque(maxlen=self.window)
+            self.read_histogram = np.zeros(len(LATENCY_BINS_MS) + 1, dtype=np.int64)
+            self.convert_histogram = np.zeros(len(LATENCY_BINS_MS) + 1, dtype=np.int64)
+
+    def record_frame(self, timestamp: float, read_ms: float):
+        """
+        캡처된 프레임 기록
+
+        Args:
+            timestamp: 프레임 도착 시각 (초, time.monotonic)
+            read_ms: read 소요 시간 (ms)
+        """
+        with self.lock:
+            if self.last_timestamp is not None:
+                interval = timestamp - self.last_timestamp
+                expected = self._expected_interval()
+                if expected and interval > expected * DROP_FACTOR:
+                    self.dropped += int(round(interval / expected)) - 1
+            self.last_timestamp = timestamp
+            self.frames += 1
+            self.timestamps.append(timestamp)
+            self.read_samples.append(read_ms)
+            self.read_histogram[np.searchsorted(LATENCY_BINS_MS, read_ms, side='right')] += 1
+
+    def record_convert(self, convert_ms: float):
+        """색 변환/복사 소요 시간 기록 (ms)"""
+        with self.lock:
+            self.convert_samples.append(convert_ms)
+            self.convert_histogram[np.searchsorted(LATENCY_BINS_MS, convert_ms, side='right')] += 1
+
+    def record_consume(self, seq: int):
+        """소비자가 가져간 프레임 순번 기록 (순번이 건너뛰면 놓친 프레임으로 집계)"""
+        with self.lock:
+            if self.last_consumed is not None and seq > self.last_consumed + 1:
+                self.skipped += seq - self.last_consumed - 1
+            if self.last_consumed is None or seq > self.last_consumed:
+                self.last_consumed = seq
+
+    @property
+    def effective_fps(self) -> float:
+        """최근 프레임 기준 실효 fps"""
+        with self.lock:
+            return self._effective_fps()
+
+    def snapshot(self) -> Dict:
+        """
+        현재 통계
+
+        Returns:
+            dict: frames, dropped, skipped, effective_fps, read_ms/convert_ms (p50, p95),
+                  read_histogram/convert_histogram (구간별 개수), histogram_bins_ms
+        """
+        with self.lock:
+            return {
+                'frames': self.frames,
+                'dropped': self.dropped,
+                'skipped': self.skipped,
+                'effective_fps': self._effective_fps(),
+                'nominal_fps': self.nominal_fps,
+                'read_ms': self._percentiles(self.read_samples),
+                'convert_ms': self._percentiles(self.convert_samples),
+                'read_histogram': self.read_histogram.tolist(),
+                'convert_histogram': self.convert_histogram.tolist(),
+                'histogram_bins_ms': list(LATENCY_BINS_MS)
+            }
+
+    def _effective_fps(self) -> float:
+        if len(self.timestamps) < 2:
+            return 0.0
+        span = self.timestamps[-1] - self.timestamps[0]
+        return (len(self.timestamps) - 1) / span if span > 0 else 0.0
+
+    def _expected_interval(self) -> Optional[float]:
+        if self.nominal_fps:
+            return 1.0 / self.nominal_fps
+        if len(self.timestamps) < 8:
+            return None
+        return float(np.median(np.diff(self.timestamps)))
+
+    @staticmethod
+    def _percentiles(samples) -> Dict[str, float]:
+        if not samples:
+            return {'p50': 0.0, 'p95': 0.0}
+        p50, p95 = np.percentile(samples, (50, 95))
+        return {'p50': float(p50), 'p95': float(p95)}
+
+
+def draw_telemetry(frame: np.ndarray, stats: Dict, origin=(10, 25)) -> np.ndarray:
+    """
+    캡처 통계 오버레이 그리기 (프레임에 직접 그림)
+
+    Args:
+        frame: 표시용 프레임
+        stats: CaptureTelemetry.snapshot() 결과
+        origin: 첫 줄 위치 (x, y)
+
+    Returns:
+        np.ndarray: 오버레이가 그려진 프레임
+    """
+    if not stats:
+        return frame
+    nominal = stats.get('nominal_fps')
+    lines = [
+        f"FPS {stats['effective_fps']:.1f}" + (f" / {nominal:g}" if nominal else ""),
+        f"drop {stats['dropped']}  skip {stats['skipped']}",
+        f"read {stats['read_ms']['p50']:.1f}/{stats['read_ms']['p95']:.1f} ms",
+        f"conv {stats['convert_ms']['p50']:.1f}/{stats['convert_ms']['p95']:.1f} ms"
+    ]
+    warning = stats['dropped'] > 0 or (nominal and stats['effective_fps'] < nominal * 0.9)
+    color = (255, 200, 0) if warning else (0, 255, 0)
+    x, y = origin
+    for line in lines:
+        cv2.putText(frame, line, (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 3)
+        cv2.putText(frame, line, (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 1)
+        y += 22
+    return frame
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BGR → CIE Lab 3D 룩업 테이블 모듈
+BGR to CIE Lab 3D Lookup Table Module
+
+양자화된 BGR 격자에 대해 Lab 값을 미리 계산하고 디스크에 캐시하여,
+픽셀 단위 float 변환(cv2.cvtColor) 없이 인덱싱만으로 Lab 변환
+"""
+
+import os
+import cv2
+import numpy as np
+from typing import Optional
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'display_inspection')
+
+
+def bgr_to_lab(colors: np.ndarray) -> np.ndarray:
+    """
+    BGR 색상(0-255) 배열을 CIE Lab(L: 0-100, a/b: -127-127)으로 정확히 변환
+
+    Args:
+        colors: (..., 3) BGR 색상 배열
+
+    Returns:
+        (..., 3) Lab 배열 (float32)
+    """
+    colors = np.asarray(colors, dtype=np.float32)
+    shape = colors.shape
+    lab = cv2.cvtColor(colors.reshape(-1, 1, 3) / 255.0, cv2.COLOR_BGR2LAB)
+    return lab.reshape(shape)
+
+
+class LabLookupTable:
+    """양자화된 BGR → Lab 3D 룩업 테이블 클래스"""
+
+    def __init__(self, bits: int = 6, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        """
+        룩업 테이블 초기화 (캐시가 있으면 로드, 없으면 생성 후 저장)
+
+        Args:
+            bits: 채널당 양자화 비트 수 (6비트 = 64단계, 64^3 항목)
+            cache_dir: 캐시 디렉토리 (None이면 캐시하지 않음)
+        """
+        if not 1 <= bits <= 8:
+            raise ValueError(f"양자화 비트 수는 1-8 이어야 합니다: {bits}")
+
+        self.bits = bits
+        self.shift = 8 - bits
+        self.size = 1 << bits
+        self.cache_path = (os.path.join(cache_dir, f"bgr2lab_lut_{bits}bit.npy")
+                           if cache_dir else None)
+        self.table = self._load_or_build()
+
+    def _load_or_build(self) -> np.ndarray:
+        """캐시된 테이블 로드 또는 생성"""
+        expected_shape = (self.size ** 3, 3)
+
+        if self.cache_path and os.path.exists(self.cache_path):
+            try:
+                table = np.load(self.cache_path)
+                if table.shape == expected_shape and table.dtype == np.float32:
+                    return table
+            except (OSError, ValueError) as e:
+                print(f"LUT 캐시 로드 실패, 재생성합니다: {e}")
+
+        table = self._build()
+
+        if self.cache_path:
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                np.save(self.cache_path, table)
+            except OSError as e:
+                print(f"LUT 캐시 저장 실패: {e}")
+
+        return table
+
+    def _build(self) -> np.ndarray:
+        """각 양자화 셀 중심값의 Lab 계산"""
+        step = 1 << self.shift
+        centers = np.arange(self.size, dtype=np.float32) * step + (step - 1) / 2.0
+        b, g, r = np.meshgrid(centers, centers, centers, indexing='ij')
+        grid = np.stack([b, g, r], axis=-1)
+        return bgr_to_lab(grid).reshape(-1, 3).astype(np.float32)
+
+    def index(self, image: np.ndarray) -> np.ndarray:
+        """BGR uint8 이미지의 LUT 인덱스 계산"""
+        quantized = (image >> self.shift).astype(np.int32)
+        return ((quantized[..., 0] << (2 * self.bits))
+                | (quantized[..., 1] << self.bits)
+                | quantized[..., 2])
+
+    def convert(self, image: np.ndarray) -> np.ndarray:
+        """
+        BGR uint8 이미지를 Lab으로 변환
+
+        Args:
+            image: BGR 이미지 (uint8)
+
+        Returns:
+            Lab 이미지 (float32, L: 0-100, a/b: -127-127)
+        """
+        return np.take(self.table, self.index(image), axis=0)
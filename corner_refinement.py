@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+패널 코너 서브픽셀 보정 모듈
+Panel Corner Sub-pixel Refinement Module
+
+저해상도(1/4 스케일) 이미지에서 찾은 패널 사각형의 네 변을
+원본 해상도의 좁은 창에서 엣지 직선 피팅으로 다시 맞춰 서브픽셀 코너 계산
+(코너 좌표는 OpenCV 픽셀 중심 기준: 패널 가장자리 픽셀의 중심, cv2.fillPoly 꼭짓점과 같은 규약)
+"""
+
+import cv2
+import numpy as np
+from typing import Optional, Tuple
+
+
+DETECTION_SCALE = 0.25  # 저해상도 감지 스케일
+
+
+def downscale(frame: np.ndarray, scale: float = DETECTION_SCALE) -> np.ndarray:
+    """감지용 저해상도 이미지 생성 (면적 평균으로 축소)"""
+    height, width = frame.shape[:2]
+    size = (max(1, int(round(width * scale))), max(1, int(round(height * scale))))
+    return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+
+def scaled_kernel_size(size: int, scale: float = DETECTION_SCALE, minimum: int = 1) -> int:
+    """
+    원본 해상도 기준 커널/블록 크기를 감지 스케일로 환산한 홀수 크기
+
+    Args:
+        size: 원본 해상도 기준 크기 (픽셀)
+        scale: 감지 스케일
+        minimum: 최소 크기 (adaptiveThreshold 블록은 3)
+
+    Returns:
+        int: 홀수 크기 (1이면 해당 필터/모폴로지 생략 가능)
+    """
+    return max(minimum, 2 * int(round((size * scale - 1) / 2)) + 1)
+
+
+def order_corners(points: np.ndarray) -> np.ndarray:
+    """
+    꼭짓점을 좌상, 우상, 우하, 좌하 순서로 정렬
+
+    Args:
+        points: (N, 2) 꼭짓점 배열 (N >= 4)
+
+    Returns:
+        (4, 2) float32 코너 배열
+    """
+    points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+    total = points.sum(axis=1)
+    diff = points[:, 0] - points[:, 1]
+    return np.array([
+        points[np.argmin(total)],   # 좌상
+        points[np.argmax(diff)],    # 우상
+        points[np.argmax(total)],   # 우하
+        points[np.argmin(diff)],    # 좌하
+    ], dtype=np.float32)
+
+
+def contour_to_corners(contour: np.ndarray) -> np.ndarray:
+    """
+    윤곽선의 네 코너 추정 (4각형 근사가 안 되면 최소 면적 사각형 사용)
+
+    Args:
+        contour: OpenCV 윤곽선
+
+    Returns:
+        (4, 2) float32 코너 배열 (좌상, 우상, 우하, 좌하)
+    """
+    epsilon = 0.02 * cv2.arcLength(contour, True)
+    approx = cv2.approxPolyDP(contour, epsilon, True)
+    if len(approx) == 4:
+        return order_corners(approx)
+    return order_corners(cv2.boxPoints(cv2.minAreaRect(contour)))
+
+
+def corners_to_rectangle(corners: np.ndarray) -> Tuple[int, int, int, int]:
+    """
+    서브픽셀 코너를 감싸는 정수 사각형 (x, y, w, h)
+
+    코너는 패널 가장자리 픽셀의 중심 좌표이므로 가장 가까운 픽셀을 첫/마지막 픽셀로 사용합니다.
+    """
+    corners = np.asarray(corners, dtype=np.float64).reshape(-1, 2)
+    x0, y0 = np.round(corners.min(axis=0)).astype(int)
+    x1, y1 = np.round(corners.max(axis=0)).astype(int)
+    return (int(x0), int(y0), int(x1 - x0 + 1), int(y1 - y0 + 1))
+
+
+def rectangle_to_corners(rectangle: Tuple[int, int, int, int]) -> np.ndarray:
+    """정수 사각형 (x, y, w, h)의 가장자리 픽셀 중심 코너 (corners_to_rectangle의 역변환)"""
+    x, y, w, h = rectangle
+    return np.float32([[x, y], [x + w - 1, y], [x + w - 1, y + h - 1], [x, y + h - 1]])
+
+
+def corners_to_contour(corners: np.ndarray) -> np.ndarray:
+    """코너 배열을 OpenCV 윤곽선 형식(int32, (4, 1, 2))으로 변환"""
+    return np.round(corners).astype(np.int32).reshape(-1, 1, 2)
+
+
+class CornerRefiner:
+    """엣지 직선 피팅 기반 패널 코너 서브픽셀 보정 클래스"""
+
+    def __init__(self, search_radius: int = 8, samples: int = 32, min_contrast: float = 15.0,
+                 min_points: int = 8):
+        """
+        코너 보정기 초기화
+
+        Args:
+            search_radius: 초기 변 위치 기준 법선 방향 검색 반경 (픽셀, 원본 해상도)
+            samples: 변마다 샘플링할 법선 프로파일 수
+            min_contrast: 엣지로 인정할 최소 밝기 차이 (0-255)
+            min_points: 직선 피팅에 필요한 최소 엣지 점 수
+        """
+        self.search_radius = search_radius
+        self.samples = samples
+        self.min_contrast = min_contrast
+        self.min_points = min_points
+
+    def refine(self, frame: np.ndarray, corners: np.ndarray) -> np.ndarray:
+        """
+        원본 해상도에서 네 변을 다시 맞춰 코너 보정
+
+        변 피팅에 실패한 경우 해당 변은 초기 코너를 잇는 직선을 그대로 사용합니다.
+
+        Args:
+            frame: 원본 해상도 이미지 (BGR 또는 그레이스케일)
+            corners: (4, 2) 초기 코너 (좌상, 우상, 우하, 좌하)
+
+        Returns:
+            (4, 2) float32 보정된 코너
+        """
+        corners = np.asarray(corners, dtype=np.float32).reshape(4, 2)
+        lines = []
+        for i in range(4):
+            start, end = corners[i], corners[(i + 1) % 4]
+            line = self._fit_edge(frame, start, end)
+            if line is None:
+                direction = (end - start) / max(float(np.linalg.norm(end - start)), 1e-6)
+                line = (start, direction)
+            lines.append(line)
+
+        refined = []
+        for i in range(4):
+            # 코너 i는 (i-1)번 변과 i번 변의 교점
+            point = self._intersect(lines[i - 1], lines[i])
+            refined.append(corners[i] if point is None else point)
+        return np.array(refined, dtype=np.float32)
+
+    def track(self, frame: np.ndarray, corners: np.ndarray, min_valid: float = 0.75,
+              max_residual: float = 1.0) -> Optional[np.ndarray]:
+        """
+        이전 코너의 네 변 주변(search_radius 띠)에서 변 직선을 다시 맞춰 코너 갱신 (연속 프레임 추적용)
+
+        refine과 달리 한 변이라도 엣지를 충분히 찾지 못하거나 직선에서 벗어나면
+        (가려짐, 패널 이탈) 실패로 처리합니다.
+
+        Args:
+            frame: 원본 해상도 이미지 (BGR 또는 그레이스케일)
+            corners: (4, 2) 이전 프레임 코너 (좌상, 우상, 우하, 좌하)
+            min_valid: 변마다 엣지를 찾아야 하는 샘플 비율
+            max_residual: 엣지 점의 피팅 직선 거리 중앙값 허용치 (픽셀)
+
+        Returns:
+            (4, 2) float32 코너 또는 None
+        """
+        corners = np.asarray(corners, dtype=np.float32).reshape(4, 2)
+        min_points = max(self.min_points, int(np.ceil(self.samples * min_valid)))
+        lines = []
+        for i in range(4):
+            line = self._fit_edge(frame, corners[i], corners[(i + 1) % 4], min_points, max_residual)
+            if line is None:
+                return None
+            lines.append(line)
+
+        tracked = [self._intersect(lines[i - 1], lines[i]) for i in range(4)]
+        if any(point is None for point in tracked):
+            return None
+        return np.array(tracked, dtype=np.float32)
+
+    def _fit_edge(self, frame: np.ndarray, start: np.ndarray, end: np.ndarray,
+                  min_points: Optional[int] = None,
+                  max_residual: Optional[float] = None) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """변을 따라 법선 프로파일을 샘플링하고 엣지 점에 직선 피팅"""
+        length = float(np.linalg.norm(end - start))
+        if length < 2 * self.search_radius:
+            return None
+        direction = (end - start) / length
+        normal = np.array([-direction[1], direction[0]], dtype=np.float32)
+
+        # 코너 부근은 인접 변의 영향을 받으므로 변 중앙 80%만 샘플링
+        t = np.linspace(0.1, 0.9, self.samples, dtype=np.float32)
+        offsets = np.arange(-self.search_radius, self.search_radius + 1, dtype=np.float32)
+        bases = start[None, :] + t[:, None] * (end - start)[None, :]
+        coords = bases[:, None, :] + offsets[None, :, None] * normal[None, None, :]
+
+        profiles = cv2.remap(frame, coords[..., 0], coords[..., 1], cv2.INTER_LINEAR,
+                             borderMode=cv2.BORDER_REPLICATE)
+        if profiles.ndim == 3:
+            profiles = cv2.cvtColor(profiles, cv2.COLOR_BGR2GRAY)
+        profiles = profiles.astype(np.float32)
+
+        # 법선 방향 밝기 변화가 최대인 픽셀 경계 (diff[k]는 offsets[k]와 offsets[k+1] 사이)
+        gradient = np.abs(np.diff(profiles, axis=1))
+        last = profiles.shape[1] - 1
+        peak = np.clip(np.argmax(gradient, axis=1), 2, last - 3)
+        rows = np.arange(len(peak))
+
+        # 경계 앞뒤 6샘플 창 양 끝의 밝기 차이로 엣지 여부 확인 (블러로 퍼진 엣지 포함)
+        samples = profiles[rows[:, None], peak[:, None] + np.arange(-2, 4)[None, :]]
+        outside, inside = samples[:, 0], samples[:, -1]
+        contrast = inside - outside
+        valid = np.abs(contrast) >= self.min_contrast
+        if np.count_nonzero(valid) < (min_points or self.min_points):
+            return None
+
+        # 창 밝기를 바깥 0 ~ 안쪽 1로 정규화한 합은 계단 엣지의 경계 위치에 정확히 비례
+        # (포물선 보간과 달리 샘플 위상에 따른 치우침 없음): 경계 = peak + 3.5 - 합
+        # 법선은 패널 안쪽을 향하므로 경계에서 0.5 안쪽인 가장자리 픽셀 중심을 변 위치로 사용
+        normalized = np.clip((samples - outside[:, None]) / np.where(valid, contrast, 1.0)[:, None], 0.0, 1.0)
+        position = offsets[0] + peak + 4.0 - normalized.sum(axis=1)
+        points = bases + position[:, None] * normal[None, :]
+        vx, vy, x0, y0 = cv2.fitLine(points[valid], cv2.DIST_HUBER, 0, 0.01, 0.01).ravel()
+        if max_residual is not None:
+            offsets_from_line = (points[valid, 0] - x0) * vy - (points[valid, 1] - y0) * vx
+            if np.median(np.abs(offsets_from_line)) > max_residual:
+                return None
+        return np.array([x0, y0], dtype=np.float32), np.array([vx, vy], dtype=np.float32)
+
+    @staticmethod
+    def _intersect(line_a: Tuple[np.ndarray, np.ndarray],
+                   line_b: Tuple[np.ndarray, np.ndarray]) -> Optional[np.ndarray]:
+        """두 직선(점, 방향)의 교점"""
+        (pa, da), (pb, db) = line_a, line_b
+        cross = da[0] * db[1] - da[1] * db[0]
+        if abs(cross) < 1e-6:
+            return None
+        diff = pb - pa
+        s = (diff[0] * db[1] - diff[1] * db[0]) / cross
+        return (pa + s * da).astype(np.float32)
@@ -20,6 +20,8 @@ import time
 import os
 import json
 
+from frame_source import open_capture
+
 class UNet(nn.Module):
     """U-Net 아키텍처 for 불량 픽셀 탐지"""
     
@@ -335,7 +337,7 @@ class DeepLearningDefectDetector:
     def start_camera(self):
         """카메라 시작"""
         try:
-            self.camera = cv2.VideoCapture(0)
+            self.camera = open_capture()
             if not self.camera.isOpened():
                 raise Exception("카메라를 열 수 없습니다")
             
@@ -9,6 +9,8 @@ import cv2
 import numpy as np
 import time
 
+from frame_source import open_capture
+
 def create_demo_panel():
     """데모용 패널 이미지 생성"""
     # 1920x1080 크기의 패널 시뮬레이션
@@ -92,7 +94,7 @@ def demo_camera_inspection():
     print("\n=== 카메라 검사 데모 ===")
     
     # 카메라 연결 테스트
-    cap = cv2.VideoCapture(0)
+    cap = open_capture()
     
     if not cap.isOpened():
         print("✗ 카메라를 찾을 수 없습니다.")
@@ -18,6 +18,8 @@ from typing import Tuple, List, Dict, Optional
 import threading
 import time
 
+from histogram_statistics import HistogramStatistics
+
 class DisplayInspector:
     """디스플레이 검사 시스템 메인 클래스"""
     
@@ -407,7 +409,8 @@ class DisplayInspector:
         from advanced_analysis import AdvancedDisplayAnalyzer
         
         analyzer = AdvancedDisplayAnalyzer()
-        report = analyzer.create_analysis_report(self.current_image)
+        report = analyzer.create_analysis_report(self.current_image, include_artifacts=True)
+        artifacts = analyzer.compact_report(report)  # 시각화에 다시 쓰도록 대용량 결과를 떼어 둠
         
         # 결과 표시
         self.log_result(f"=== 전체 검사 결과 ===")
@@ -418,7 +421,8 @@ class DisplayInspector:
         self.log_result(f"색상 균일성: {report['color_uniformity']['uniformity_score']:.2f}")
         
         # 결과 시각화
-        analyzer.visualize_results(self.current_image, report, "inspection_result.png")
+        analyzer.visualize_results(self.current_image, report, "inspection_result.png", show=True,
+                                   artifacts=artifacts)
         self.log_result("결과 이미지 저장: inspection_result.png")
     
     def run_scratch_inspection(self):
@@ -431,7 +435,7 @@ class DisplayInspector:
         self.log_result(f"=== 스크래치 검사 결과 ===")
         self.log_result(f"감지된 스크래치: {scratches['count']}개")
         
-        for i, scratch in enumerate(scratches['scratches']):
+        for i, scratch in enumerate(scratches['segments']):
             self.log_result(f"스크래치 {i+1}: 길이 {scratch['length']:.1f}px, 각도 {scratch['angle']:.1f}°")
     
     def run_pixel_inspection(self):
@@ -971,31 +975,31 @@ class DisplayInspector:
             return
         
         try:
-            # RGB 채널 분리
-            b, g, r = cv2.split(self.current_image)
+            # 채널당 히스토그램 한 번으로 모든 통계 계산 (BGR 순서)
+            channel_stats = HistogramStatistics.from_image(self.current_image).summary(
+                ['Blue', 'Green', 'Red'])
             
             # 각 채널의 통계 계산
             rgb_stats = {}
-            for channel, name in [(r, 'Red'), (g, 'Green'), (b, 'Blue')]:
+            for name in ['Red', 'Green', 'Blue']:
+                stats = channel_stats[name]
                 rgb_stats[name] = {
-                    'mean': float(np.mean(channel)),
-                    'std': float(np.std(channel)),
-                    'min': int(np.min(channel)),
-                    'max': int(np.max(channel)),
-                    'median': int(np.median(channel))
+                    'mean': stats['mean'],
+                    'std': stats['std'],
+                    'min': stats['min'],
+                    'max': stats['max'],
+                    'median': int(stats['median'])
                 }
             
             # 픽셀 분포 분석
             total_pixels = self.current_image.shape[0] * self.current_image.shape[1]
             
-            # 색상 균일성 분석
-            color_variance = np.var(self.current_image.reshape(-1, 3), axis=0)
+            # 색상 균일성 분석 (BGR 순서의 채널 분산)
+            color_variance = np.array([channel_stats[name]['variance']
+                                       for name in ['Blue', 'Green', 'Red']])
             
             # 결과 이미지 생성 (RGB 채널 시각화)
-            result_image = np.zeros_like(self.current_image)
-            result_image[:, :, 0] = b  # Blue
-            result_image[:, :, 1] = g  # Green  
-            result_image[:, :, 2] = r  # Red
+            result_image = self.current_image.copy()
             
             # 결과 표시
             self.display_image(result_image, self.result_label)
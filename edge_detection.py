@@ -9,9 +9,12 @@ Edge Detection Module
 
 import cv2
 import numpy as np
-from typing import Optional, Tuple, List
+from typing import Callable, Optional, Tuple, List
 import math
 
+from corner_refinement import (DETECTION_SCALE, CornerRefiner, contour_to_corners,
+                               corners_to_rectangle, downscale, rectangle_to_corners)
+
 
 class EdgeDetection:
     def __init__(self):
@@ -21,6 +24,11 @@ class EdgeDetection:
         self.approx_epsilon = 0.02  # 근사화 정확도
         self.min_aspect_ratio = 0.5  # 최소 종횡비
         self.max_aspect_ratio = 3.0  # 최대 종횡비
+        self.tracker = PanelTracker(self.detect_display)  # 연속 프레임용 추적기
+        self.detection_scale = DETECTION_SCALE  # 저해상도 감지 스케일
+        self.corner_refiner = CornerRefiner()
+        self.last_corners = None  # 마지막 감지의 서브픽셀 코너 (좌상, 우상, 우하, 좌하)
+        self.panel_ids = PanelIdentifier()  # 다중 패널 ID 관리
         
     def detect_display(self, frame: np.ndarray) -> Optional[np.ndarray]:
         """
@@ -36,78 +44,165 @@ class EdgeDetection:
             return None
             
         try:
-            # 그레이스케일 변환
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            # 1/4 스케일에서 상위 5개 후보 중 가장 사각형에 가까운 것 선택
+            candidates = self._panel_candidates(frame, limit=5)
             
-            # 노이즈 제거
-            blurred = cv2.GaussianBlur(gray, (3, 3), 0)
+            if candidates:
+                best_score, best_contour = max(candidates, key=lambda c: c[0])
+                
+                # 원본 해상도 좌표로 변환 후 코너를 서브픽셀 보정
+                self.last_corners = self._refine_candidate(frame, best_contour)
+                best_rectangle = corners_to_rectangle(self.last_corners)
+                print(f"선택된 패널 영역: {best_rectangle}")
+                return best_rectangle
+                    
+            # 대안: 중앙 영역 사용 (서브픽셀 코너 없음)
+            return self.center_region(frame)
+                
+        except Exception as e:
+            print(f"디스플레이 감지 오류: {e}")
+            return None
             
-            # 밝은 영역 찾기 (패턴이 표시된 영역)
-            # 임계값을 높여서 밝은 영역만 감지
-            _, bright_mask = cv2.threshold(blurred, 100, 255, cv2.THRESH_BINARY)
+    def center_region(self, frame: np.ndarray) -> Tuple[int, int, int, int]:
+        """패널 후보가 없을 때 사용할 프레임 중앙 영역 (x, y, w, h)"""
+        self.last_corners = None
+        h, w = frame.shape[:2]
+        center_x, center_y = w // 2, h // 2
+        panel_w, panel_h = min(w * 0.8, h * 0.8), min(w * 0.8, h * 0.8)
+        fallback_rectangle = (
+            int(center_x - panel_w // 2),
+            int(center_y - panel_h // 2),
+            int(panel_w),
+            int(panel_h)
+        )
+        print(f"중앙 영역 사용: {fallback_rectangle}")
+        return fallback_rectangle
             
-            # 모폴로지 연산으로 노이즈 제거
-            kernel = np.ones((5, 5), np.uint8)
-            bright_mask = cv2.morphologyEx(bright_mask, cv2.MORPH_CLOSE, kernel)
-            bright_mask = cv2.morphologyEx(bright_mask, cv2.MORPH_OPEN, kernel)
+    def detect_displays(self, frame: np.ndarray, max_panels: Optional[int] = None) -> List[dict]:
+        """
+        여러 디스플레이 패널 감지 (지그에 여러 패널이 놓인 경우)
+        
+        프레임 간 같은 위치의 패널은 같은 ID를 유지합니다.
+        
+        Args:
+            frame: 입력 프레임
+            max_panels: 최대 패널 수 (None이면 제한 없음)
             
-            # 컨투어 찾기
-            contours, _ = cv2.findContours(bright_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        Returns:
+            List[dict]: 패널 정보 ('id', 'rectangle', 'corners', 'score'), ID 순 정렬
+        """
+        if frame is None:
+            return []
             
-            print(f"감지된 컨투어 개수: {len(contours)}")
+        try:
+            candidates = self._panel_candidates(frame, limit=max_panels)
             
-            # 가장 큰 밝은 영역 찾기
-            if contours:
-                # 면적이 큰 순으로 정렬
-                contours = sorted(contours, key=cv2.contourArea, reverse=True)
+            panels = []
+            for score, contour in candidates:
+                corners = self._refine_candidate(frame, contour)
+                panels.append({
+                    'rectangle': corners_to_rectangle(corners),
+                    'corners': corners,
+                    'score': float(score)
+                })
                 
-                # 상위 5개 컨투어 중에서 가장 사각형에 가까운 것 선택
-                best_rectangle = None
-                best_score = 0
-                
-                for i, contour in enumerate(contours[:5]):
-                    area = cv2.contourArea(contour)
-                    if area < 10000:  # 너무 작은 영역 제외
-                        continue
-                        
-                    # 바운딩 박스
-                    x, y, w, h = cv2.boundingRect(contour)
-                    
-                    # 종횡비 확인 (디스플레이에 적합한 비율)
-                    aspect_ratio = w / h if h > 0 else 0
-                    if 0.5 <= aspect_ratio <= 2.0:  # 디스플레이 비율
-                        # 사각형에 가까운 정도 계산
-                        rect_area = w * h
-                        extent = area / rect_area if rect_area > 0 else 0
-                        
-                        # 점수 계산 (면적 + 사각형 정도)
-                        score = area * extent
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_rectangle = (x, y, w, h)
-                            
-                if best_rectangle:
-                    print(f"선택된 패널 영역: {best_rectangle}")
-                    return best_rectangle
-                    
-            # 대안: 중앙 영역 사용
-            h, w = frame.shape[:2]
-            center_x, center_y = w // 2, h // 2
-            panel_w, panel_h = min(w * 0.8, h * 0.8), min(w * 0.8, h * 0.8)
-            fallback_rectangle = (
-                int(center_x - panel_w // 2),
-                int(center_y - panel_h // 2),
-                int(panel_w),
-                int(panel_h)
-            )
-            print(f"중앙 영역 사용: {fallback_rectangle}")
-            return fallback_rectangle
+            for panel, panel_id in zip(panels, self.panel_ids.assign([p['rectangle'] for p in panels])):
+                panel['id'] = panel_id
                 
+            return sorted(panels, key=lambda p: p['id'])
+            
         except Exception as e:
-            print(f"디스플레이 감지 오류: {e}")
-            return None
+            print(f"다중 디스플레이 감지 오류: {e}")
+            return []
+            
+    def _panel_candidates(self, frame: np.ndarray, limit: Optional[int] = None) -> List[Tuple[float, np.ndarray]]:
+        """
+        1/4 스케일 밝은 영역에서 패널 후보 탐색
+        
+        Args:
+            frame: 입력 프레임
+            limit: 면적 상위 몇 개 윤곽선까지 검사할지 (None이면 전체)
+            
+        Returns:
+            List[Tuple[float, np.ndarray]]: (점수, 축소 영상 윤곽선) 목록, 면적 내림차순
+        """
+        scale = self.detection_scale
+        small = downscale(frame, scale)
+        
+        # 그레이스케일 변환
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+        
+        # 노이즈 제거
+        blurred = cv2.GaussianBlur(gray, (3, 3), 0)
+        
+        # 밝은 영역 찾기 (패턴이 표시된 영역)
+        # 임계값을 높여서 밝은 영역만 감지
+        _, bright_mask = cv2.threshold(blurred, 100, 255, cv2.THRESH_BINARY)
+        
+        # 모폴로지 연산으로 노이즈 제거 (축소 영상이므로 작은 커널 사용)
+        kernel = np.ones((3, 3), np.uint8)
+        bright_mask = cv2.morphologyEx(bright_mask, cv2.MORPH_CLOSE, kernel)
+        bright_mask = cv2.morphologyEx(bright_mask, cv2.MORPH_OPEN, kernel)
+        
+        # 컨투어 찾기
+        contours, _ = cv2.findContours(bright_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        
+        print(f"감지된 컨투어 개수: {len(contours)}")
+        
+        # 면적이 큰 순으로 정렬
+        contours = sorted(contours, key=cv2.contourArea, reverse=True)
+        min_area = 10000 * scale * scale  # 원본 해상도 기준 10000 픽셀
+        
+        candidates = []
+        for contour in contours[:limit]:
+            area = cv2.contourArea(contour)
+            if area < min_area:  # 너무 작은 영역 제외 (이후는 더 작음)
+                break
+                
+            # 바운딩 박스
+            x, y, w, h = cv2.boundingRect(contour)
+            
+            # 종횡비 확인 (디스플레이에 적합한 비율)
+            aspect_ratio = w / h if h > 0 else 0
+            if 0.5 <= aspect_ratio <= 2.0:  # 디스플레이 비율
+                # 사각형에 가까운 정도 계산
+                rect_area = w * h
+                extent = area / rect_area if rect_area > 0 else 0
+                
+                # 점수 계산 (면적 + 사각형 정도)
+                candidates.append((area * extent, contour))
+                
+        return candidates
+        
+    def _refine_candidate(self, frame: np.ndarray, contour: np.ndarray) -> np.ndarray:
+        """축소 영상 윤곽선의 코너를 원본 해상도에서 서브픽셀 보정"""
+        corners = (contour_to_corners(contour) + 0.5) / self.detection_scale - 0.5
+        return self.corner_refiner.refine(frame, corners)
+        
+    def track_display(self, frame: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """
+        연속 프레임용 디스플레이 패널 추적
+        
+        이전 프레임의 패널 네 변 주변 좁은 띠에서 변 직선만 다시 맞추고 (기울어진 패널 포함),
+        변을 찾지 못한 경우에만 detect_display 전체 감지를 수행합니다.
+        추적한 서브픽셀 코너는 last_corners에 반영됩니다.
+        
+        Args:
+            frame: 입력 프레임
             
+        Returns:
+            Tuple[int, int, int, int]: 패널 좌표 (x, y, w, h) 또는 None
+        """
+        full_detections = self.tracker.full_detections
+        rectangle = self.tracker.update(frame)
+        if self.tracker.full_detections != full_detections:
+            # 전체 감지 직후: 감지기의 서브픽셀 코너에서 추적 시작
+            if rectangle is not None and self.last_corners is not None:
+                self.tracker.seed(self.last_corners)
+        else:
+            self.last_corners = self.tracker.corners
+        return rectangle
+        
     def _find_rectangles(self, contours: List[np.ndarray]) -> List[Tuple[int, int, int, int]]:
         """
         컨투어에서 사각형 찾기
@@ -320,3 +415,155 @@ class EdgeDetection:
             self.min_aspect_ratio = min_aspect_ratio
         if max_aspect_ratio is not None:
             self.max_aspect_ratio = max_aspect_ratio
+
+
+
+class PanelTracker:
+    """이전 프레임 패널의 네 변 주변 띠에서 변 직선만 다시 맞추는 패널 추적 클래스"""
+    
+    def __init__(self, detector: Callable[[np.ndarray], Optional[Tuple[int, int, int, int]]],
+                 band_width: int = 16, min_contrast: float = 20.0, samples: int = 32,
+                 min_valid: float = 0.75, max_residual: float = 1.0):
+        """
+        패널 추적기 초기화
+        
+        Args:
+            detector: 추적 실패 시 사용할 전체 프레임 감지 함수 (frame -> (x, y, w, h) 또는 None)
+            band_width: 이전 변 기준 법선 방향 검색 폭 (픽셀, 프레임 간 최대 이동량)
+            min_contrast: 엣지 안팎 최소 밝기 차이 (0-255)
+            samples: 변마다 샘플링할 법선 프로파일 수
+            min_valid: 변마다 엣지를 찾아야 하는 샘플 비율 (가려짐 판단)
+            max_residual: 엣지 점의 피팅 직선 거리 중앙값 허용치 (픽셀, 휘어짐/가려짐 판단)
+        """
+        self.detector = detector
+        self.band_width = band_width
+        self.min_valid = min_valid
+        self.max_residual = max_residual
+        self.refiner = CornerRefiner(search_radius=band_width, samples=samples, min_contrast=min_contrast)
+        
+        self.rectangle = None
+        self.corners = None  # 추적 중인 서브픽셀 코너 (좌상, 우상, 우하, 좌하, 가장자리 픽셀 중심 좌표)
+        self.full_detections = 0  # 전체 감지 횟수
+        self.tracked_frames = 0  # 띠 검사만으로 추적한 프레임 수
+        
+    @property
+    def is_tracking(self) -> bool:
+        """추적 중인 패널이 있는지 여부"""
+        return self.corners is not None
+        
+    def reset(self):
+        """추적 상태 초기화 (다음 프레임은 전체 감지)"""
+        self.rectangle = None
+        self.corners = None
+        
+    def seed(self, corners: np.ndarray):
+        """전체 감지에서 얻은 서브픽셀 코너로 추적 시작 위치 교체 (기울어진 패널)"""
+        self.corners = np.asarray(corners, dtype=np.float32).reshape(4, 2)
+        self.rectangle = corners_to_rectangle(self.corners)
+        
+    def update(self, frame: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """
+        새 프레임에서 패널 위치 갱신
+        
+        Args:
+            frame: 입력 프레임 (BGR 또는 그레이스케일)
+            
+        Returns:
+            Tuple[int, int, int, int]: 패널 좌표 (x, y, w, h) 또는 None
+        """
+        if frame is None:
+            return None
+            
+        if self.corners is not None:
+            corners = self.refiner.track(frame, self.corners, self.min_valid, self.max_residual)
+            if corners is not None and self._is_plausible(corners):
+                self.seed(corners)
+                self.tracked_frames += 1
+                return self.rectangle
+                
+        # 첫 프레임이거나 변 추적 실패 → 전체 감지
+        self.full_detections += 1
+        detected = self.detector(frame)
+        if detected is None:
+            self.reset()
+            return None
+        self.rectangle = tuple(int(v) for v in detected)
+        self.corners = rectangle_to_corners(self.rectangle)
+        return self.rectangle
+        
+    def _is_plausible(self, corners: np.ndarray) -> bool:
+        """추적 결과가 패널 크기를 유지하고 한 프레임 이동량(band_width) 안인지 확인"""
+        sides = np.linalg.norm(corners - np.roll(corners, -1, axis=0), axis=1)
+        if sides.min() < 2 * self.band_width:
+            return False
+        return bool(np.abs(corners - self.corners).max() <= self.band_width)
+
+
+
+class PanelIdentifier:
+    """프레임 간 패널 ID 유지 클래스 (겹침 비율로 이전 패널과 매칭)"""
+    
+    def __init__(self, min_iou: float = 0.5):
+        """
+        패널 ID 관리자 초기화
+        
+        Args:
+            min_iou: 같은 패널로 판단할 최소 IoU (겹친 면적 / 합친 면적)
+        """
+        self.min_iou = min_iou
+        self.panels = {}  # ID → 마지막 사각형 (x, y, w, h)
+        self.next_id = 1
+        
+    def reset(self):
+        """ID 기록 초기화"""
+        self.panels = {}
+        self.next_id = 1
+        
+    def assign(self, rectangles: List[Tuple[int, int, int, int]]) -> List[int]:
+        """
+        사각형 목록에 ID 부여
+        
+        이전 프레임 패널과 IoU가 큰 순서로 매칭하고, 매칭되지 않은 새 패널은
+        위→아래, 왼쪽→오른쪽 순으로 새 ID를 받습니다. 사라진 패널의 ID는 폐기됩니다.
+        
+        Args:
+            rectangles: 감지된 사각형 목록
+            
+        Returns:
+            List[int]: 각 사각형의 ID
+        """
+        ids = [None] * len(rectangles)
+        pairs = sorted(
+            ((self._iou(rect, previous), i, panel_id)
+             for i, rect in enumerate(rectangles)
+             for panel_id, previous in self.panels.items()),
+            reverse=True
+        )
+        
+        used = set()
+        for iou, i, panel_id in pairs:
+            if iou < self.min_iou:
+                break
+            if ids[i] is None and panel_id not in used:
+                ids[i] = panel_id
+                used.add(panel_id)
+                
+        # 새 패널은 행 우선 순서로 ID 부여 (고정 지그 슬롯 순서와 일치)
+        new_panels = sorted((i for i in range(len(rectangles)) if ids[i] is None),
+                            key=lambda i: (rectangles[i][1] + rectangles[i][3] // 2,
+                                           rectangles[i][0] + rectangles[i][2] // 2))
+        for i in new_panels:
+            ids[i] = self.next_id
+            self.next_id += 1
+            
+        self.panels = {panel_id: tuple(rect) for panel_id, rect in zip(ids, rectangles)}
+        return ids
+        
+    @staticmethod
+    def _iou(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> float:
+        """두 사각형의 IoU"""
+        x0, y0 = max(a[0], b[0]), max(a[1], b[1])
+        x1, y1 = min(a[0] + a[2], b[0] + b[2]), min(a[1] + a[3], b[1] + b[3])
+        inter = max(0, x1 - x0) * max(0, y1 - y0)
+        union = a[2] * a[3] + b[2] * b[3] - inter
+        return inter / union if union > 0 else 0.0
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+피듀셜 마커 기반 패널 정합 모듈
+Fiducial Marker Panel Registration Module
+
+테스트 패턴 네 모서리에 ArUco 마커를 넣고, 카메라 프레임에서 마커를 찾아
+패턴 좌표 ↔ 프레임 좌표 호모그래피를 직접 계산 (패턴 색상과 무관한 패널 위치 결정)
+"""
+
+import cv2
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+from corner_refinement import downscale, order_corners
+
+
+MARKER_DICTIONARY = cv2.aruco.DICT_4X4_50
+CORNER_MARKER_IDS = (0, 1, 2, 3)  # 좌상, 우상, 우하, 좌하
+
+
+def _dictionary():
+    """마커 사전"""
+    return cv2.aruco.getPredefinedDictionary(MARKER_DICTIONARY)
+
+
+def default_marker_size(width: int, height: int) -> int:
+    """
+    패턴 크기에 맞는 기본 마커 크기 (짧은 변의 10%, 최소 36픽셀)
+
+    카메라에서 패널이 프레임의 절반 정도로 보일 때 1/2 축소 영상에서도
+    마커 셀이 4픽셀 이상이 되도록 정한 크기입니다.
+    """
+    return max(36, int(round(min(width, height) * 0.1)))
+
+
+def marker_layout(width: int, height: int, marker_size: Optional[int] = None) -> Dict[int, np.ndarray]:
+    """
+    패턴 내 마커 배치 (마커 바깥에 마커 크기 1/4의 흰색 여백)
+
+    Args:
+        width: 패턴 너비
+        height: 패턴 높이
+        marker_size: 마커 한 변 크기 (None이면 기본 크기)
+
+    Returns:
+        Dict[int, np.ndarray]: 마커 ID → (4, 2) 마커 외곽 코너 (ArUco 검출 코너와 같은 픽셀 경계 좌표, 시계 방향)
+    """
+    size = marker_size or default_marker_size(width, height)
+    quiet = max(2, size // 4)
+    origins = [
+        (quiet, quiet),
+        (width - quiet - size, quiet),
+        (width - quiet - size, height - quiet - size),
+        (quiet, height - quiet - size),
+    ]
+
+    layout = {}
+    for marker_id, (x, y) in zip(CORNER_MARKER_IDS, origins):
+        layout[marker_id] = np.array([
+            [x - 0.5, y - 0.5],
+            [x + size - 0.5, y - 0.5],
+            [x + size - 0.5, y + size - 0.5],
+            [x - 0.5, y + size - 0.5],
+        ], dtype=np.float32)
+    return layout
+
+
+def marker_zones(width: int, height: int, marker_size: Optional[int] = None) -> Dict[int, np.ndarray]:
+    """
+    마커 + 흰색 여백 영역 (검사에서 제외할 패턴 영역)
+
+    Args:
+        width: 패턴 너비
+        height: 패턴 높이
+        marker_size: 마커 한 변 크기 (None이면 기본 크기)
+
+    Returns:
+        Dict[int, np.ndarray]: 마커 ID → (4, 2) 여백 포함 외곽 코너 (패턴 픽셀 경계 좌표, 시계 방향)
+    """
+    size = marker_size or default_marker_size(width, height)
+    quiet = max(2, size // 4)
+    offset = np.float32([[-quiet, -quiet], [quiet, -quiet], [quiet, quiet], [-quiet, quiet]])
+    return {marker_id: corners + offset
+            for marker_id, corners in marker_layout(width, height, size).items()}
+
+
+def marker_exclusion_mask(shape: Tuple[int, int], pattern_size: Tuple[int, int],
+                          marker_size: Optional[int] = None, homography: Optional[np.ndarray] = None,
+                          margin: int = 8) -> np.ndarray:
+    """
+    마커/여백을 제외한 검사 마스크
+
+    Args:
+        shape: 검사 영역 크기 (height, width)
+        pattern_size: 테스트 패턴 크기 (width, height)
+        marker_size: 패턴 내 마커 크기 (None이면 기본 크기)
+        homography: 패턴 → 검사 영역 좌표 호모그래피 (None이면 패턴 전체를 검사 영역 크기로 맞춘 정면 래스터)
+        margin: 마커 영역 바깥으로 더 제외할 픽셀 수 (적응적 임계값/로컬 평균 창과 카메라 블러 흡수)
+
+    Returns:
+        uint8 마스크 (검사 대상 255, 마커 영역 0)
+    """
+    height, width = shape[:2]
+    if homography is None:
+        # 가장자리 픽셀 중심 기준 스케일 (PanelGeometry 래스터와 같은 규약): 패턴 [0, W-1] → 영역 [0, w-1]
+        sx = (width - 1) / max(pattern_size[0] - 1, 1)
+        sy = (height - 1) / max(pattern_size[1] - 1, 1)
+        homography = np.array([[sx, 0, 0], [0, sy, 0], [0, 0, 1]], dtype=np.float64)
+
+    mask = np.full((height, width), 255, dtype=np.uint8)
+    for zone in marker_zones(pattern_size[0], pattern_size[1], marker_size).values():
+        points = cv2.perspectiveTransform(zone.reshape(-1, 1, 2), homography).reshape(-1, 2)
+        cv2.fillConvexPoly(mask, np.round(points).astype(np.int32), 0)
+    if margin > 0:
+        mask = cv2.erode(mask, np.ones((2 * margin + 1, 2 * margin + 1), np.uint8))
+    return mask
+
+
+def draw_markers(pattern: np.ndarray, marker_size: Optional[int] = None) -> np.ndarray:
+    """
+    패턴 네 모서리에 ArUco 마커 삽입 (흰색 여백 포함, 원본은 수정하지 않음)
+
+    Args:
+        pattern: 테스트 패턴 (3채널)
+        marker_size: 마커 한 변 크기 (None이면 기본 크기)
+
+    Returns:
+        마커가 삽입된 패턴
+    """
+    height, width = pattern.shape[:2]
+    size = marker_size or default_marker_size(width, height)
+    quiet = max(2, size // 4)
+    result = pattern.copy()
+    dictionary = _dictionary()
+
+    for marker_id, corners in marker_layout(width, height, size).items():
+        x, y = int(corners[0, 0] + 0.5), int(corners[0, 1] + 0.5)
+        result[y - quiet:y + size + quiet, x - quiet:x + size + quiet] = 255
+        marker = cv2.aruco.generateImageMarker(dictionary, marker_id, size)
+        result[y:y + size, x:x + size] = marker[..., None] if result.ndim == 3 else marker
+
+    return result
+
+
+class FiducialRegistration:
+    """마커 기반 패널 정합 클래스"""
+
+    def __init__(self, pattern_size: Tuple[int, int], marker_size: Optional[int] = None,
+                 detection_scale: float = 0.5, min_markers: int = 2):
+        """
+        정합기 초기화
+
+        Args:
+            pattern_size: 테스트 패턴 크기 (width, height)
+            marker_size: 패턴 내 마커 크기 (None이면 기본 크기)
+            detection_scale: 마커 탐색 스케일 (탐색 후 원본 해상도에서 서브픽셀 보정)
+            min_markers: 정합에 필요한 최소 마커 수
+        """
+        self.pattern_size = tuple(pattern_size)
+        self.marker_size = marker_size
+        self.layout = marker_layout(pattern_size[0], pattern_size[1], marker_size)
+        self.detection_scale = detection_scale
+        self.min_markers = min_markers
+
+        parameters = cv2.aruco.DetectorParameters()
+        self.detector = cv2.aruco.ArucoDetector(_dictionary(), parameters)
+        self.subpix_criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 20, 0.01)
+
+    def detect_markers(self, frame: np.ndarray) -> Dict[int, np.ndarray]:
+        """
+        프레임에서 코너 마커 감지 (축소 영상에서 탐색, 원본 해상도에서 코너 보정)
+
+        Args:
+            frame: 입력 프레임 (BGR 또는 그레이스케일)
+
+        Returns:
+            Dict[int, np.ndarray]: 마커 ID → (4, 2) 프레임 좌표 코너
+        """
+        small = downscale(frame, self.detection_scale) if self.detection_scale != 1.0 else frame
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+        corners, ids, _ = self.detector.detectMarkers(gray)
+        if ids is None:
+            return {}
+
+        markers = {}
+        frame_h, frame_w = frame.shape[:2]
+        for marker_corners, marker_id in zip(corners, ids.ravel()):
+            marker_id = int(marker_id)
+            if marker_id not in self.layout or marker_id in markers:
+                continue
+            points = (marker_corners.reshape(4, 2) + 0.5) / self.detection_scale - 0.5
+
+            # 마커 주변만 잘라 원본 해상도에서 서브픽셀 보정
+            window = max(3, int(round(1.0 / self.detection_scale)) + 2)
+            x0 = max(0, int(points[:, 0].min()) - window - 2)
+            y0 = max(0, int(points[:, 1].min()) - window - 2)
+            x1 = min(frame_w, int(points[:, 0].max()) + window + 3)
+            y1 = min(frame_h, int(points[:, 1].max()) + window + 3)
+            crop = frame[y0:y1, x0:x1]
+            crop = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) if crop.ndim == 3 else crop
+            local = (points - [x0, y0]).astype(np.float32).reshape(-1, 1, 2)
+            refined = cv2.cornerSubPix(crop, local, (window, window), (-1, -1), self.subpix_criteria)
+            markers[marker_id] = refined.reshape(4, 2) + [x0, y0]
+
+        return markers
+
+    def register(self, frame: np.ndarray) -> Optional[Dict]:
+        """
+        마커로 패널 호모그래피 계산
+
+        Args:
+            frame: 입력 프레임
+
+        Returns:
+            'homography' (프레임 → 패턴), 'corners' (프레임 내 패널 코너: 좌상, 우상, 우하, 좌하),
+            'markers' (사용된 마커 수), 'reprojection_error' (픽셀) 딕셔너리 또는 None
+        """
+        markers = self.detect_markers(frame)
+        if len(markers) < self.min_markers:
+            return None
+
+        frame_points = np.concatenate([markers[i] for i in sorted(markers)]).astype(np.float32)
+        pattern_points = np.concatenate([self.layout[i] for i in sorted(markers)])
+        homography, _ = cv2.findHomography(frame_points, pattern_points, 0)
+        if homography is None:
+            return None
+
+        projected = cv2.perspectiveTransform(frame_points.reshape(-1, 1, 2), homography).reshape(-1, 2)
+        error = float(np.sqrt(np.mean(np.sum((projected - pattern_points) ** 2, axis=1))))
+
+        # 패턴 가장자리 픽셀 중심을 프레임 좌표로 역변환하여 패널 코너 계산 (CornerRefiner와 같은 규약)
+        width, height = self.pattern_size
+        outline = np.float32([[0, 0], [width - 1, 0], [width - 1, height - 1], [0, height - 1]])
+        corners = cv2.perspectiveTransform(outline.reshape(-1, 1, 2), np.linalg.inv(homography))
+
+        return {
+            'homography': homography,
+            'corners': order_corners(corners.reshape(4, 2)),
+            'markers': len(markers),
+            'reprojection_error': error
+        }
+
+    def locate_panel(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """마커로 프레임 내 패널 코너 (좌상, 우상, 우하, 좌하) 계산, 실패 시 None"""
+        registration = self.register(frame)
+        return None if registration is None else registration['corners']
+
+    def exclusion_mask(self, shape: Tuple[int, int], homography: Optional[np.ndarray] = None,
+                       margin: int = 8) -> np.ndarray:
+        """
+        검사 영역에서 마커/여백을 제외하는 마스크 (marker_exclusion_mask 참고)
+
+        locate_panel 코너로 정면 변환한 패널 래스터는 패턴 전체를 늘린 것이므로
+        homography 없이 크기 비율만으로 마커 위치가 정해집니다.
+        """
+        return marker_exclusion_mask(shape, self.pattern_size, self.marker_size, homography, margin)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+고정 지그 패널 잠금 모듈
+Fixture Lock Module
+
+패널 위치가 고정된 검사대에서 캘리브레이션된 패널 윤곽선을 그대로 사용하고,
+매 프레임은 엣지 바깥쪽(지그/배경) 소수 픽셀 밝기만 저장된 시그니처와 비교하여
+패널이 움직였을 때만 다시 감지 (패널 안쪽 밝기는 표시 패턴에 따라 바뀌므로 판정에 쓰지 않음)
+"""
+
+import numpy as np
+from typing import Callable, Dict, Optional
+
+from corner_refinement import contour_to_corners
+
+
+GRAY_WEIGHTS = np.array([0.114, 0.587, 0.299], dtype=np.float32)  # BGR → 그레이 가중치
+
+
+class FixtureLock:
+    """저장된 패널 윤곽선 잠금 + 경계 픽셀 시그니처 검증 클래스"""
+
+    def __init__(self, detector: Callable[[np.ndarray], Optional[np.ndarray]],
+                 margin: int = 4, samples: int = 12, tolerance: float = 30.0,
+                 min_agreement: float = 0.75):
+        """
+        고정 지그 잠금 초기화
+
+        Args:
+            detector: 검증 실패 시 사용할 패널 감지 함수 (frame -> 윤곽선 또는 None)
+            margin: 엣지에서 안쪽/바깥쪽 샘플 위치까지 거리 (픽셀)
+            samples: 변마다 샘플 위치 수
+            tolerance: 저장된 밝기와 허용 차이 (0-255)
+            min_agreement: 변마다 일치해야 하는 샘플 비율
+        """
+        self.detector = detector
+        self.margin = margin
+        self.samples = samples
+        self.tolerance = tolerance
+        self.min_agreement = min_agreement
+
+        self.contour = None
+        self.inside_index = None  # (4, samples, 5) 안쪽 샘플 픽셀 (y, x) 인덱스
+        self.outside_index = None
+        self.signature = None  # {'inside': (4, samples), 'outside': (4, samples)} 저장된 밝기
+        self.validations = 0  # 시그니처 검증만으로 통과한 프레임 수
+        self.redetections = 0  # 검증 실패로 다시 감지한 횟수
+        self.flagged = False  # 마지막 프레임이 검증/재감지 모두 실패 (저장된 윤곽선 유지, 검사 제외 대상)
+        self.pattern_changes = 0  # 패널 안쪽 밝기 변화로 판단한 패턴 전환 횟수
+
+    @property
+    def is_locked(self) -> bool:
+        """잠긴 패널 윤곽선이 있는지 여부"""
+        return self.contour is not None
+
+    def unlock(self):
+        """잠금 해제"""
+        self.contour = None
+        self.inside_index = None
+        self.outside_index = None
+        self.signature = None
+
+    def lock(self, frame: Optional[np.ndarray], contour: np.ndarray):
+        """
+        패널 윤곽선 잠금
+
+        Args:
+            frame: 시그니처를 기록할 프레임 (None이면 다음 update 프레임에서 기록)
+            contour: 패널 윤곽선
+        """
+        self.contour = np.asarray(contour, dtype=np.int32).reshape(-1, 1, 2)
+        self.inside_index, self.outside_index = self._sample_indices(self.contour)
+        self.signature = None
+        if frame is not None:
+            self.signature = self._measure(frame)
+
+    def update(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """
+        새 프레임에서 잠긴 패널 윤곽선 확인
+
+        Args:
+            frame: 입력 프레임 (BGR 또는 그레이스케일)
+
+        검증과 재감지가 모두 실패하면 (패널이 가려졌거나 조명이 바뀐 경우 등)
+        잠금을 풀지 않고 저장된 윤곽선을 유지한 채 flagged를 설정합니다.
+
+        Returns:
+            np.ndarray: 패널 윤곽선 (잠긴 윤곽선 또는 다시 감지한 윤곽선), 잠금 전 감지 실패 시 None
+        """
+        self.flagged = False
+        if frame is None:
+            return None
+
+        if self.contour is not None:
+            if self.signature is None:
+                # 캘리브레이션 파일에 시그니처가 없으면 첫 프레임을 기준으로 기록
+                self.signature = self._measure(frame)
+                return self.contour
+            if self.validate(frame):
+                self.validations += 1
+                return self.contour
+
+        # 잠금 전이거나 패널이 움직임 → 다시 감지 후 재잠금
+        self.redetections += 1
+        contour = self.detector(frame)
+        if contour is None:
+            if self.contour is None:
+                return None
+            self.flagged = True
+            return self.contour
+        self.lock(frame, contour)
+        return self.contour
+
+    def validate(self, frame: np.ndarray) -> bool:
+        """
+        경계 픽셀 밝기를 저장된 시그니처와 비교
+
+        바깥쪽(지그/배경) 밝기만 판정에 사용합니다. 패널이 움직이면 바깥쪽 샘플에
+        패널 화면이 들어오지만, 패턴만 바뀌면 (지그보다 어두운 패턴 포함) 바깥쪽은 그대로입니다.
+        바깥쪽이 일치하는데 안쪽이 달라졌으면 패턴 전환으로 보고 안쪽 시그니처를 갱신합니다.
+
+        Returns:
+            bool: 네 변 모두 바깥쪽 일치 비율이 min_agreement 이상이면 True
+        """
+        if self.signature is None:
+            return False
+
+        current = self._measure(frame)
+        outside_ok = np.abs(current['outside'] - self.signature['outside']) <= self.tolerance
+        agreement = np.mean(outside_ok, axis=1)
+        if not np.all(agreement >= self.min_agreement):
+            return False
+
+        if np.mean(np.abs(current['inside'] - self.signature['inside']) > self.tolerance) > 1 - self.min_agreement:
+            self.signature['inside'] = current['inside']
+            self.pattern_changes += 1
+        return True
+
+    def to_dict(self) -> Optional[Dict]:
+        """캘리브레이션 파일 저장용 시그니처 (잠금 전이면 None)"""
+        if self.signature is None:
+            return None
+        return {
+            'margin': self.margin,
+            'samples': self.samples,
+            'inside': self.signature['inside'].tolist(),
+            'outside': self.signature['outside'].tolist()
+        }
+
+    def load(self, contour: np.ndarray, data: Optional[Dict] = None) -> bool:
+        """
+        캘리브레이션 파일의 윤곽선과 시그니처로 잠금 (감지 없이 바로 사용)
+
+        Args:
+            contour: 저장된 패널 윤곽선
+            data: to_dict 결과 (없거나 샘플 설정이 다르면 다음 프레임에서 기록)
+
+        Returns:
+            bool: 저장된 시그니처를 사용했는지 여부
+        """
+        self.lock(None, contour)
+        if not data or data.get('margin') != self.margin or data.get('samples') != self.samples:
+            return False
+        self.signature = {
+            'inside': np.array(data['inside'], dtype=np.float32),
+            'outside': np.array(data['outside'], dtype=np.float32)
+        }
+        return True
+
+    def _sample_indices(self, contour: np.ndarray):
+        """네 변을 따라 안쪽/바깥쪽 샘플 픽셀 인덱스 계산 (잠글 때 한 번만)"""
+        corners = contour_to_corners(contour)
+        t = np.linspace(0.15, 0.85, self.samples, dtype=np.float32)
+        spread = np.arange(-2, 3, dtype=np.float32)  # 변 방향으로 5픽셀 평균
+
+        inside, outside = [], []
+        for i in range(4):
+            start, end = corners[i], corners[(i + 1) % 4]
+            direction = (end - start) / max(float(np.linalg.norm(end - start)), 1e-6)
+            normal = np.array([-direction[1], direction[0]], dtype=np.float32)  # 패널 안쪽 방향
+            bases = start[None, :] + t[:, None] * (end - start)[None, :]
+            points = bases[:, None, :] + spread[None, :, None] * direction[None, None, :]
+            inside.append(points + self.margin * normal)
+            outside.append(points - self.margin * normal)
+
+        return self._to_index(np.array(inside)), self._to_index(np.array(outside))
+
+    @staticmethod
+    def _to_index(points: np.ndarray):
+        """(x, y) 좌표를 반올림한 (y, x) 정수 인덱스"""
+        points = np.round(points).astype(np.int64)
+        return points[..., 1], points[..., 0]
+
+    def _measure(self, frame: np.ndarray) -> Dict[str, np.ndarray]:
+        """샘플 위치 밝기 평균 (안쪽/바깥쪽, 변 × 샘플)"""
+        height, width = frame.shape[:2]
+        values = {}
+        for name, (ys, xs) in (('inside', self.inside_index), ('outside', self.outside_index)):
+            pixels = frame[np.clip(ys, 0, height - 1), np.clip(xs, 0, width - 1)].astype(np.float32)
+            if pixels.ndim == 4:
+                pixels = pixels @ GRAY_WEIGHTS
+            values[name] = pixels.mean(axis=-1)
+        return values
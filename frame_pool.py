@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프레임 버퍼 풀 모듈
+Frame Buffer Pool Module
+
+미리 할당한 프레임 버퍼를 재사용하여 cap.read(image=...) / cv2.cvtColor(dst=...)가
+같은 메모리에 쓰도록 하고, 참조 카운트로 빌려간 버퍼가 모두 반납되면 풀로 되돌림
+(정상 상태 캡처에서 프레임당 메모리 할당 없음)
+"""
+
+import threading
+import numpy as np
+from typing import List, Optional, Tuple
+
+
+class PooledFrame:
+    """참조 카운트가 있는 풀 버퍼 (마지막 release에서 풀로 반납)"""
+
+    def __init__(self, pool: 'FramePool', array: np.ndarray):
+        self.pool = pool
+        self.array = array
+        self.refcount = 0
+
+    def retain(self) -> 'PooledFrame':
+        """참조 추가 (소비자가 빌려갈 때)"""
+        with self.pool.lock:
+            if self.refcount <= 0:
+                raise RuntimeError("이미 반납된 프레임 버퍼입니다.")
+            self.refcount += 1
+        return self
+
+    def release(self):
+        """참조 해제 (0이 되면 풀로 반납)"""
+        self.pool._release(self)
+
+    def __enter__(self) -> np.ndarray:
+        return self.array
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class FramePool:
+    """고정 크기 프레임 버퍼 풀"""
+
+    def __init__(self, shape: Tuple[int, ...], dtype=np.uint8, size: int = 4):
+        """
+        버퍼 풀 초기화
+
+        Args:
+            shape: 버퍼 형태 (height, width, channels)
+            dtype: 버퍼 자료형
+            size: 미리 할당할 버퍼 수
+        """
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.lock = threading.Lock()
+        self.free: List[PooledFrame] = []
+        self.allocations = 0  # 지금까지 할당한 버퍼 수 (정상 상태에서는 증가하지 않음)
+        for _ in range(size):
+            self.free.append(self._allocate())
+
+    def acquire(self) -> PooledFrame:
+        """
+        빈 버퍼 가져오기 (참조 카운트 1, 풀이 비었으면 새로 할당)
+
+        Returns:
+            PooledFrame: 호출자가 소유한 버퍼 (사용 후 release)
+        """
+        with self.lock:
+            frame = self.free.pop() if self.free else None
+        if frame is None:
+            frame = self._allocate()
+        frame.refcount = 1
+        return frame
+
+    def matches(self, array: Optional[np.ndarray]) -> bool:
+        """배열이 이 풀의 버퍼와 같은 형태인지 여부"""
+        return array is not None and array.shape == self.shape and array.dtype == self.dtype
+
+    @property
+    def available(self) -> int:
+        """반납되어 바로 쓸 수 있는 버퍼 수"""
+        with self.lock:
+            return len(self.free)
+
+    def _allocate(self) -> PooledFrame:
+        """새 버퍼 할당"""
+        with self.lock:
+            self.allocations += 1
+        return PooledFrame(self, np.empty(self.shape, dtype=self.dtype))
+
+    def _release(self, frame: PooledFrame):
+        """참조 해제, 0이 되면 빈 버퍼 목록에 추가"""
+        with self.lock:
+            if frame.refcount <= 0:
+                raise RuntimeError("이미 반납된 프레임 버퍼입니다.")
+            frame.refcount -= 1
+            if frame.refcount == 0:
+                self.free.append(frame)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프레임 품질 게이트 모듈
+Frame Quality Gate Module
+
+축소 프레임에서 초점(Laplacian 분산), 포화 픽셀 비율, 이전 프레임과의 블록 밝기 차이를 계산하여
+모션 블러/과노출/패턴 전환 중 프레임을 스크래치·불량화소 검사 전에 걸러냄
+(검사 CPU 절약 및 잘못된 불량 판정 제거)
+"""
+
+import cv2
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+
+class FrameQualityGate:
+    """검사 전 프레임 품질 판정 클래스"""
+
+    def __init__(self, width: int = 320, clip_level: int = 250, max_clipped: float = 0.02,
+                 max_change: float = 8.0, focus_ratio: float = 0.5, min_texture: float = 20.0,
+                 reference_rate: float = 0.1, max_focus_rejects: int = 10):
+        """
+        품질 게이트 초기화
+
+        Args:
+            width: 판정용 축소 프레임 가로 크기
+            clip_level: 포화로 보는 채널값
+            max_clipped: 허용 포화 픽셀 비율
+            max_change: 허용 이전 프레임 블록 밝기 차이 평균 (패턴 전환/움직임)
+            focus_ratio: 기준 초점값 대비 허용 최소 비율 (모션 블러)
+            min_texture: 초점 판정에 필요한 최소 기준 초점값 (단색 패턴은 초점 판정 생략)
+            reference_rate: 통과 프레임으로 기준 초점값을 갱신하는 비율
+            max_focus_rejects: 연속 초점 제외 한도 (도달하면 현재 초점값으로 기준 재설정,
+                               블러가 아니라 질감이 적은 패턴으로 바뀐 경우의 영구 제외 방지)
+        """
+        self.width = width
+        self.clip_level = clip_level
+        self.max_clipped = max_clipped
+        self.max_change = max_change
+        self.focus_ratio = focus_ratio
+        self.min_texture = min_texture
+        self.reference_rate = reference_rate
+        self.max_focus_rejects = max_focus_rejects
+
+        self.reference_focus = None  # 통과 프레임 초점값 지수 평균
+        self.focus_rejects = 0  # 연속 초점 제외 프레임 수
+        self.small = None  # 축소 프레임 재사용 버퍼
+        self.gray = None
+        self.coarse = None  # 8x8 블록 평균 밝기 (노이즈/초점에 둔감한 전환 판정용)
+        self.previous = None  # 이전 프레임 블록 평균 밝기
+        self.checked = 0
+        self.rejected = {'clipped': 0, 'change': 0, 'focus': 0}
+
+    def reset(self):
+        """이전 프레임/기준 초점값 초기화 (패턴, 패널 위치나 카메라 설정이 바뀐 경우)"""
+        self.reference_focus = None
+        self.focus_rejects = 0
+        self.previous = None
+
+    def check(self, frame: np.ndarray,
+              region: Optional[Tuple[int, int, int, int]] = None) -> Tuple[bool, Dict]:
+        """
+        프레임 품질 판정
+
+        Args:
+            frame: 검사할 프레임 (BGR 또는 RGB)
+            region: 판정 영역 (x, y, w, h), None이면 전체 프레임
+
+        Returns:
+            (통과 여부, 지표 딕셔너리: focus, clipped, change, reason)
+        """
+        if region is not None:
+            x, y, w, h = [int(v) for v in region]
+            frame = frame[max(y, 0):y + h, max(x, 0):x + w]
+        if frame.size == 0:
+            return False, {'reason': 'empty'}
+
+        # 가로 width 기준 축소 (크기가 같으면 버퍼 재사용)
+        height = max(1, int(round(frame.shape[0] * self.width / frame.shape[1])))
+        shape = (height, self.width) + frame.shape[2:]
+        if self.small is None or self.small.shape != shape:
+            self.small = np.empty(shape, dtype=frame.dtype)
+            self.gray = np.empty(shape[:2], dtype=frame.dtype)
+            self.coarse = np.empty((max(1, height // 8), self.width // 8), dtype=frame.dtype)
+            self.previous = None
+        cv2.resize(frame, (self.width, height), dst=self.small, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(self.small, cv2.COLOR_BGR2GRAY, dst=self.gray) if self.small.ndim == 3 else self.small
+
+        clipped = float(np.count_nonzero(self.small >= self.clip_level)) / self.small.size
+        _, std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))
+        focus = float(std[0, 0] ** 2)
+
+        cv2.resize(gray, self.coarse.shape[::-1], dst=self.coarse, interpolation=cv2.INTER_AREA)
+        change = float(cv2.mean(cv2.absdiff(self.coarse, self.previous))[0]) if self.previous is not None else 0.0
+        if self.previous is None:
+            self.previous = self.coarse.copy()
+        else:
+            np.copyto(self.previous, self.coarse)
+
+        reason = None
+        if clipped > self.max_clipped:
+            reason = 'clipped'
+        elif change > self.max_change:
+            reason = 'change'
+        elif (self.reference_focus is not None and self.reference_focus >= self.min_texture
+              and focus < self.reference_focus * self.focus_ratio):
+            reason = 'focus'
+
+        self.checked += 1
+        if reason is None:
+            self.focus_rejects = 0
+            if self.reference_focus is None:
+                self.reference_focus = focus
+            else:
+                self.reference_focus += (focus - self.reference_focus) * self.reference_rate
+        else:
+            self.rejected[reason] += 1
+            if reason == 'change':
+                # 장면이 바뀌었으므로 이전 패턴의 초점 기준은 버리고 다음 통과 프레임으로 다시 설정
+                self.reference_focus = None
+                self.focus_rejects = 0
+            elif reason == 'focus':
+                self.focus_rejects += 1
+                if self.focus_rejects >= self.max_focus_rejects:
+                    self.reference_focus = focus
+                    self.focus_rejects = 0
+
+        return reason is None, {'focus': focus, 'clipped': clipped, 'change': change, 'reason': reason}
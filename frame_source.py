@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프레임 소스 모듈
+Frame Source Module
+
+카메라와 재생 소스(동영상 파일, 이미지 폴더, .npy 스택)를 같은 인터페이스로 사용
+(cv2.VideoCapture와 같은 read/isOpened/release/get/set을 제공하므로 기존 카메라 루프에
+그대로 넣을 수 있고, 카메라 없는 환경에서 전체 파이프라인 실행/벤치마크/회귀 테스트 가능)
+"""
+
+import os
+import time
+from abc import ABC, abstractmethod
+import cv2
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
+
+
+SOURCE_ENV = 'FRAME_SOURCE'  # 기본 프레임 소스 지정 환경 변수 (카메라 번호 또는 재생 경로)
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff')
+
+
+class FrameSource(ABC):
+    """프레임 소스 인터페이스"""
+
+    timestamp = None  # 마지막 프레임 시각 (초)
+
+    @abstractmethod
+    def connect(self) -> bool:
+        """소스 열기"""
+
+    @abstractmethod
+    def disconnect(self):
+        """소스 닫기"""
+
+    @abstractmethod
+    def is_connected(self) -> bool:
+        """소스가 열려 있는지 여부"""
+
+    @abstractmethod
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        다음 BGR 프레임 읽기
+
+        Args:
+            image: 결과를 쓸 재사용 버퍼 (크기가 맞으면 새로 할당하지 않음)
+
+        Returns:
+            (성공 여부, 프레임)
+        """
+
+    # cv2.VideoCapture 호환
+    def isOpened(self) -> bool:
+        return self.is_connected()
+
+    def release(self):
+        self.disconnect()
+
+    def get(self, prop_id: int) -> float:
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return False
+
+
+class ReplaySource(FrameSource):
+    """
+    재생 소스 공통 클래스
+
+    타임스탬프는 프레임 번호 / fps로 결정되어 실행할 때마다 같고,
+    realtime=False이면 fps 대기 없이 최대한 빠르게 읽습니다.
+    loop=False이면 마지막 프레임 이후 read가 (False, None)을 반환하고 eof가 True가 됩니다.
+    """
+
+    def __init__(self, fps: float = 30.0, realtime: bool = True, loop: bool = False):
+        """
+        재생 소스 초기화
+
+        Args:
+            fps: 재생 프레임 레이트 (타임스탬프 간격)
+            realtime: fps에 맞춰 읽기 속도 조절 여부 (False면 최대 속도)
+            loop: 끝에 도달하면 처음부터 다시 재생
+        """
+        self.fps = fps
+        self.realtime = realtime
+        self.loop = loop
+        self.opened = False
+        self.index = 0  # 다음에 읽을 프레임 번호
+        self.eof = False  # 끝까지 재생함 (loop=False, seek로 해제)
+        self.timestamp = None
+        self.frame_shape = None
+        self.clock_start = None  # realtime 재생 기준 (monotonic 시각, 시작 프레임 번호)
+
+    @property
+    @abstractmethod
+    def frame_count(self) -> int:
+        """전체 프레임 수"""
+
+    def connect(self) -> bool:
+        self.opened = self._open()
+        self.seek(0)
+        return self.opened
+
+    def disconnect(self):
+        if self.opened:
+            self._close()
+        self.opened = False
+
+    def is_connected(self) -> bool:
+        return self.opened
+
+    def seek(self, index: int):
+        """재생 위치 이동"""
+        self.index = max(0, int(index))
+        self.eof = False
+        self.clock_start = None
+        if self.opened:
+            self._seek(self.index)
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self.opened:
+            return False, None
+
+        frame = self._read_frame(self.index, image)
+        if frame is None and self.loop and self.index > 0:
+            self.seek(0)
+            frame = self._read_frame(self.index, image)
+        if frame is None:
+            self.eof = True
+            return False, None
+
+        if frame.ndim == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        if image is not None and frame is not image and image.shape == frame.shape and image.dtype == frame.dtype:
+            np.copyto(image, frame)
+            frame = image
+
+        if self.realtime:
+            # 시작 시점 기준으로 프레임 간격을 맞춤 (지연이 누적되지 않음)
+            if self.clock_start is None:
+                self.clock_start = (time.monotonic(), self.index)
+            start_time, start_index = self.clock_start
+            delay = start_time + (self.index - start_index) / self.fps - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        self.timestamp = self.index / self.fps
+        self.frame_shape = frame.shape
+        self.index += 1
+        return True, frame
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.index)
+        if prop_id == cv2.CAP_PROP_POS_MSEC:
+            return (self.timestamp or 0.0) * 1000.0
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self.frame_count)
+        if prop_id == cv2.CAP_PROP_FPS:
+            return float(self.fps)
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH and self.frame_shape is not None:
+            return float(self.frame_shape[1])
+        if prop_id == cv2.CAP_PROP_FRAME_HEIGHT and self.frame_shape is not None:
+            return float(self.frame_shape[0])
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        # 재생 위치 외의 카메라 설정(해상도/노출 등)은 무시
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            self.seek(int(value))
+            return True
+        return False
+
+    def _open(self) -> bool:
+        return True
+
+    def _close(self):
+        pass
+
+    def _seek(self, index: int):
+        pass
+
+    @abstractmethod
+    def _read_frame(self, index: int, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """index번 프레임 (없으면 None)"""
+
+
+class VideoFileSource(ReplaySource):
+    """동영상 파일 재생 소스"""
+
+    def __init__(self, path: str, fps: Optional[float] = None, realtime: bool = True, loop: bool = False):
+        """
+        Args:
+            path: 동영상 파일 경로
+            fps: 재생 프레임 레이트 (None이면 파일의 fps, 없으면 30)
+            realtime: fps에 맞춰 읽기 속도 조절 여부
+            loop: 반복 재생 여부
+        """
+        super().__init__(fps or 30.0, realtime, loop)
+        self.path = path
+        self.requested_fps = fps
+        self.capture = None
+        self.position = 0  # 디코더의 다음 프레임 번호
+
+    @property
+    def frame_count(self) -> int:
+        return int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT)) if self.capture is not None else 0
+
+    def _open(self) -> bool:
+        self.capture = cv2.VideoCapture(self.path)
+        if not self.capture.isOpened():
+            self.capture = None
+            return False
+        if self.requested_fps is None:
+            self.fps = self.capture.get(cv2.CAP_PROP_FPS) or 30.0
+        return True
+
+    def _close(self):
+        self.capture.release()
+        self.capture = None
+
+    def _seek(self, index: int):
+        self.capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+        self.position = index
+
+    def _read_frame(self, index: int, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if index != self.position:
+            self._seek(index)
+        ret, frame = self.capture.read(image) if image is not None else self.capture.read()
+        if not ret:
+            return None
+        self.position += 1
+        return frame
+
+
+class ImageDirectorySource(ReplaySource):
+    """이미지 폴더 재생 소스 (파일 이름 순)"""
+
+    def __init__(self, directory: str, fps: float = 30.0, realtime: bool = True, loop: bool = False,
+                 extensions: Sequence[str] = IMAGE_EXTENSIONS):
+        """
+        Args:
+            directory: 이미지 폴더 경로
+            fps: 재생 프레임 레이트
+            realtime: fps에 맞춰 읽기 속도 조절 여부
+            loop: 반복 재생 여부
+            extensions: 읽을 이미지 확장자
+        """
+        super().__init__(fps, realtime, loop)
+        self.directory = directory
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.files = []
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.files)
+
+    def _open(self) -> bool:
+        if not os.path.isdir(self.directory):
+            return False
+        self.files = sorted(os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                            if name.lower().endswith(self.extensions))
+        return bool(self.files)
+
+    def _read_frame(self, index: int, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if index >= len(self.files):
+            return None
+        frame = cv2.imread(self.files[index], cv2.IMREAD_COLOR)
+        if frame is None:
+            print(f"이미지 읽기 오류: {self.files[index]}")
+        return frame
+
+
+class NpyStackSource(ReplaySource):
+    """.npy 프레임 스택 재생 소스 ((N, H, W[, 3]) uint8, 메모리 매핑으로 읽음)"""
+
+    def __init__(self, path: str, fps: float = 30.0, realtime: bool = True, loop: bool = False):
+        """
+        Args:
+            path: .npy 파일 경로
+            fps: 재생 프레임 레이트
+            realtime: fps에 맞춰 읽기 속도 조절 여부
+            loop: 반복 재생 여부
+        """
+        super().__init__(fps, realtime, loop)
+        self.path = path
+        self.stack = None
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.stack) if self.stack is not None else 0
+
+    def _open(self) -> bool:
+        try:
+            self.stack = np.load(self.path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            print(f"프레임 스택 로드 오류: {e}")
+            return False
+        return self.stack.ndim in (3, 4) and len(self.stack) > 0
+
+    def _close(self):
+        self.stack = None
+
+    def _read_frame(self, index: int, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if index >= len(self.stack):
+            return None
+        frame = self.stack[index]
+        if image is not None and image.shape == frame.shape and image.dtype == frame.dtype:
+            np.copyto(image, frame)
+            return image
+        return np.array(frame)
+
+
+def default_source(camera_index: int = 0) -> Union[int, str]:
+    """FRAME_SOURCE 환경 변수가 있으면 그 값, 없으면 카메라 번호"""
+    return os.environ.get(SOURCE_ENV) or camera_index
+
+
+def create_frame_source(source: Union[int, str], **kwargs) -> Union[FrameSource, cv2.VideoCapture]:
+    """
+    소스 지정값에 맞는 프레임 소스 생성 (열지 않음)
+
+    Args:
+        source: 카메라 번호, 동영상 파일, 이미지 폴더 또는 .npy 파일 경로
+        **kwargs: 재생 소스 옵션 (fps, realtime, loop)
+
+    Returns:
+        재생 소스 또는 cv2.VideoCapture (카메라 번호)
+    """
+    if isinstance(source, int) or str(source).isdigit():
+        return cv2.VideoCapture(int(source))
+    if os.path.isdir(source):
+        return ImageDirectorySource(source, **kwargs)
+    if str(source).lower().endswith('.npy'):
+        return NpyStackSource(source, **kwargs)
+    return VideoFileSource(source, **kwargs)
+
+
+def open_capture(source: Optional[Union[int, str, FrameSource]] = None,
+                 **kwargs) -> Union[FrameSource, cv2.VideoCapture]:
+    """
+    cv2.VideoCapture(0) 대신 사용하는 프레임 소스 열기
+
+    Args:
+        source: 카메라 번호, 재생 경로 또는 FrameSource (None이면 FRAME_SOURCE 환경 변수, 없으면 0번 카메라)
+        **kwargs: 재생 소스 옵션 (fps, realtime, loop)
+
+    Returns:
+        열린 프레임 소스 (실패 시 isOpened()가 False)
+    """
+    if source is None:
+        source = default_source()
+    if isinstance(source, FrameSource):
+        capture = source
+    else:
+        capture = create_frame_source(source, **kwargs)
+    if isinstance(capture, FrameSource) and not capture.is_connected():
+        capture.connect()
+    return capture
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프레임 누적 모듈
+Frame Stacking Module
+
+정지한 패널을 연속 N프레임 누적 평균하여 센서 노이즈를 줄임
+(float32 누적 버퍼에 cv2.accumulate/accumulateWeighted로 제자리 누적,
+ 박스카 창은 N프레임 링 버퍼, 지수 창은 누적 버퍼 하나로 메모리 고정)
+"""
+
+import math
+import cv2
+import numpy as np
+from typing import Optional
+
+STACK_WINDOWS = ('boxcar', 'exponential')
+
+
+class FrameStacker:
+    """N프레임 누적 평균 클래스"""
+
+    def __init__(self, frames: int = 8, window: str = 'boxcar', alpha: Optional[float] = None):
+        """
+        프레임 누적 초기화
+
+        Args:
+            frames: 누적 프레임 수 (박스카 창 길이, 지수 창은 준비 프레임 수)
+            window: 'boxcar' (최근 N프레임 균등 평균) 또는 'exponential' (지수 가중 평균)
+            alpha: 지수 창 가중치 (None이면 N프레임 박스카와 같은 지연인 2/(N+1))
+        """
+        if window not in STACK_WINDOWS:
+            raise ValueError(f"지원하지 않는 누적 창: {window}")
+        if frames < 1:
+            raise ValueError("누적 프레임 수는 1 이상이어야 합니다.")
+        self.frames = frames
+        self.window = window
+        self.alpha = alpha if alpha is not None else 2.0 / (frames + 1)
+        self.accumulator = None  # float32 누적 버퍼
+        self.ring = None  # 박스카 창의 uint8 프레임 링 버퍼 (frames장)
+        self.count = 0  # 누적된 프레임 수 (창 길이에서 멈춤)
+        self.position = 0  # 링 버퍼에서 다음에 덮어쓸 위치
+
+    @property
+    def ready(self) -> bool:
+        """창이 모두 채워졌는지 여부"""
+        return self.count >= self.frames
+
+    @property
+    def noise_factor(self) -> float:
+        """단일 프레임 대비 평균 프레임의 노이즈 표준편차 비율 (검출 임계값 조정 기준)"""
+        if self.window == 'boxcar':
+            return 1.0 / math.sqrt(max(self.count, 1))
+        return math.sqrt(self.alpha / (2.0 - self.alpha))
+
+    def reset(self):
+        """누적 초기화 (패널/패턴이 바뀌었을 때, 버퍼는 재사용)"""
+        self.count = 0
+        self.position = 0
+
+    def add(self, frame: np.ndarray) -> bool:
+        """
+        프레임 누적
+
+        Args:
+            frame: uint8 프레임 (이전 프레임과 같은 크기, 크기가 바뀌면 다시 시작)
+
+        Returns:
+            bool: 창이 모두 채워졌는지 여부
+        """
+        if self.accumulator is None or self.accumulator.shape != frame.shape:
+            self.accumulator = np.zeros(frame.shape, dtype=np.float32)
+            self.ring = np.empty((self.frames,) + frame.shape, dtype=frame.dtype) if self.window == 'boxcar' else None
+            self.reset()
+
+        if self.window == 'exponential':
+            if self.count == 0:
+                np.copyto(self.accumulator, frame)
+            else:
+                cv2.accumulateWeighted(frame, self.accumulator, self.alpha)
+            self.count = min(self.count + 1, self.frames)
+            return self.ready
+
+        # 박스카: 가장 오래된 프레임을 빼고 새 프레임을 더함 (정수 합이라 float32에서도 오차 누적 없음)
+        if self.count == 0:
+            self.accumulator.fill(0)
+        oldest = self.ring[self.position]
+        if self.count >= self.frames:
+            cv2.subtract(self.accumulator, oldest, dst=self.accumulator, dtype=cv2.CV_32F)
+        else:
+            self.count += 1
+        cv2.accumulate(frame, self.accumulator)
+        np.copyto(oldest, frame)
+        self.position = (self.position + 1) % self.frames
+        return self.ready
+
+    def average(self, dst: Optional[np.ndarray] = None, dtype=np.uint8) -> Optional[np.ndarray]:
+        """
+        누적 평균 프레임
+
+        Args:
+            dst: 결과를 쓸 재사용 버퍼
+            dtype: np.uint8 (반올림) 또는 np.float32 (소수 밝기 유지)
+
+        Returns:
+            평균 프레임 또는 None (누적된 프레임 없음)
+        """
+        if self.count == 0:
+            return None
+        scale = 1.0 / self.count if self.window == 'boxcar' else 1.0
+        if dst is None or dst.shape != self.accumulator.shape or dst.dtype != np.dtype(dtype):
+            dst = np.empty(self.accumulator.shape, dtype=dtype)
+        if dst.dtype == np.uint8:
+            cv2.convertScaleAbs(self.accumulator, dst=dst, alpha=scale)
+        else:
+            np.multiply(self.accumulator, scale, out=dst)
+        return dst
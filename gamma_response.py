@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+감마 / 계조 응답 측정 모듈
+Gamma / Grayscale Response Measurement Module
+
+계단형 계조 패턴(TestPatternGenerator.generate_pixel_defect_test) 또는
+전체 화면 계조 캡처 시퀀스로부터 패널의 톤 응답 곡선, 감마, 선형성을 측정
+"""
+
+import cv2
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+from histogram_statistics import HistogramStatistics
+from test_pattern_generator import TestPatternGenerator
+
+
+class GammaResponseAnalyzer:
+    """감마 / 계조 응답 분석 클래스"""
+
+    def __init__(self, levels: Optional[Sequence[int]] = None, target_gamma: float = 2.2):
+        """
+        감마 응답 분석기 초기화
+
+        Args:
+            levels: 패턴 계조 레벨 목록 (기본값: TestPatternGenerator.GRAY_LEVELS)
+            target_gamma: 목표 감마 값
+        """
+        self.levels = list(levels) if levels is not None else list(TestPatternGenerator.GRAY_LEVELS)
+        self.target_gamma = target_gamma
+        self.band_margin = 0.2  # 밴드 경계에서 제외할 비율
+        self.sequence_stats: Dict[int, HistogramStatistics] = {}
+
+    def locate_bands(self, gray: np.ndarray) -> List[tuple]:
+        """
+        보정된 캡처 영상에서 계조 밴드 위치 찾기
+
+        패턴 기하 구조로 예상한 경계 주변에서 행 평균 프로파일의
+        최대 기울기 위치로 경계를 보정합니다.
+
+        Args:
+            gray: 그레이스케일 패널 영상 (원근 보정 완료)
+
+        Returns:
+            밴드별 (y1, y2) 목록
+        """
+        height = gray.shape[0]
+        num_bands = len(self.levels)
+        section_height = height / num_bands
+
+        # 행 평균 프로파일 (한 번의 reduce)
+        profile = cv2.reduce(gray, 1, cv2.REDUCE_AVG, dtype=cv2.CV_32F).ravel()
+        gradient = np.abs(np.diff(profile))
+
+        boundaries = [0]
+        search = max(1, int(section_height / 3))
+        for i in range(1, num_bands):
+            expected = int(round(i * section_height))
+            lo = max(boundaries[-1] + 1, expected - search)
+            hi = min(len(gradient), expected + search)
+            if hi > lo:
+                boundaries.append(lo + int(np.argmax(gradient[lo:hi])) + 1)
+            else:
+                boundaries.append(expected)
+        boundaries.append(height)
+
+        return list(zip(boundaries[:-1], boundaries[1:]))
+
+    def measure_stepped_pattern(self, image: np.ndarray) -> Dict:
+        """
+        계단형 계조 패턴 캡처로 응답 곡선 측정
+
+        Args:
+            image: 원근 보정된 패널 영상 (BGR 또는 그레이스케일)
+
+        Returns:
+            응답 곡선 및 감마 분석 결과
+        """
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        bands = self.locate_bands(gray)
+
+        # 경계 영역을 제외한 동일 크기의 밴드 내부 영역을 쌓아 한 번에 통계 계산
+        width = gray.shape[1]
+        inner_height = min(y2 - y1 for y1, y2 in bands)
+        trim_y = int(inner_height * self.band_margin)
+        trim_x = int(width * self.band_margin / 2)
+        inner_height -= 2 * trim_y
+        if inner_height <= 0 or width - 2 * trim_x <= 0:
+            raise ValueError("계조 밴드가 너무 작습니다")
+
+        stack = np.stack([
+            gray[y1 + trim_y:y1 + trim_y + inner_height, trim_x:width - trim_x]
+            for y1, _ in bands
+        ]).reshape(len(bands), -1)
+
+        q25, median, q75 = np.percentile(stack, [25, 50, 75], axis=1)
+
+        result = self.fit_response(median)
+        result['bands'] = [
+            {
+                'level': level,
+                'y_range': (int(y1), int(y2)),
+                'median': float(m),
+                'iqr': float(hi - lo)
+            }
+            for level, (y1, y2), m, lo, hi in zip(self.levels, bands, median, q25, q75)
+        ]
+        return result
+
+    def add_gray_capture(self, image: np.ndarray, level: int, mask: Optional[np.ndarray] = None):
+        """
+        전체 화면 계조 캡처 누적 (프레임은 보관하지 않고 히스토그램만 누적)
+
+        Args:
+            image: 캡처 영상 (BGR 또는 그레이스케일)
+            level: 표시한 계조 레벨 (0-255)
+            mask: 패널 영역 마스크 (선택사항)
+        """
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        if level not in self.sequence_stats:
+            self.sequence_stats[level] = HistogramStatistics(1)
+        self.sequence_stats[level].update(gray, mask)
+
+    def reset_sequence(self):
+        """누적된 계조 캡처 초기화"""
+        self.sequence_stats.clear()
+
+    def measure_sequence(self) -> Dict:
+        """
+        누적된 전체 화면 계조 캡처로 응답 곡선 측정
+
+        Returns:
+            응답 곡선 및 감마 분석 결과 (마스크가 비어 픽셀이 누적되지 않은 레벨은 제외)
+        """
+        levels = [level for level in sorted(self.sequence_stats) if self.sequence_stats[level].total() > 0]
+        if len(levels) < 3:
+            raise ValueError("감마 측정에는 최소 3개 계조 레벨이 필요합니다")
+
+        stats = [self.sequence_stats[level].channel_stats() for level in levels]
+        medians = np.array([s['median'] for s in stats])
+
+        result = self.fit_response(medians, levels)
+        result['bands'] = [
+            {
+                'level': level,
+                'median': s['median'],
+                'iqr': s['percentiles'][75.0] - s['percentiles'][25.0],
+                'pixel_count': s['count']
+            }
+            for level, s in zip(levels, stats)
+        ]
+        return result
+
+    def fit_response(self, measured: Sequence[float], levels: Optional[Sequence[int]] = None) -> Dict:
+        """
+        측정값으로 감마와 선형성 피팅
+
+        정규화 응답 L = (Y - Y_min) / (Y_max - Y_min), 입력 V = level / 255 에 대해
+        log L = gamma * log V 를 최소자승으로 피팅합니다.
+
+        Args:
+            measured: 레벨별 측정 밝기
+            levels: 입력 계조 레벨 (기본값: self.levels)
+
+        Returns:
+            감마 / 선형성 결과
+        """
+        levels = np.asarray(self.levels if levels is None else levels, dtype=np.float64)
+        measured = np.asarray(measured, dtype=np.float64)
+
+        order = np.argsort(levels)
+        levels = levels[order]
+        measured = measured[order]
+
+        black, white = measured[0], measured[-1]
+        span = white - black
+        if span <= 0:
+            raise ValueError("측정된 밝기 범위가 없습니다")
+
+        normalized = (measured - black) / span
+        inputs = levels / 255.0
+
+        # 양 끝 레벨과 0 이하 응답은 로그 피팅에서 제외
+        valid = (inputs > 0) & (inputs < 1) & (normalized > 0)
+        if np.count_nonzero(valid) >= 1:
+            log_v = np.log(inputs[valid])
+            log_l = np.log(normalized[valid])
+            gamma = float(np.dot(log_v, log_l) / np.dot(log_v, log_v))
+        else:
+            gamma = float('nan')
+
+        # 피팅된 곡선과의 편차 및 결정계수
+        fitted = np.power(inputs, gamma)
+        residual = normalized - fitted
+        total = np.sum((normalized - normalized.mean()) ** 2)
+        r_squared = float(1.0 - np.sum(residual ** 2) / total) if total > 0 else 0.0
+
+        return {
+            'levels': levels.astype(int).tolist(),
+            'measured': measured.tolist(),
+            'normalized': normalized.tolist(),
+            'gamma': gamma,
+            'gamma_error': gamma - self.target_gamma,
+            'r_squared': r_squared,
+            'max_deviation': float(np.max(np.abs(residual))),
+            'monotonic': bool(np.all(np.diff(measured) > 0)),
+            'contrast_ratio': float(white / black) if black > 0 else float('inf')
+        }
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+노출 브래킷 HDR 캡처 모듈
+Exposure-Bracketed HDR Capture Module
+
+작업 스레드가 카메라 노출을 2~3단계로 순환하며 브래킷 프레임을 모으고
+Mertens 노출 융합 또는 가중 평균으로 합쳐 검출기에 전달
+(스크래치는 밝은 영역, 데드픽셀은 어두운 영역의 디테일이 필요해 단일 노출로는 부족,
+ 캡처 스레드는 계속 돌기 때문에 GUI 미리보기는 원래 속도 유지)
+"""
+
+import threading
+import time
+import cv2
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+from camera_module import CameraModule
+from frame_source import FrameSource
+
+
+FUSION_METHODS = ('weighted', 'mertens')
+
+
+class HDRCapture(FrameSource):
+    """노출 브래킷 캡처 + 융합 클래스 (FrameSource로 융합 프레임 제공)"""
+
+    def __init__(self, camera: CameraModule, exposures: Sequence[float] = (-8, -6, -4),
+                 method: str = 'weighted', settle_frames: int = 2, sigma: float = 0.2):
+        """
+        HDR 캡처 초기화
+
+        Args:
+            camera: 캡처 스레드가 실행 중인 카메라 모듈
+            exposures: 순환할 노출값 목록 (2~3개, CAP_PROP_EXPOSURE 단위)
+            method: 융합 방식 ('weighted': 적정 노출 가중 평균, 'mertens': cv2 MergeMertens)
+            settle_frames: 노출 변경 후 버릴 프레임 수 (드라이버 반영 지연)
+            sigma: 가중 평균의 적정 노출 가중치 폭 (0~1 밝기 기준)
+        """
+        if not 2 <= len(exposures) <= 3:
+            raise ValueError("브래킷 노출은 2~3개여야 합니다.")
+        if method not in FUSION_METHODS:
+            raise ValueError(f"지원하지 않는 융합 방식: {method}")
+        self.camera = camera
+        self.exposures = list(exposures)
+        self.method = method
+        self.settle_frames = settle_frames
+        self.base_exposure = None  # 시작 전 노출값 (중지 시 복원)
+        self.base_auto_exposure = None  # 시작 시 중지한 자동 노출 제어기 (중지 시 다시 연결)
+
+        # 적정 노출(중간 밝기)일수록 큰 가중치 (uint8 밝기 → float32 LUT)
+        levels = np.arange(256, dtype=np.float32) / 255.0
+        self.weight_lut = (np.exp(-(levels - 0.5) ** 2 / (2 * sigma ** 2)) + 1e-4).astype(np.float32)
+        self.merge_mertens = cv2.createMergeMertens() if method == 'mertens' else None
+
+        # 브래킷/융합 버퍼 (첫 브래킷 크기로 할당 후 재사용)
+        self.brackets: List[np.ndarray] = []
+        self.gray = None
+        self.weight = None
+        self.weight_sum = None
+        self.product = None
+        self.accumulator = None
+        self.spare = None  # 다음 융합 결과를 쓸 버퍼 (게시된 결과와 교대)
+
+        self.worker = None
+        self.running = False
+        self.fused_condition = threading.Condition()
+        self.fused = None  # 최신 융합 프레임 (BGR uint8)
+        self.fused_seq = 0
+        self.fused_timestamp = None
+        self.read_seq = 0
+        self.timestamp = None
+        self.fusion_ms = 0.0  # 마지막 융합 소요 시간
+
+    def connect(self) -> bool:
+        """카메라 연결 (필요 시) 후 브래킷 작업 스레드 시작"""
+        if not self.camera.is_connected() and not self.camera.connect():
+            return False
+        return self.start()
+
+    def disconnect(self):
+        """브래킷 작업 중지 (카메라 연결은 유지)"""
+        self.stop()
+
+    def is_connected(self) -> bool:
+        return self.running and self.camera.is_connected()
+
+    def start(self) -> bool:
+        """브래킷 작업 스레드 시작"""
+        if self.running:
+            return True
+        if not self.camera.capture_running:
+            print("HDR 캡처 오류: 카메라 캡처 스레드가 실행 중이 아닙니다.")
+            return False
+        # 브래킷 노출을 자동 노출이 덮어쓰지 않도록 중지
+        self.base_auto_exposure = self.camera.auto_exposure
+        self.camera.disable_auto_exposure()
+        self.base_exposure = self.camera.cap.get(cv2.CAP_PROP_EXPOSURE)
+        self.running = True
+        self.worker = threading.Thread(target=self._bracket_loop, daemon=True, name="hdr_capture")
+        self.worker.start()
+        return True
+
+    def stop(self):
+        """브래킷 작업 중지 및 원래 노출/자동 노출 복원"""
+        self.running = False
+        if self.worker is not None:
+            self.worker.join(timeout=2.0)
+            self.worker = None
+        with self.fused_condition:
+            self.fused_condition.notify_all()
+        if self.base_exposure is not None and self.camera.is_connected():
+            self.camera.set_exposure(self.base_exposure)
+            if self.base_auto_exposure is not None:
+                # 같은 목표/옵션의 제어기를 복원한 노출에서 다시 수렴시킴
+                self.base_auto_exposure.reset()
+                self.camera.auto_exposure = self.base_auto_exposure
+        self.base_exposure = None
+        self.base_auto_exposure = None
+
+    def get_fused(self, after_seq: Optional[int] = None, timeout: float = 1.0, convert_to_rgb: bool = False,
+                  dst: Optional[np.ndarray] = None) -> Optional[Tuple[np.ndarray, int, float]]:
+        """
+        최신 융합 프레임 복사본
+
+        Args:
+            after_seq: 주어지면 이 순번보다 새로운 융합 프레임까지 대기 (timeout=0이면 대기 없음)
+            timeout: 최대 대기 시간 (초)
+            convert_to_rgb: BGR을 RGB로 변환할지 여부
+            dst: 결과를 쓸 재사용 버퍼
+
+        Returns:
+            (융합 프레임, 순번, 브래킷 평균 캡처 시각) 또는 None
+        """
+        with self.fused_condition:
+            if after_seq is not None:
+                self.fused_condition.wait_for(lambda: self.fused_seq > after_seq or not self.running, timeout)
+                if self.fused_seq <= after_seq:
+                    return None
+            if self.fused is None:
+                return None
+            frame = CameraModule._output_frame(self.fused, convert_to_rgb, dst)
+            return frame, self.fused_seq, self.fused_timestamp
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """FrameSource 인터페이스: 이전 read 이후의 새 융합 프레임"""
+        latest = self.get_fused(self.read_seq, dst=image)
+        if latest is None:
+            return False, None
+        frame, self.read_seq, self.timestamp = latest
+        return True, frame
+
+    def fuse(self, brackets: Sequence[np.ndarray], dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        브래킷 프레임 융합
+
+        Args:
+            brackets: 노출별 BGR uint8 프레임 (같은 크기)
+            dst: 결과를 쓸 재사용 버퍼
+
+        Returns:
+            융합된 BGR uint8 프레임
+        """
+        shape = brackets[0].shape
+        if dst is None or dst.shape != shape or dst.dtype != np.uint8:
+            dst = np.empty(shape, dtype=np.uint8)
+
+        if self.method == 'mertens':
+            fused = self.merge_mertens.process(list(brackets))
+            np.copyto(dst, np.clip(fused * 255.0 + 0.5, 0, 255), casting='unsafe')
+            return dst
+
+        # 픽셀별 적정 노출 가중 평균: sum(w_i * I_i) / sum(w_i)
+        if self.accumulator is None or self.accumulator.shape != shape:
+            self.gray = np.empty(shape[:2], dtype=np.uint8)
+            self.weight = np.empty(shape[:2], dtype=np.float32)
+            self.weight_sum = np.empty(shape[:2], dtype=np.float32)
+            self.product = np.empty(shape, dtype=np.float32)
+            self.accumulator = np.empty(shape, dtype=np.float32)
+        self.weight_sum.fill(0)
+        self.accumulator.fill(0)
+        weight = self.weight if len(shape) == 2 else self.weight[..., None]
+        for frame in brackets:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self.gray) if frame.ndim == 3 else frame
+            cv2.LUT(gray, self.weight_lut, dst=self.weight)
+            cv2.add(self.weight_sum, self.weight, dst=self.weight_sum)
+            np.multiply(frame, weight, out=self.product)
+            cv2.add(self.accumulator, self.product, dst=self.accumulator)
+        weight_sum = self.weight_sum if len(shape) == 2 else self.weight_sum[..., None]
+        np.divide(self.accumulator, weight_sum, out=self.accumulator)
+        np.add(self.accumulator, 0.5, out=self.accumulator)
+        np.copyto(dst, self.accumulator, casting='unsafe')
+        return dst
+
+    def _bracket_loop(self):
+        """작업 스레드: 노출 순환 → 브래킷 수집 → 융합 → 최신 융합 프레임 게시"""
+        while self.running:
+            timestamps = []
+            for index, exposure in enumerate(self.exposures):
+                frame_time = self._capture_bracket(index, exposure)
+                if frame_time is None:
+                    break
+                timestamps.append(frame_time)
+            if len(timestamps) != len(self.exposures):
+                time.sleep(0.01)
+                continue
+
+            start = time.perf_counter()
+            try:
+                fused = self.fuse(self.brackets, self.spare)
+            except Exception as e:
+                print(f"HDR 융합 오류: {e}")
+                continue
+            self.fusion_ms = (time.perf_counter() - start) * 1000
+
+            with self.fused_condition:
+                self.spare = self.fused
+                self.fused = fused
+                self.fused_seq += 1
+                self.fused_timestamp = float(np.mean(timestamps))
+                self.fused_condition.notify_all()
+
+    def _capture_bracket(self, index: int, exposure: float) -> Optional[float]:
+        """노출 설정 후 반영된 프레임을 index번 브래킷 버퍼로 복사 (캡처 시각 반환)"""
+        if not self.camera.set_exposure(exposure):
+            return None
+        # 노출 변경 이전에 노출된 프레임은 건너뜀
+        borrowed = self.camera.borrow_frame(self.camera.frame_seq + self.settle_frames, timeout=1.0)
+        if borrowed is None:
+            return None
+        buffer, _, timestamp = borrowed
+        try:
+            if index >= len(self.brackets) or self.brackets[index].shape != buffer.array.shape:
+                self.brackets[index:index + 1] = [buffer.array.copy()]
+            else:
+                np.copyto(self.brackets[index], buffer.array)
+        finally:
+            buffer.release()
+        return timestamp
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+히스토그램 기반 통계 엔진
+Histogram Statistics Engine
+
+채널당 256-bin 히스토그램 한 번으로 평균/표준편차/최소/최대/중앙값/백분위수를 계산하고,
+프레임 또는 타일 간 히스토그램을 누적(merge)하여 롤링 통계를 제공합니다.
+"""
+
+import cv2
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+
+class HistogramStatistics:
+    """채널별 256-bin 히스토그램 누적 통계 클래스"""
+
+    LEVELS = np.arange(256, dtype=np.float64)
+
+    def __init__(self, channels: int = 1):
+        """
+        통계 엔진 초기화
+
+        Args:
+            channels: 채널 수 (그레이스케일 1, BGR 3)
+        """
+        self.channels = channels
+        self.counts = np.zeros((channels, 256), dtype=np.int64)
+
+    @classmethod
+    def from_image(cls, image: np.ndarray, mask: Optional[np.ndarray] = None) -> 'HistogramStatistics':
+        """
+        이미지 한 장으로 통계 생성
+
+        Args:
+            image: 입력 이미지 (uint8, 그레이스케일 또는 BGR)
+            mask: 통계에 포함할 영역 마스크 (선택사항)
+
+        Returns:
+            HistogramStatistics 인스턴스
+        """
+        channels = 1 if image.ndim == 2 else image.shape[2]
+        stats = cls(channels)
+        stats.update(image, mask)
+        return stats
+
+    def update(self, image: np.ndarray, mask: Optional[np.ndarray] = None):
+        """
+        이미지(프레임 또는 타일)의 히스토그램을 누적
+
+        Args:
+            image: 입력 이미지 (uint8)
+            mask: 통계에 포함할 영역 마스크 (선택사항)
+        """
+        channels = 1 if image.ndim == 2 else image.shape[2]
+        if channels != self.channels:
+            raise ValueError(f"채널 수 불일치: {channels} != {self.channels}")
+
+        # 채널 분리 없이 채널당 한 번의 히스토그램 패스
+        for c in range(self.channels):
+            hist = cv2.calcHist([image], [c], mask, [256], [0, 256])
+            self.counts[c] += hist.ravel().astype(np.int64)
+
+    def merge(self, other: 'HistogramStatistics') -> 'HistogramStatistics':
+        """다른 통계를 누적 (프레임/타일 병합)"""
+        if other.channels != self.channels:
+            raise ValueError(f"채널 수 불일치: {other.channels} != {self.channels}")
+        self.counts += other.counts
+        return self
+
+    def subtract(self, other: 'HistogramStatistics') -> 'HistogramStatistics':
+        """이전에 누적한 통계를 제거 (롤링 윈도우에서 오래된 프레임 제외)"""
+        if other.channels != self.channels:
+            raise ValueError(f"채널 수 불일치: {other.channels} != {self.channels}")
+        self.counts -= other.counts
+        return self
+
+    def reset(self):
+        """누적 통계 초기화"""
+        self.counts.fill(0)
+
+    def __add__(self, other: 'HistogramStatistics') -> 'HistogramStatistics':
+        result = HistogramStatistics(self.channels)
+        result.counts = self.counts.copy()
+        return result.merge(other)
+
+    def total(self, channel: int = 0) -> int:
+        """누적된 픽셀 수"""
+        return int(self.counts[channel].sum())
+
+    def histogram(self, channel: int = 0) -> np.ndarray:
+        """채널 히스토그램 (256-bin)"""
+        return self.counts[channel]
+
+    def _order_statistic(self, cumulative: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+        """0부터 시작하는 순위(rank)에 해당하는 픽셀 값"""
+        return np.searchsorted(cumulative, ranks, side='right').astype(np.float64)
+
+    def percentiles(self, q: Sequence[float], channel: int = 0) -> np.ndarray:
+        """
+        백분위수 계산 (np.percentile 선형 보간과 동일)
+
+        Args:
+            q: 백분위 목록 (0-100)
+            channel: 채널 인덱스
+
+        Returns:
+            백분위수 배열
+        """
+        counts = self.counts[channel]
+        n = int(counts.sum())
+        if n == 0:
+            return np.full(len(q), np.nan)
+
+        cumulative = np.cumsum(counts)
+        positions = np.asarray(q, dtype=np.float64) / 100.0 * (n - 1)
+        lower = np.floor(positions)
+        upper = np.ceil(positions)
+        lower_values = self._order_statistic(cumulative, lower)
+        upper_values = self._order_statistic(cumulative, upper)
+        return lower_values + (positions - lower) * (upper_values - lower_values)
+
+    def channel_stats(self, channel: int = 0,
+                      percentiles: Sequence[float] = (1, 5, 25, 75, 95, 99)) -> Dict:
+        """
+        채널 통계 계산
+
+        Args:
+            channel: 채널 인덱스
+            percentiles: 함께 계산할 백분위 목록
+
+        Returns:
+            평균/표준편차/최소/최대/중앙값/백분위수 딕셔너리
+            (누적 픽셀이 없으면 같은 키에 count 0, 나머지는 NaN)
+        """
+        counts = self.counts[channel]
+        n = int(counts.sum())
+        if n == 0:
+            nan = float('nan')
+            return {'count': 0, 'mean': nan, 'std': nan, 'variance': nan, 'min': nan, 'max': nan,
+                    'median': nan, 'percentiles': {float(p): nan for p in percentiles}}
+
+        weights = counts.astype(np.float64)
+        mean = float(np.dot(weights, self.LEVELS) / n)
+        variance = float(np.dot(weights, self.LEVELS ** 2) / n - mean ** 2)
+
+        nonzero = np.flatnonzero(counts)
+        values = self.percentiles([50.0, *percentiles], channel)
+
+        return {
+            'count': n,
+            'mean': mean,
+            'std': float(np.sqrt(max(variance, 0.0))),
+            'variance': max(variance, 0.0),
+            'min': int(nonzero[0]),
+            'max': int(nonzero[-1]),
+            'median': float(values[0]),
+            'percentiles': {float(p): float(v) for p, v in zip(percentiles, values[1:])}
+        }
+
+    def summary(self, names: Optional[List[str]] = None) -> Dict:
+        """
+        전체 채널 통계 요약
+
+        Args:
+            names: 채널 이름 목록 (기본값: 채널 인덱스)
+
+        Returns:
+            채널 이름별 통계 딕셔너리
+        """
+        if names is None:
+            names = [str(c) for c in range(self.channels)]
+        return {name: self.channel_stats(c) for c, name in enumerate(names)}
@@ -16,6 +16,13 @@ from datetime import datetime
 import json
 import os
 
+from corner_refinement import (DETECTION_SCALE, CornerRefiner, contour_to_corners,
+                               corners_to_contour, corners_to_rectangle, downscale,
+                               scaled_kernel_size)
+from auto_exposure import AutoExposureController, brightness_target
+from frame_source import open_capture
+from panel_geometry import PanelGeometry
+
 class ImprovedPanelDetector:
     """개선된 패널 감지 시스템"""
     
@@ -23,8 +30,13 @@ class ImprovedPanelDetector:
         self.camera = None
         self.camera_running = False
         self.current_frame = None
+        self.auto_exposure = None  # 하드웨어 자동 노출 (밝기 슬라이더 = 목표 밝기 배율)
         self.panel_contour = None
         self.panel_rectangle = None  # 정확한 사각형 좌표
+        self.panel_corners = None  # 서브픽셀 코너 (좌상, 우상, 우하, 좌하)
+        self.corner_refiner = CornerRefiner()
+        self.panel_geometry = PanelGeometry()  # 왜곡 보정 + 원근 변환 remap (자세가 바뀔 때만 재생성)
+        self.panel_geometry.load_calibration()  # 메인 앱에서 저장한 카메라 보정 결과가 있으면 적용
         self.inspection_running = False
         self.inspection_results = {}
         
@@ -197,7 +209,7 @@ class ImprovedPanelDetector:
     def start_camera(self):
         """카메라 시작"""
         try:
-            self.camera = cv2.VideoCapture(0)
+            self.camera = open_capture()
             if not self.camera.isOpened():
                 messagebox.showerror("오류", "카메라를 열 수 없습니다.")
                 return
@@ -206,6 +218,8 @@ class ImprovedPanelDetector:
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
             self.camera.set(cv2.CAP_PROP_FPS, 30)
+            self.camera.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25)  # 수동 노출 (자동 노출은 직접 제어)
+            self.auto_exposure = AutoExposureController(self.camera)
             
             self.camera_running = True
             self.log_result("카메라가 시작되었습니다.")
@@ -220,6 +234,7 @@ class ImprovedPanelDetector:
     def stop_camera(self):
         """카메라 중지"""
         self.camera_running = False
+        self.auto_exposure = None
         if self.camera:
             self.camera.release()
             self.camera = None
@@ -232,6 +247,9 @@ class ImprovedPanelDetector:
             try:
                 ret, frame = self.camera.read()
                 if ret:
+                    if self.auto_exposure is not None:
+                        self.auto_exposure.target = brightness_target(self.brightness_var.get())
+                        self.auto_exposure.update(frame)
                     self.current_frame = frame.copy()
                     self.update_camera_display(frame)
                 time.sleep(0.03)  # 30 FPS
@@ -277,25 +295,24 @@ class ImprovedPanelDetector:
         """반사 제거 적용"""
         try:
             method = self.reflection_method_var.get()
-            brightness = self.brightness_var.get()
             
             if method == "auto":
-                return self.auto_reflection_removal(frame, brightness)
+                return self.auto_reflection_removal(frame)
             elif method == "polarization":
-                return self.polarization_filter(frame, brightness)
+                return self.polarization_filter(frame)
             elif method == "angle":
-                return self.angle_adjustment(frame, brightness)
+                return self.angle_adjustment(frame)
             else:
                 return frame
                 
         except Exception as e:
             return frame
     
-    def auto_reflection_removal(self, frame, brightness):
+    def auto_reflection_removal(self, frame):
         """자동 반사 제거"""
         try:
-            # 밝기 조정
-            result = cv2.convertScaleAbs(frame, alpha=brightness, beta=0)
+            # 밝기는 카메라 자동 노출로 조정됨
+            result = frame.copy()
             
             # 반사 영역 감지
             gray = cv2.cvtColor(result, cv2.COLOR_BGR2GRAY)
@@ -315,7 +332,7 @@ class ImprovedPanelDetector:
         except Exception as e:
             return frame
     
-    def polarization_filter(self, frame, brightness):
+    def polarization_filter(self, frame):
         """편광 필터 시뮬레이션"""
         try:
             hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
@@ -327,14 +344,12 @@ class ImprovedPanelDetector:
             blurred = cv2.GaussianBlur(frame, (15, 15), 0)
             result = frame.copy()
             result[bright_mask > 0] = blurred[bright_mask > 0]
-            
-            result = cv2.convertScaleAbs(result, alpha=brightness, beta=0)
             return result
             
         except Exception as e:
             return frame
     
-    def angle_adjustment(self, frame, brightness):
+    def angle_adjustment(self, frame):
         """각도 조정 시뮬레이션"""
         try:
             height, width = frame.shape[:2]
@@ -342,10 +357,7 @@ class ImprovedPanelDetector:
             pts2 = np.float32([[0, 0], [width, 0], [30, height], [width-30, height]])
             
             matrix = cv2.getPerspectiveTransform(pts1, pts2)
-            result = cv2.warpPerspective(frame, matrix, (width, height))
-            
-            result = cv2.convertScaleAbs(result, alpha=brightness, beta=0)
-            return result
+            return cv2.warpPerspective(frame, matrix, (width, height))
             
         except Exception as e:
             return frame
@@ -393,8 +405,8 @@ class ImprovedPanelDetector:
             if panel_contour is not None:
                 self.panel_contour = panel_contour
                 
-                # 2단계: 정확한 사각형 추출
-                rectangle = self.extract_rectangle_from_contour(panel_contour)
+                # 2단계: 서브픽셀 코너로 정확한 사각형 추출
+                rectangle = corners_to_rectangle(self.panel_corners)
                 
                 if rectangle is not None:
                     self.panel_rectangle = rectangle
@@ -410,22 +422,29 @@ class ImprovedPanelDetector:
             self.log_result(f"패널 감지 오류: {str(e)}")
     
     def detect_panel_contour(self, frame):
-        """패널 윤곽선 감지 (개선된 버전)"""
+        """패널 윤곽선 감지 (1/4 스케일 감지 + 원본 해상도 코너 보정)"""
         try:
+            # 저해상도에서 후보 감지
+            small = downscale(frame, DETECTION_SCALE)
+            
             # 그레이스케일 변환
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
             
-            # 가우시안 블러
-            blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+            # 가우시안 블러 / 적응적 임계값 블록 / 모폴로지 커널은 원본 해상도 크기(5, 11, 3)를
+            # 감지 스케일로 환산 (1/4 스케일에서 블러와 모폴로지는 1px 미만이라 생략)
+            blur_size = scaled_kernel_size(5)
+            blurred = cv2.GaussianBlur(gray, (blur_size, blur_size), 0) if blur_size > 1 else gray
             
             # 적응적 임계값 (더 정확한 이진화)
             thresh = cv2.adaptiveThreshold(blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                                         cv2.THRESH_BINARY, 11, 2)
+                                         cv2.THRESH_BINARY, scaled_kernel_size(11, minimum=3), 2)
             
             # 모폴로지 연산으로 노이즈 제거
-            kernel = np.ones((3, 3), np.uint8)
-            thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-            thresh = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
+            kernel_size = scaled_kernel_size(3)
+            if kernel_size > 1:
+                kernel = np.ones((kernel_size, kernel_size), np.uint8)
+                thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
+                thresh = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
             
             # 윤곽선 찾기
             contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -433,8 +452,9 @@ class ImprovedPanelDetector:
             if not contours:
                 return None
             
-            # 면적이 큰 윤곽선들만 필터링
-            large_contours = [c for c in contours if cv2.contourArea(c) > 10000]
+            # 면적이 큰 윤곽선들만 필터링 (원본 해상도 기준 10000 픽셀)
+            min_area = 10000 * DETECTION_SCALE * DETECTION_SCALE
+            large_contours = [c for c in contours if cv2.contourArea(c) > min_area]
             
             if not large_contours:
                 return None
@@ -442,7 +462,11 @@ class ImprovedPanelDetector:
             # 가장 큰 윤곽선 선택
             largest_contour = max(large_contours, key=cv2.contourArea)
             
-            return largest_contour
+            # 원본 해상도에서 네 변을 다시 맞춰 서브픽셀 코너 계산
+            corners = (contour_to_corners(largest_contour) + 0.5) / DETECTION_SCALE - 0.5
+            self.panel_corners = self.corner_refiner.refine(frame, corners)
+            
+            return corners_to_contour(self.panel_corners)
             
         except Exception as e:
             return None
@@ -623,6 +647,10 @@ class ImprovedPanelDetector:
     def extract_rectangle_region(self, frame, rectangle):
         """정확한 사각형 영역 추출"""
         try:
+            # 서브픽셀 코너가 있으면 기울어진 패널도 정면 래스터로 변환 (remap 1회)
+            if self.panel_corners is not None:
+                return self.panel_geometry.warp(frame, self.panel_corners)
+            
             x, y, w, h = rectangle
             
             # 경계 확인
@@ -776,19 +804,19 @@ class ImprovedPanelDetector:
     
     def optimize_brightness(self):
         """밝기 최적화"""
-        if self.current_frame is None:
+        if self.current_frame is None or self.camera is None:
             messagebox.showwarning("경고", "먼저 카메라를 시작하세요.")
             return
         
         try:
-            gray = cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2GRAY)
-            mean_brightness = np.mean(gray)
-            
-            # 최적 밝기 계산 (128 목표)
-            optimal_alpha = 128.0 / mean_brightness if mean_brightness > 0 else 1.0
-            self.brightness_var.set(min(1.0, max(0.1, optimal_alpha)))
-            
-            self.log_result(f"밝기 최적화 완료: 평균 밝기 {mean_brightness:.1f} -> 목표 128")
+            # 목표 밝기(중앙값 128)로 되돌리고 카메라 노출/게인을 다시 수렴시킴
+            self.brightness_var.set(1.0)
+            if self.auto_exposure is None:
+                self.auto_exposure = AutoExposureController(self.camera)
+            level = self.auto_exposure.measure(self.current_frame)
+            self.auto_exposure.reset()
+            
+            self.log_result(f"밝기 최적화 시작: 중앙 밝기 {level:.1f} -> 목표 128 (카메라 노출/게인 조정)")
             
         except Exception as e:
             self.log_result(f"밝기 최적화 오류: {str(e)}")
@@ -9,10 +9,12 @@ Inspection Controller Module
 
 import cv2
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 import json
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
 
@@ -26,6 +28,7 @@ class InspectionResult:
     quality_grade: Dict[str, any]
     test_pattern: str
     inspection_time: float
+    panel_id: Optional[int] = None  # 다중 패널 검사 시 패널 ID
 
 
 class InspectionController:
@@ -34,6 +37,8 @@ class InspectionController:
         self.current_inspection = None
         self.inspection_history = []
         self.results_directory = "inspection_results"
+        self.executor = None  # 다중 패널 검사용 작업 풀 (지연 생성)
+        self.max_workers = min(8, os.cpu_count() or 1)
         
         # 결과 디렉토리 생성
         if not os.path.exists(self.results_directory):
@@ -128,6 +133,87 @@ class InspectionController:
             'test_pattern': self.current_inspection['test_pattern']
         }
         
+    def inspect_panels(self, frame: np.ndarray, panels: List[dict], scratch_detection, pixel_defect_detection,
+                       test_pattern: str = "solid_red") -> Dict[int, InspectionResult]:
+        """
+        여러 패널을 작업 풀에서 병렬 검사하여 패널별 결과 생성 (모든 패널 완료까지 대기)
+        
+        GUI 스레드에서는 submit_panels로 제출하고 완료된 뒤 collect_panels로 결과를 가져옵니다.
+        
+        Args:
+            frame: 입력 프레임
+            panels: 패널 목록 (EdgeDetection.detect_displays 결과, 'id'와 'rectangle' 포함)
+            scratch_detection: 스크래치 검출기 (ScratchDetection)
+            pixel_defect_detection: 픽셀 결함 검출기 (PixelDefectDetection)
+            test_pattern: 테스트 패턴 타입
+            
+        Returns:
+            Dict[int, InspectionResult]: 패널 ID별 검사 결과
+        """
+        return self.collect_panels(self.submit_panels(frame, panels, scratch_detection,
+                                                      pixel_defect_detection, test_pattern))
+        
+    def submit_panels(self, frame: np.ndarray, panels: List[dict], scratch_detection, pixel_defect_detection,
+                      test_pattern: str = "solid_red") -> Dict[int, Future]:
+        """
+        패널별 검사를 작업 풀에 제출하고 대기 없이 반환
+        
+        OpenCV 연산은 GIL을 해제하므로 스레드 풀로 패널 수에 비례한 처리량을 얻습니다.
+        검출기는 파라미터 외 상태가 없으므로 모든 작업에서 공유합니다.
+        프레임은 복사해 두므로 호출자는 곧바로 프레임 버퍼를 재사용할 수 있습니다.
+        
+        Returns:
+            Dict[int, Future]: 패널 ID별 검사 작업 (결과는 InspectionResult)
+        """
+        if not panels:
+            return {}
+            
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                               thread_name_prefix="panel_inspection")
+        frame = frame.copy()
+            
+        def inspect(panel):
+            start = time.perf_counter()
+            region = tuple(panel['rectangle'])
+            scratches = scratch_detection.detect_scratches(frame, region)
+            pixel_defects = pixel_defect_detection.detect_defects(frame, region)
+            quality_grade = pixel_defect_detection.calculate_quality_grade(pixel_defects, region[2] * region[3])
+            return InspectionResult(
+                timestamp=datetime.now(),
+                display_region=region,
+                scratches=scratches,
+                pixel_defects=pixel_defects,
+                quality_grade=quality_grade,
+                test_pattern=test_pattern,
+                inspection_time=time.perf_counter() - start,
+                panel_id=panel['id']
+            )
+            
+        return {panel['id']: self.executor.submit(inspect, panel) for panel in panels}
+        
+    @staticmethod
+    def collect_panels(futures: Dict[int, Future]) -> Dict[int, InspectionResult]:
+        """제출한 패널 검사 결과 수집 (완료되지 않은 작업은 대기, 실패한 패널은 제외)"""
+        results = {}
+        for panel_id, future in futures.items():
+            try:
+                results[panel_id] = future.result()
+            except Exception as e:
+                print(f"패널 {panel_id} 검사 오류: {e}")
+                
+        return results
+        
+    def record_results(self, results: Iterable[InspectionResult]):
+        """패널별 검사 결과를 검사 기록에 추가"""
+        self.inspection_history.extend(results)
+        
+    def shutdown(self):
+        """다중 패널 검사 작업 풀 종료"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+            
     def get_inspection_history(self) -> List[InspectionResult]:
         """검사 기록 반환"""
         return self.inspection_history
@@ -146,7 +232,8 @@ class InspectionController:
         try:
             if filename is None:
                 timestamp = result.timestamp.strftime("%Y%m%d_%H%M%S")
-                filename = f"inspection_{timestamp}.json"
+                suffix = f"_panel{result.panel_id}" if result.panel_id is not None else ""
+                filename = f"inspection_{timestamp}{suffix}.json"
                 
             filepath = os.path.join(self.results_directory, filename)
             
@@ -158,7 +245,8 @@ class InspectionController:
                 'pixel_defects': result.pixel_defects,
                 'quality_grade': result.quality_grade,
                 'test_pattern': result.test_pattern,
-                'inspection_time': result.inspection_time
+                'inspection_time': result.inspection_time,
+                'panel_id': result.panel_id
             }
             
             # JSON 파일로 저장
@@ -195,7 +283,8 @@ class InspectionController:
                 pixel_defects=result_dict['pixel_defects'],
                 quality_grade=result_dict['quality_grade'],
                 test_pattern=result_dict['test_pattern'],
-                inspection_time=result_dict['inspection_time']
+                inspection_time=result_dict['inspection_time'],
+                panel_id=result_dict.get('panel_id')
             )
             
             return result
@@ -319,6 +408,22 @@ class InspectionController:
             print(f"CSV 내보내기 오류: {e}")
             return False
             
+    def rescore_results(self, rules=None, filename: str = None) -> Dict[str, any]:
+        """
+        저장된 검사 결과를 새 등급 규칙으로 일괄 재채점
+        
+        Args:
+            rules: 등급 규칙 (GradingRules, None이면 기본 규칙)
+            filename: 요약 파일명 (None이면 자동 생성)
+            
+        Returns:
+            Dict: 재채점 결과 및 요약 파일 경로
+        """
+        from rescoring_engine import GradingRules, RescoringEngine
+        
+        engine = RescoringEngine(self.results_directory)
+        return engine.regrade(rules or GradingRules.default(), filename)
+        
     def clear_inspection_history(self):
         """검사 기록 초기화"""
         self.inspection_history.clear()
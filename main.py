@@ -27,6 +27,7 @@ Display Quality Inspection System
 날짜: 2024-10-01
 """
 
+import os
 import sys
 import cv2
 import numpy as np
@@ -40,13 +41,34 @@ import time
 from datetime import datetime
 
 from camera_module import CameraModule
+from capture_telemetry import draw_telemetry
 from edge_detection import EdgeDetection
+from frame_quality import FrameQualityGate
+from frame_stacker import FrameStacker
+from hdr_capture import HDRCapture
 from test_pattern_generator import TestPatternGenerator
 from scratch_detection import ScratchDetection
 from pixel_defect_detection import PixelDefectDetection
 from inspection_controller import InspectionController
 
 
+class CalibrationWorker(QThread):
+    """체스보드 수집/카메라 보정 작업 스레드 (수 초~수십 초 걸리므로 GUI 스레드에서 분리)"""
+    calibration_finished = pyqtSignal(dict)
+    
+    def __init__(self, camera_module):
+        super().__init__()
+        self.camera_module = camera_module
+        
+    def run(self):
+        try:
+            result = self.camera_module.calibrate_camera()
+        except Exception as e:
+            print(f"카메라 보정 오류: {e}")
+            result = {'calibrated': False}
+        self.calibration_finished.emit(result)
+
+
 class DisplayInspectionApp(QMainWindow):
     """
     디스플레이 품질 검사 메인 애플리케이션 클래스
@@ -74,10 +96,22 @@ class DisplayInspectionApp(QMainWindow):
         self.scratch_detection = ScratchDetection()
         self.pixel_defect_detection = PixelDefectDetection()
         self.inspection_controller = InspectionController()
+        self.quality_gate = FrameQualityGate()  # 블러/과노출/패턴 전환 프레임은 검사 전에 제외
+        self.frame_stacker = FrameStacker()  # 정지 패널 N프레임 누적 평균 (노이즈 감소)
+        self.stack_buffer = None  # 누적 평균 프레임 재사용 버퍼
         
         # 상태 변수
         self.is_inspecting = False
         self.detected_panel = None
+        self.detected_panels = []  # 다중 패널 감지 결과 (지그에 여러 패널이 있는 경우)
+        self.panel_results = {}  # 패널 ID별 검사 결과
+        self.panel_futures = None  # 작업 풀에서 진행 중인 패널별 검사 (GUI 스레드는 대기하지 않음)
+        self.last_frame_seq = 0  # 마지막으로 표시한 카메라 프레임 순번
+        self.display_buffer = None  # 카메라 뷰 RGB 변환 재사용 버퍼
+        self.hdr_capture = None  # 노출 브래킷 HDR 캡처 (활성화 시 검출기는 융합 프레임 사용)
+        self.last_hdr_seq = 0  # 마지막으로 검사한 융합 프레임 순번
+        self.hdr_buffer = None  # 융합 프레임 RGB 변환 재사용 버퍼
+        self.calibration_worker = None  # 카메라 보정 작업 스레드
         self.inspection_results = {}
         
         self.init_ui()
@@ -140,6 +174,18 @@ class DisplayInspectionApp(QMainWindow):
         self.fps_spin.setValue(30)
         settings_layout.addWidget(self.fps_spin, 1, 1)
         
+        self.hdr_check = QCheckBox("HDR 브래킷 캡처 (노출 -8/-6/-4)")
+        settings_layout.addWidget(self.hdr_check, 2, 0, 1, 2)
+        
+        self.telemetry_check = QCheckBox("캡처 통계 표시 (fps/드롭/지연)")
+        settings_layout.addWidget(self.telemetry_check, 3, 0, 1, 2)
+        
+        self.stack_check = QCheckBox("프레임 누적 (노이즈 감소)")
+        settings_layout.addWidget(self.stack_check, 4, 0)
+        self.stack_window_combo = QComboBox()
+        self.stack_window_combo.addItems(["박스카 8프레임", "지수 가중 (8프레임)"])
+        settings_layout.addWidget(self.stack_window_combo, 4, 1)
+        
         layout.addWidget(control_group)
         layout.addWidget(self.camera_view)
         layout.addWidget(settings_group)
@@ -148,6 +194,9 @@ class DisplayInspectionApp(QMainWindow):
         self.camera_connect_btn.clicked.connect(self.connect_camera)
         self.camera_disconnect_btn.clicked.connect(self.disconnect_camera)
         self.camera_calibrate_btn.clicked.connect(self.calibrate_camera)
+        self.hdr_check.toggled.connect(self.toggle_hdr)
+        self.stack_check.toggled.connect(self.update_frame_stacker)
+        self.stack_window_combo.currentIndexChanged.connect(self.update_frame_stacker)
         
         self.tab_widget.addTab(camera_widget, "카메라")
         
@@ -363,6 +412,8 @@ class DisplayInspectionApp(QMainWindow):
         """카메라 연결"""
         if self.camera_module.connect():
             self.add_status_message("카메라가 연결되었습니다.")
+            if self.camera_module.calibration:
+                self.add_status_message("저장된 카메라 보정 결과를 불러왔습니다.")
             self.camera_connect_btn.setEnabled(False)
             self.camera_disconnect_btn.setEnabled(True)
         else:
@@ -370,6 +421,7 @@ class DisplayInspectionApp(QMainWindow):
             
     def disconnect_camera(self):
         """카메라 연결 해제"""
+        self.hdr_check.setChecked(False)
         self.camera_module.disconnect()
         self.add_status_message("카메라 연결이 해제되었습니다.")
         self.camera_connect_btn.setEnabled(True)
@@ -377,8 +429,55 @@ class DisplayInspectionApp(QMainWindow):
         
     def calibrate_camera(self):
         """카메라 보정"""
-        self.add_status_message("카메라 보정을 시작합니다...")
-        # 카메라 보정 로직 구현
+        if not self.camera_module.is_connected():
+            self.add_status_message("카메라가 연결되지 않았습니다.")
+            return
+            
+        if self.calibration_worker is not None and self.calibration_worker.isRunning():
+            return
+            
+        self.add_status_message("카메라 보정을 시작합니다... 체스보드를 여러 각도로 보여주세요.")
+        self.camera_calibrate_btn.setEnabled(False)
+        self.calibration_worker = CalibrationWorker(self.camera_module)
+        self.calibration_worker.calibration_finished.connect(self.on_calibration_finished)
+        self.calibration_worker.start()
+        
+    def on_calibration_finished(self, result):
+        """카메라 보정 완료 (작업 스레드 → GUI 스레드 시그널)"""
+        self.camera_calibrate_btn.setEnabled(True)
+        if result.get('calibrated'):
+            # 보정 결과는 CameraModule이 파일로 저장하며, 패널 정면 변환을 쓰는 검출기는 시작 시 로드
+            self.add_status_message(f"카메라 보정 완료 (RMS 오차: {result['rms_error']:.3f}px, "
+                                    f"이미지 {result['views']}장, 저장: {self.camera_module.calibration_file})")
+        else:
+            self.add_status_message("카메라 보정에 실패했습니다. 체스보드가 잘 보이도록 조정하세요.")
+        
+    def toggle_hdr(self, enabled):
+        """HDR 브래킷 캡처 토글 (미리보기는 그대로, 검출기 입력만 융합 프레임으로 전환)"""
+        if enabled:
+            if not self.camera_module.is_connected():
+                self.add_status_message("카메라가 연결되지 않았습니다.")
+                self.hdr_check.setChecked(False)
+                return
+            self.hdr_capture = HDRCapture(self.camera_module)
+            if self.hdr_capture.start():
+                self.last_hdr_seq = 0
+                self.add_status_message("HDR 브래킷 캡처가 시작되었습니다.")
+            else:
+                self.hdr_capture = None
+                self.hdr_check.setChecked(False)
+        elif self.hdr_capture is not None:
+            self.hdr_capture.stop()
+            self.hdr_capture = None
+            self.add_status_message("HDR 브래킷 캡처가 중지되었습니다.")
+        
+    def update_frame_stacker(self, *_):
+        """프레임 누적 창 변경 (누적은 처음부터 다시 시작)"""
+        window = 'boxcar' if self.stack_window_combo.currentIndex() == 0 else 'exponential'
+        self.frame_stacker = FrameStacker(8, window)
+        if self.stack_check.isChecked():
+            self.add_status_message(f"프레임 누적: {self.stack_window_combo.currentText()} "
+                                    f"(노이즈 약 {self.frame_stacker.noise_factor:.2f}배)")
         
     def update_filter_angle(self, angle):
         """편광필터 각도 업데이트"""
@@ -400,7 +499,23 @@ class DisplayInspectionApp(QMainWindow):
         frame = self.camera_module.get_frame()
         if frame is not None:
             print(f"프레임 크기: {frame.shape}")
-            self.detected_panel = self.edge_detection.detect_display(frame)
+            
+            # 여러 패널이 보이면 패널별로 검사
+            self.panel_results = {}
+            self.detected_panels = self.edge_detection.detect_displays(frame)
+            if len(self.detected_panels) > 1:
+                self.detected_panel = self.detected_panels[0]['rectangle']
+                panel_ids = ", ".join(str(panel['id']) for panel in self.detected_panels)
+                self.add_status_message(f"패널 {len(self.detected_panels)}개가 감지되었습니다. ID: {panel_ids}")
+                return
+            
+            # 단일 패널은 같은 감지 결과를 재사용 (후보가 없으면 중앙 영역)
+            if self.detected_panels:
+                self.detected_panel = self.detected_panels[0]['rectangle']
+                self.edge_detection.last_corners = self.detected_panels[0]['corners']
+            else:
+                self.detected_panel = self.edge_detection.center_region(frame)
+            self.detected_panels = []
             if self.detected_panel is not None:
                 x, y, w, h = self.detected_panel
                 self.add_status_message(f"패널이 감지되었습니다. 위치: ({x}, {y}), 크기: {w}x{h}")
@@ -416,6 +531,11 @@ class DisplayInspectionApp(QMainWindow):
             self.add_status_message("먼저 패널을 감지해주세요.")
             return
             
+        self.quality_gate = FrameQualityGate()
+        self.frame_stacker.reset()
+        self.panel_results = {}
+        if not self.detected_panels:
+            self.inspection_controller.start_inspection(self.detected_panel)
         self.is_inspecting = True
         self.add_status_message("검사가 시작되었습니다.")
         
@@ -423,9 +543,25 @@ class DisplayInspectionApp(QMainWindow):
         """검사 중지"""
         self.is_inspecting = False
         self.add_status_message("검사가 중지되었습니다.")
+        # 검사 기록: 다중 패널은 패널별 마지막 결과, 단일 패널은 검사 제어기의 현재 검사
+        if self.panel_futures is not None:
+            self.panel_results = self.inspection_controller.collect_panels(self.panel_futures)
+            self.panel_futures = None
+        if self.panel_results:
+            self.inspection_controller.record_results(self.panel_results.values())
+        self.inspection_controller.stop_inspection()
+        rejected = self.quality_gate.rejected
+        if self.quality_gate.checked:
+            self.add_status_message(f"품질 게이트 제외 프레임: {sum(rejected.values())}/{self.quality_gate.checked} "
+                                    f"(포화 {rejected['clipped']}, 전환/움직임 {rejected['change']}, "
+                                    f"블러 {rejected['focus']})")
         
     def save_results(self):
         """결과 저장"""
+        if self.panel_results:
+            self.save_panel_results()
+            return
+            
         if not self.inspection_results:
             self.add_status_message("저장할 결과가 없습니다.")
             return
@@ -461,6 +597,28 @@ class DisplayInspectionApp(QMainWindow):
         except Exception as e:
             self.add_status_message(f"결과 저장 오류: {e}")
             
+    def save_panel_results(self):
+        """다중 패널 결과 저장 (패널별 JSON + 전체 텍스트 보고서)"""
+        try:
+            saved = [panel_id for panel_id, result in sorted(self.panel_results.items())
+                     if self.inspection_controller.save_inspection_result(result)]
+            
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            report_filename = f"inspection_report_{timestamp}_panels.txt"
+            report_content = "".join(
+                f"\n##### 패널 {panel_id} #####\n" + self.inspection_controller.generate_inspection_report(result)
+                for panel_id, result in sorted(self.panel_results.items())
+            )
+            report_path = os.path.join(self.inspection_controller.results_directory, report_filename)
+            with open(report_path, 'w', encoding='utf-8') as f:
+                f.write(report_content)
+                
+            self.add_status_message(f"패널 {len(saved)}/{len(self.panel_results)}개 결과와 "
+                                    f"{report_filename}이 저장되었습니다.")
+                
+        except Exception as e:
+            self.add_status_message(f"결과 저장 오류: {e}")
+            
     def generate_inspection_report(self):
         """검사 보고서 생성"""
         if not self.inspection_results:
@@ -534,6 +692,10 @@ class DisplayInspectionApp(QMainWindow):
         height = self.height_spin.value()
         pattern = self.pattern_generator.generate_pattern(width, height)
         
+        # 패턴이 바뀌면 이전 패턴의 초점 기준과 누적 프레임은 더 이상 유효하지 않음
+        self.quality_gate.reset()
+        self.frame_stacker.reset()
+        
         # 패턴을 QLabel에 표시
         if pattern is not None:
             h, w, ch = pattern.shape
@@ -547,26 +709,78 @@ class DisplayInspectionApp(QMainWindow):
         if not self.camera_module.is_connected():
             return
             
-        frame = self.camera_module.get_frame()
+        # 작업 풀의 다중 패널 검사가 끝났으면 결과 반영 (타이머 슬롯은 대기하지 않음)
+        self.collect_panel_results()
+            
+        # 캡처 스레드의 최신 프레임 (새 프레임이 없으면 이번 틱은 건너뜀)
+        if self.camera_module.frame_seq == self.last_frame_seq:
+            return
+        latest = self.camera_module.get_latest(convert_to_rgb=True, dst=self.display_buffer)
+        if latest is None:
+            return
+        # RGB 변환 결과는 다음 틱에 같은 버퍼로 재사용 (QPixmap은 복사본을 가짐)
+        frame, self.last_frame_seq, _ = latest
+        self.display_buffer = frame
         if frame is not None:
             # 검사 중이면 검사 로직 실행
             if self.is_inspecting and self.detected_panel is not None:
-                frame = self.run_inspection(frame)
+                if self.hdr_capture is not None:
+                    # HDR: 새 융합 프레임이 나왔을 때만 검사 (미리보기는 매 프레임)
+                    fused = self.hdr_capture.get_fused(self.last_hdr_seq, timeout=0,
+                                                       convert_to_rgb=True, dst=self.hdr_buffer)
+                    if fused is not None:
+                        self.hdr_buffer, self.last_hdr_seq, _ = fused
+                        self.inspect_frame(self.hdr_buffer)
+                else:
+                    self.inspect_frame(frame)
                 
             # 엣지 디텍션 결과 표시
-            if self.detected_panel is not None:
+            if self.detected_panels:
+                for panel in self.detected_panels:
+                    frame = self.edge_detection.draw_detection_result(frame, panel['rectangle'])
+                    x, y = panel['rectangle'][:2]
+                    cv2.putText(frame, f"ID {panel['id']}", (x + 5, y + 25),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+            elif self.detected_panel is not None:
                 frame = self.edge_detection.draw_detection_result(frame, self.detected_panel)
                 
+            if self.telemetry_check.isChecked():
+                frame = draw_telemetry(frame, self.camera_module.telemetry.snapshot())
+                
             # 프레임을 QLabel에 표시
             self.display_frame(frame, self.camera_view)
             self.display_frame(frame, self.inspection_camera_view)
             
+    def inspect_frame(self, frame):
+        """품질 게이트 → (선택) 프레임 누적 → 검사"""
+        passed, metrics = self.quality_gate.check(frame, self.detected_panel)
+        if not passed:
+            if metrics.get('reason') == 'change':
+                # 패턴 전환/움직임: 이전 장면의 누적은 버림
+                self.frame_stacker.reset()
+            return
+            
+        if self.stack_check.isChecked():
+            if not self.frame_stacker.add(frame):
+                return
+            self.stack_buffer = self.frame_stacker.average(dst=self.stack_buffer)
+            frame = self.stack_buffer
+        self.run_inspection(frame)
+        
     def run_inspection(self, frame):
         """검사 실행"""
         if self.detected_panel is None:
             return frame
             
         try:
+            # 다중 패널: 작업 풀에서 패널별 병렬 검사 (이전 제출분이 끝나기 전에는 새로 제출하지 않음)
+            if len(self.detected_panels) > 1:
+                if self.panel_futures is None:
+                    self.panel_futures = self.inspection_controller.submit_panels(
+                        frame, self.detected_panels, self.scratch_detection, self.pixel_defect_detection
+                    )
+                return frame
+            
             # 스크래치 검사
             scratches = self.scratch_detection.detect_scratches(frame, self.detected_panel)
             
@@ -598,6 +812,14 @@ class DisplayInspectionApp(QMainWindow):
         
         return frame
         
+    def collect_panel_results(self):
+        """완료된 다중 패널 검사 결과를 가져와 표시 (진행 중이면 바로 반환)"""
+        if self.panel_futures is None or not all(f.done() for f in self.panel_futures.values()):
+            return
+        self.panel_results = self.inspection_controller.collect_panels(self.panel_futures)
+        self.panel_futures = None
+        self.update_inspection_display()
+        
     def display_frame(self, frame, label):
         """프레임을 QLabel에 표시"""
         if frame is not None:
@@ -611,6 +833,10 @@ class DisplayInspectionApp(QMainWindow):
             
     def update_inspection_display(self):
         """실시간 검사 결과 표시 업데이트"""
+        if self.panel_results:
+            self.update_panel_results_display()
+            return
+            
         if not self.inspection_results:
             return
             
@@ -658,6 +884,28 @@ class DisplayInspectionApp(QMainWindow):
         except Exception as e:
             print(f"검사 결과 표시 업데이트 오류: {e}")
             
+    def update_panel_results_display(self):
+        """다중 패널 검사 결과 표시 (패널별 등급/결함/스크래치)"""
+        try:
+            lines = ["", "=== 실시간 검사 결과 (다중 패널) ===", ""]
+            summary = []
+            for panel_id, result in sorted(self.panel_results.items()):
+                grade = result.quality_grade.get('grade', 'N/A')
+                score = result.quality_grade.get('score', 0)
+                total_defects = result.quality_grade.get('total_defects', 0)
+                lines.append(f"패널 {panel_id}: {grade}급 ({score:.1f}점), 결함 {total_defects}개, "
+                             f"스크래치 {len(result.scratches)}개")
+                summary.append(f"{panel_id}:{grade}")
+            lines.append("")
+            lines.append(f"마지막 업데이트: {datetime.now().strftime('%H:%M:%S')}")
+            
+            if hasattr(self, 'results_display'):
+                self.results_display.setPlainText("\n".join(lines))
+            self.add_status_message(f"검사 중 - 패널 등급: {', '.join(summary)}")
+            
+        except Exception as e:
+            print(f"검사 결과 표시 업데이트 오류: {e}")
+            
     def add_status_message(self, message):
         """상태 메시지 추가"""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+패널 감지 전략 엔진
+Panel Detection Strategy Engine
+
+그레이 변환과 히스토그램을 한 번만 계산하고, 색상/Otsu/다중 Otsu/적응적 임계값/Canny
+전략의 후보 마스크를 모두 같은 방식으로 윤곽선화하여 품질 점수가 가장 높은 패널을 선택
+(단계별 폴백 대신 고정된 전략 집합을 한 번씩만 실행하므로 최악 지연이 일정)
+"""
+
+import time
+import cv2
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from corner_refinement import scaled_kernel_size
+from histogram_statistics import HistogramStatistics
+
+
+STRATEGY_NAMES = {
+    'color': 'RGB 색상',
+    'otsu': 'Otsu 임계값',
+    'multi_otsu': '다중 Otsu 임계값',
+    'adaptive': '적응적 임계값',
+    'canny': 'Canny 엣지'
+}
+
+
+_THRESHOLD_PAIRS = np.triu_indices(256, k=1)  # 다중 Otsu 후보 (t1 < t2) 쌍
+
+
+def otsu_thresholds(histogram: np.ndarray, classes: int = 2) -> List[int]:
+    """
+    히스토그램에서 Otsu 임계값 계산 (클래스 간 분산 최대화)
+
+    Args:
+        histogram: 256-bin 히스토그램
+        classes: 분할 클래스 수 (2 또는 3)
+
+    Returns:
+        List[int]: 임계값 목록 (값 > 임계값이 윗 클래스)
+    """
+    p = histogram.astype(np.float64).ravel()
+    total = p.sum()
+    if total == 0:
+        return [127] * (classes - 1)
+    p /= total
+    levels = np.arange(256, dtype=np.float64)
+    omega = np.cumsum(p)  # 0..k 누적 확률
+    mu = np.cumsum(p * levels)  # 0..k 누적 1차 모멘트
+
+    if classes == 2:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            between = (mu[-1] * omega - mu) ** 2 / (omega * (1 - omega))
+        return [int(np.argmax(np.nan_to_num(between[:-1])))]
+
+    # 3클래스: 모든 (t1 < t2) 쌍의 클래스 간 분산을 한 번에 계산
+    t1, t2 = _THRESHOLD_PAIRS
+    w0, m0 = omega[t1], mu[t1]
+    w1, m1 = omega[t2] - w0, mu[t2] - m0
+    w2, m2 = 1 - omega[t2], mu[-1] - mu[t2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        between = m0 ** 2 / w0 + m1 ** 2 / w1 + m2 ** 2 / w2
+    between[(w0 <= 0) | (w1 <= 0) | (w2 <= 0)] = -1
+    best = int(np.argmax(np.nan_to_num(between, nan=-1)))
+    lower, upper = t1[best], t2[best]
+    return [int(lower), int(upper)]
+
+
+def evaluate_contour_quality(contour: np.ndarray, reference_area: float = 10000) -> float:
+    """
+    컨투어 품질 평가 (0~1)
+
+    Args:
+        contour: 후보 윤곽선
+        reference_area: 면적 점수가 1이 되는 면적 (감지 스케일 기준)
+
+    Returns:
+        float: 면적/사각형 근사/종횡비/채움 비율 가중 점수
+    """
+    # 면적 점수
+    area = cv2.contourArea(contour)
+    area_score = min(area / reference_area, 1.0)
+
+    # 사각형 근사 점수
+    epsilon = 0.02 * cv2.arcLength(contour, True)
+    approx = cv2.approxPolyDP(contour, epsilon, True)
+    rect_score = 1.0 if len(approx) == 4 else 0.5
+
+    # 종횡비 점수
+    (_, _), (w, h), _ = cv2.minAreaRect(contour)
+    aspect_ratio = max(w, h) / max(min(w, h), 1e-6)
+    ratio_score = 1.0 if aspect_ratio <= 2.5 else 0.3  # 합리적인 비율
+
+    # 채움 점수 (최소 외접 사각형 대비 면적, 패널은 1에 가까움)
+    fill_score = area / max(w * h, 1e-6)
+
+    return area_score * 0.3 + rect_score * 0.3 + ratio_score * 0.1 + fill_score * 0.3
+
+
+class PanelDetectionEngine:
+    """단일 패스 다중 임계값 패널 감지 엔진"""
+
+    STRATEGIES = ('color', 'otsu', 'multi_otsu', 'adaptive', 'canny')
+
+    def __init__(self, min_area: float = 2000, strategies: Optional[Sequence[str]] = None,
+                 max_workers: Optional[int] = None, candidates_per_mask: int = 3,
+                 max_area_ratio: float = 0.9, kernel_size: int = 3):
+        """
+        감지 엔진 초기화
+
+        Args:
+            min_area: 최소 패널 면적 (원본 해상도 픽셀)
+            strategies: 사용할 전략 (None이면 전체, 앞쪽이 동점일 때 우선)
+            max_workers: 전략 병렬 평가 스레드 수 (None 또는 1이면 순차 실행)
+            candidates_per_mask: 마스크마다 평가할 상위 윤곽선 수
+            max_area_ratio: 프레임 대비 최대 패널 면적 비율 (배경 전체가 잡힌 마스크 제외)
+            kernel_size: 마스크 정리 모폴로지 커널 크기 (원본 해상도 픽셀, 감지 스케일에 맞춰 축소)
+        """
+        self.min_area = min_area
+        self.strategies = tuple(strategies) if strategies else self.STRATEGIES
+        self.max_workers = max_workers
+        self.candidates_per_mask = candidates_per_mask
+        self.max_area_ratio = max_area_ratio
+        self.executor = None
+        self.kernel_size = kernel_size
+        self.kernels = {}  # 감지 스케일별 커널 (1x1이면 None: 모폴로지 생략)
+        self.last_timings = {}  # 전략별 소요 시간 (ms)
+
+    def detect(self, frame: np.ndarray, scale: float = 1.0) -> Optional[Dict]:
+        """
+        패널 감지 (전체 전략 후보 중 최고 점수)
+
+        Args:
+            frame: 입력 프레임 (BGR, 감지 스케일로 축소된 영상)
+            scale: 원본 대비 프레임 스케일 (면적 임계값 환산용)
+
+        Returns:
+            'contour', 'strategy', 'threshold', 'score', 'area' 딕셔너리 또는 None
+        """
+        candidates = self.candidates(frame, scale)
+        if not candidates:
+            return None
+        # 점수 → 전략 우선순위 → 면적 순으로 선택
+        return max(candidates, key=lambda c: (round(c['score'], 3),
+                                              -self.strategies.index(c['strategy']), c['area']))
+
+    def candidates(self, frame: np.ndarray, scale: float = 1.0) -> List[Dict]:
+        """
+        모든 전략의 후보 윤곽선과 품질 점수
+
+        Args:
+            frame: 입력 프레임 (BGR)
+            scale: 원본 대비 프레임 스케일
+
+        Returns:
+            List[Dict]: 후보 목록
+        """
+        # 공통 전처리 (한 번만)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        histogram = HistogramStatistics.from_image(gray).histogram()
+        context = {'frame': frame, 'gray': gray, 'histogram': histogram,
+                   'min_area': self.min_area * scale ** 2,
+                   'max_area': self.max_area_ratio * gray.shape[0] * gray.shape[1],
+                   'reference_area': 10000 * scale ** 2,
+                   'kernel': self._kernel(scale),
+                   'adaptive_block': scaled_kernel_size(11, scale, minimum=3)}
+
+        if self.max_workers and self.max_workers > 1:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                   thread_name_prefix="panel_detection")
+            results = list(self.executor.map(lambda name: self._run_strategy(name, context),
+                                             self.strategies))
+        else:
+            results = [self._run_strategy(name, context) for name in self.strategies]
+
+        self.last_timings = {}
+        candidates = []
+        for name, elapsed, found in results:
+            self.last_timings[name] = elapsed
+            candidates.extend(found)
+        return candidates
+
+    def shutdown(self):
+        """병렬 평가 작업 풀 종료"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def _kernel(self, scale: float) -> Optional[np.ndarray]:
+        """감지 스케일로 축소한 홀수 크기 모폴로지 커널 (원본 3px은 1/4 스케일에서 1px 미만이라 생략)"""
+        if scale not in self.kernels:
+            size = scaled_kernel_size(self.kernel_size, scale)
+            self.kernels[scale] = np.ones((size, size), np.uint8) if size > 1 else None
+        return self.kernels[scale]
+
+    def _run_strategy(self, name: str, context: Dict):
+        """전략 하나의 마스크 생성 → 윤곽선 후보 평가"""
+        start = time.perf_counter()
+        candidates = []
+        for threshold, mask in getattr(self, f'_mask_{name}')(context):
+            candidates.extend(self._score_mask(mask, name, threshold, context))
+        return name, (time.perf_counter() - start) * 1000, candidates
+
+    def _score_mask(self, mask: np.ndarray, strategy: str, threshold: Optional[int],
+                    context: Dict) -> List[Dict]:
+        """마스크 정리 후 상위 윤곽선 품질 평가"""
+        kernel = context['kernel']
+        if kernel is not None:
+            mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+            mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        contours = sorted(contours, key=cv2.contourArea, reverse=True)[:self.candidates_per_mask]
+
+        candidates = []
+        for contour in contours:
+            area = cv2.contourArea(contour)
+            if area <= context['min_area']:
+                break
+            if area > context['max_area']:
+                continue
+            candidates.append({
+                'contour': contour,
+                'strategy': strategy,
+                'threshold': threshold,
+                'score': evaluate_contour_quality(contour, context['reference_area']),
+                'area': area
+            })
+        return candidates
+
+    def _mask_color(self, context: Dict):
+        """한 채널만 강하고 나머지 두 채널은 약한 영역 (R/G/B 테스트 패턴)"""
+        frame = context['frame']
+        if frame.ndim != 3:
+            return []
+        # 강한 채널 > 150, 나머지 두 채널 < 100 (BGR 순서)
+        mask = cv2.inRange(frame, (0, 0, 151), (99, 99, 255))
+        mask |= cv2.inRange(frame, (0, 151, 0), (99, 255, 99))
+        mask |= cv2.inRange(frame, (151, 0, 0), (255, 99, 99))
+        return [(None, mask)]
+
+    def _mask_otsu(self, context: Dict):
+        """2클래스 Otsu 임계값 (밝은 패널 / 어두운 배경)"""
+        threshold = otsu_thresholds(context['histogram'], 2)[0]
+        return [(threshold, cv2.threshold(context['gray'], threshold, 255, cv2.THRESH_BINARY)[1])]
+
+    def _mask_multi_otsu(self, context: Dict):
+        """3클래스 Otsu 임계값 두 개 (배경/베젤/패널 분리)"""
+        return [(threshold, cv2.threshold(context['gray'], threshold, 255, cv2.THRESH_BINARY)[1])
+                for threshold in otsu_thresholds(context['histogram'], 3)]
+
+    def _mask_adaptive(self, context: Dict):
+        """적응적 임계값 (조명이 불균일할 때, 블록은 원본 해상도 11px을 감지 스케일로 환산)"""
+        mask = cv2.adaptiveThreshold(context['gray'], 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                     cv2.THRESH_BINARY, context['adaptive_block'], 2)
+        return [(None, mask)]
+
+    def _mask_canny(self, context: Dict):
+        """Canny 엣지를 닫아 채운 영역 (패널과 배경 밝기가 비슷할 때)"""
+        blurred = cv2.GaussianBlur(context['gray'], (5, 5), 0)
+        edges = cv2.Canny(blurred, 50, 150)
+        if context['kernel'] is not None:
+            edges = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, context['kernel'], iterations=2)
+        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        mask = np.zeros_like(edges)
+        cv2.drawContours(mask, contours, -1, 255, cv2.FILLED)
+        return [(None, mask)]
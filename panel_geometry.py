@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+패널 기하 보정 모듈
+Panel Geometry Module
+
+체스보드 카메라 보정 + 렌즈 왜곡 보정과 패널 원근 변환을 하나의
+cv2.remap 맵(CV_16SC2 고정소수점)으로 합성하여, 프레임당 한 번의 remap으로
+기울어진 패널을 고정 크기의 정면 패널 래스터로 변환
+(카메라 보정 결과는 DEFAULT_CALIBRATION_FILE에 저장되어 다음 실행 시 자동으로 로드)
+"""
+
+import json
+import os
+import cv2
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple
+
+DEFAULT_CALIBRATION_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'display_inspection',
+                                        'camera_calibration.json')
+
+
+def find_chessboard(image: np.ndarray, pattern_size: Tuple[int, int] = (9, 6)) -> Optional[np.ndarray]:
+    """
+    체스보드 내부 코너 감지 (서브픽셀 보정 포함)
+
+    Args:
+        image: 입력 이미지 (BGR 또는 그레이스케일)
+        pattern_size: 체스보드 내부 코너 수 (가로, 세로)
+
+    Returns:
+        (N, 1, 2) float32 코너 배열 또는 None
+    """
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    flags = cv2.CALIB_CB_ADAPTIVE_THRESH | cv2.CALIB_CB_NORMALIZE_IMAGE
+    found, corners = cv2.findChessboardCorners(gray, pattern_size, flags=flags)
+    if not found:
+        return None
+
+    criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
+    return cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), criteria)
+
+
+def calibrate_chessboard(images: Sequence[np.ndarray], pattern_size: Tuple[int, int] = (9, 6),
+                         square_size: float = 1.0, min_views: int = 5) -> Dict:
+    """
+    체스보드 이미지들로 카메라 내부 파라미터 및 왜곡 계수 보정
+
+    Args:
+        images: 서로 다른 자세의 체스보드 이미지들
+        pattern_size: 체스보드 내부 코너 수 (가로, 세로)
+        square_size: 체스보드 칸 크기 (임의 단위, 내부 파라미터에는 영향 없음)
+        min_views: 보정에 필요한 최소 유효 이미지 수
+
+    Returns:
+        보정 결과 딕셔너리 ('calibrated'가 False이면 실패)
+    """
+    object_template = np.zeros((pattern_size[0] * pattern_size[1], 3), np.float32)
+    object_template[:, :2] = np.mgrid[0:pattern_size[0], 0:pattern_size[1]].T.reshape(-1, 2) * square_size
+
+    object_points, image_points = [], []
+    image_size = None
+    for image in images:
+        if image is None:
+            continue
+        corners = find_chessboard(image, pattern_size)
+        if corners is None:
+            continue
+        image_size = (image.shape[1], image.shape[0])
+        object_points.append(object_template)
+        image_points.append(corners)
+
+    if len(image_points) < min_views:
+        print(f"체스보드 감지 이미지 부족: {len(image_points)}/{min_views}")
+        return {'calibrated': False, 'views': len(image_points)}
+
+    rms, camera_matrix, dist_coeffs, _, _ = cv2.calibrateCamera(
+        object_points, image_points, image_size, None, None)
+
+    return {
+        'camera_matrix': camera_matrix,
+        'distortion_coefficients': dist_coeffs.ravel(),
+        'rms_error': float(rms),
+        'image_size': image_size,
+        'views': len(image_points),
+        'calibrated': True
+    }
+
+
+def save_calibration(calibration: Dict, filepath: str = DEFAULT_CALIBRATION_FILE) -> bool:
+    """
+    카메라 보정 결과를 JSON으로 저장
+
+    Args:
+        calibration: calibrate_chessboard / CameraModule.calibrate_camera 결과
+        filepath: 저장 경로 (디렉터리가 없으면 생성)
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    if not calibration or not calibration.get('calibrated'):
+        return False
+    data = {
+        'camera_matrix': np.asarray(calibration['camera_matrix'], dtype=np.float64).tolist(),
+        'distortion_coefficients': np.asarray(calibration['distortion_coefficients'], dtype=np.float64).ravel().tolist(),
+        'calibrated': True
+    }
+    for key in ('rms_error', 'image_size', 'views'):
+        if key in calibration:
+            data[key] = np.asarray(calibration[key]).tolist()
+    try:
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return True
+    except OSError as e:
+        print(f"카메라 보정 저장 오류: {e}")
+        return False
+
+
+def load_calibration(filepath: str = DEFAULT_CALIBRATION_FILE) -> Optional[Dict]:
+    """
+    저장된 카메라 보정 결과 로드
+
+    Returns:
+        보정 결과 딕셔너리 (numpy 배열) 또는 None (파일 없음/손상)
+    """
+    if not os.path.exists(filepath):
+        return None
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['camera_matrix'] = np.array(data['camera_matrix'], dtype=np.float64)
+        data['distortion_coefficients'] = np.array(data['distortion_coefficients'], dtype=np.float64)
+        return data if data.get('calibrated') else None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"카메라 보정 로드 오류: {e}")
+        return None
+
+
+class PanelGeometry:
+    """왜곡 보정 + 패널 원근 변환 합성 remap 클래스"""
+
+    def __init__(self, output_size: Optional[Tuple[int, int]] = None, pose_tolerance: float = 1.0):
+        """
+        패널 기하 보정 초기화
+
+        Args:
+            output_size: 패널 래스터 크기 (width, height), None이면 첫 패널 크기로 고정
+            pose_tolerance: 맵을 다시 만들 최소 코너 이동량 (픽셀)
+        """
+        self.output_size = output_size
+        self.pose_tolerance = pose_tolerance
+
+        self.camera_matrix = None
+        self.dist_coeffs = None
+        self.corners = None  # 현재 맵의 패널 코너 (원본 프레임 좌표)
+        self.homography = None  # 왜곡 보정된 좌표 → 패널 래스터
+        self.map1 = None
+        self.map2 = None
+        self.map_builds = 0  # 맵 생성 횟수
+
+    @property
+    def is_calibrated(self) -> bool:
+        """렌즈 보정 적용 여부"""
+        return self.camera_matrix is not None
+
+    def set_calibration(self, calibration: Optional[Dict]):
+        """
+        카메라 보정 결과 적용 (None이면 보정 해제, 패널 원근 변환만 수행)
+
+        Args:
+            calibration: calibrate_chessboard / CameraModule.calibrate_camera 결과
+        """
+        if calibration and calibration.get('calibrated'):
+            self.camera_matrix = np.asarray(calibration['camera_matrix'], dtype=np.float64)
+            self.dist_coeffs = np.asarray(calibration['distortion_coefficients'], dtype=np.float64)
+        else:
+            self.camera_matrix = None
+            self.dist_coeffs = None
+        self.invalidate()
+
+    def save_calibration(self, filepath: str = DEFAULT_CALIBRATION_FILE) -> bool:
+        """현재 카메라 보정 결과를 JSON으로 저장"""
+        if not self.is_calibrated:
+            return False
+        return save_calibration({
+            'camera_matrix': self.camera_matrix,
+            'distortion_coefficients': self.dist_coeffs,
+            'calibrated': True
+        }, filepath)
+
+    def load_calibration(self, filepath: str = DEFAULT_CALIBRATION_FILE) -> bool:
+        """JSON 카메라 보정 결과 로드 후 적용 (파일이 없으면 보정 없이 유지)"""
+        calibration = load_calibration(filepath)
+        if calibration is None:
+            return False
+        self.set_calibration(calibration)
+        return self.is_calibrated
+
+    def invalidate(self):
+        """캐시된 맵 폐기 (다음 update_pose에서 다시 생성)"""
+        self.corners = None
+        self.homography = None
+        self.map1 = None
+        self.map2 = None
+
+    def update_pose(self, corners: np.ndarray) -> bool:
+        """
+        패널 코너 갱신 (코너가 허용치 이상 움직였을 때만 맵 재생성)
+
+        Args:
+            corners: (4, 2) 패널 코너 (좌상, 우상, 우하, 좌하), 원본(왜곡된) 프레임 좌표
+
+        Returns:
+            bool: 맵을 새로 만들었는지 여부
+        """
+        corners = np.asarray(corners, dtype=np.float32).reshape(4, 2)
+        if (self.map1 is not None and self.corners is not None
+                and np.abs(corners - self.corners).max() <= self.pose_tolerance):
+            return False
+
+        self._build_maps(corners)
+        return True
+
+    def warp(self, frame: np.ndarray, corners: Optional[np.ndarray] = None,
+             dst: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        프레임을 정면 패널 래스터로 변환 (왜곡 보정 + 원근 변환을 한 번의 remap으로)
+
+        Args:
+            frame: 원본 프레임
+            corners: 패널 코너 (주어지면 update_pose 먼저 수행)
+            dst: 출력 버퍼 (선택사항)
+
+        Returns:
+            패널 래스터 이미지 또는 None (패널 자세 미설정)
+        """
+        if corners is not None:
+            self.update_pose(corners)
+        if self.map1 is None:
+            return None
+        return cv2.remap(frame, self.map1, self.map2, cv2.INTER_LINEAR, dst=dst,
+                         borderMode=cv2.BORDER_CONSTANT)
+
+    def panel_to_frame(self, points: np.ndarray) -> np.ndarray:
+        """
+        패널 래스터 좌표를 원본 프레임 좌표로 변환 (결함 위치 표시용)
+
+        Args:
+            points: (N, 2) 패널 래스터 좌표
+
+        Returns:
+            (N, 2) 원본 프레임 좌표
+        """
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 1, 2)
+        undistorted = cv2.perspectiveTransform(points, np.linalg.inv(self.homography))
+        if not self.is_calibrated:
+            return undistorted.reshape(-1, 2)
+
+        normalized = cv2.undistortPoints(undistorted, self.camera_matrix, None)
+        object_points = cv2.convertPointsToHomogeneous(normalized).astype(np.float64)
+        projected, _ = cv2.projectPoints(object_points, np.zeros(3), np.zeros(3),
+                                         self.camera_matrix, self.dist_coeffs)
+        return projected.reshape(-1, 2)
+
+    def _build_maps(self, corners: np.ndarray):
+        """패널 호모그래피와 렌즈 왜곡을 합성한 remap 맵 생성"""
+        if self.output_size is None:
+            top = np.linalg.norm(corners[1] - corners[0])
+            bottom = np.linalg.norm(corners[2] - corners[3])
+            left = np.linalg.norm(corners[3] - corners[0])
+            right = np.linalg.norm(corners[2] - corners[1])
+            self.output_size = (int(round((top + bottom) / 2)) + 1, int(round((left + right) / 2)) + 1)
+        width, height = self.output_size
+
+        if self.is_calibrated:
+            camera_matrix, dist_coeffs = self.camera_matrix, self.dist_coeffs
+            undistorted = cv2.undistortPoints(corners.reshape(-1, 1, 2), camera_matrix, dist_coeffs,
+                                              P=camera_matrix).reshape(4, 2)
+        else:
+            camera_matrix, dist_coeffs = np.eye(3), np.zeros(5)
+            undistorted = corners
+
+        # 코너는 가장자리 픽셀 중심이므로 래스터의 첫/마지막 픽셀 중심(0, size-1)에 대응
+        target = np.float32([[0, 0], [width - 1, 0], [width - 1, height - 1], [0, height - 1]])
+        self.homography = cv2.getPerspectiveTransform(undistorted.astype(np.float32), target)
+
+        # 출력 픽셀 → (H·K)^-1 → 정규화 좌표 → 왜곡 → 원본 픽셀 좌표
+        self.map1, self.map2 = cv2.initUndistortRectifyMap(
+            camera_matrix, dist_coeffs, None, self.homography @ camera_matrix,
+            (width, height), cv2.CV_16SC2)
+        self.corners = corners.copy()
+        self.map_builds += 1
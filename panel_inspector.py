@@ -16,6 +16,8 @@ from datetime import datetime
 import json
 import os
 
+from frame_source import open_capture
+
 class PanelInspector:
     """패널 검사 시스템 메인 클래스"""
     
@@ -140,7 +142,7 @@ class PanelInspector:
     def start_camera(self):
         """카메라 시작"""
         try:
-            self.camera = cv2.VideoCapture(0)
+            self.camera = open_capture()
             if not self.camera.isOpened():
                 messagebox.showerror("오류", "카메라를 열 수 없습니다.")
                 return
@@ -13,6 +13,8 @@ from PIL import Image, ImageTk
 import threading
 import time
 
+from frame_source import open_capture
+
 class QuickReflectionFix:
     """빠른 반사 제거 도구"""
     
@@ -93,7 +95,7 @@ class QuickReflectionFix:
     def start_camera(self):
         """카메라 시작"""
         try:
-            self.camera = cv2.VideoCapture(0)
+            self.camera = open_capture()
             if not self.camera.isOpened():
                 messagebox.showerror("오류", "카메라를 열 수 없습니다.")
                 return
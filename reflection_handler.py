@@ -14,6 +14,9 @@ import threading
 import time
 from datetime import datetime
 
+from auto_exposure import AutoExposureController, brightness_target
+from frame_source import open_capture
+
 class ReflectionHandler:
     """반사 제거 및 조명 제어 클래스"""
     
@@ -21,6 +24,7 @@ class ReflectionHandler:
         self.camera = None
         self.camera_running = False
         self.current_frame = None
+        self.auto_exposure = None  # 하드웨어 자동 노출 (조명 밝기 슬라이더 = 목표 밝기 배율)
         self.reflection_mask = None
         self.setup_ui()
         
@@ -68,8 +72,8 @@ class ReflectionHandler:
         lighting_frame.pack(side=tk.LEFT, padx=20)
         
         ttk.Label(lighting_frame, text="조명 밝기:").pack(side=tk.LEFT)
-        self.brightness_var = tk.DoubleVar(value=0.5)
-        brightness_scale = ttk.Scale(lighting_frame, from_=0.0, to=1.0, 
+        self.brightness_var = tk.DoubleVar(value=1.0)
+        brightness_scale = ttk.Scale(lighting_frame, from_=0.1, to=2.0, 
                                    variable=self.brightness_var, orient=tk.HORIZONTAL, length=100)
         brightness_scale.pack(side=tk.LEFT, padx=5)
         
@@ -157,7 +161,7 @@ class ReflectionHandler:
     def start_camera(self):
         """카메라 시작"""
         try:
-            self.camera = cv2.VideoCapture(0)
+            self.camera = open_capture()
             if not self.camera.isOpened():
                 messagebox.showerror("오류", "카메라를 열 수 없습니다.")
                 return
@@ -166,6 +170,8 @@ class ReflectionHandler:
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
             self.camera.set(cv2.CAP_PROP_FPS, 30)
+            self.camera.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25)  # 수동 노출 (자동 노출은 직접 제어)
+            self.auto_exposure = AutoExposureController(self.camera)
             
             self.camera_running = True
             self.log_result("카메라가 시작되었습니다.")
@@ -180,6 +186,7 @@ class ReflectionHandler:
     def stop_camera(self):
         """카메라 중지"""
         self.camera_running = False
+        self.auto_exposure = None
         if self.camera:
             self.camera.release()
             self.camera = None
@@ -193,6 +200,9 @@ class ReflectionHandler:
             try:
                 ret, frame = self.camera.read()
                 if ret:
+                    if self.auto_exposure is not None:
+                        self.auto_exposure.target = brightness_target(self.brightness_var.get())
+                        self.auto_exposure.update(frame)
                     self.current_frame = frame.copy()
                     self.update_displays(frame)
                 time.sleep(0.03)  # 30 FPS
@@ -277,10 +287,6 @@ class ReflectionHandler:
             result = frame.copy()
             result[bright_mask > 0] = blurred[bright_mask > 0]
             
-            # 밝기 조정
-            brightness = self.brightness_var.get()
-            result = cv2.convertScaleAbs(result, alpha=brightness, beta=0)
-            
             return result
             
         except Exception as e:
@@ -299,13 +305,7 @@ class ReflectionHandler:
             pts2 = np.float32([[0, 0], [width, 0], [50, height], [width-50, height]])
             
             matrix = cv2.getPerspectiveTransform(pts1, pts2)
-            result = cv2.warpPerspective(frame, matrix, (width, height))
-            
-            # 밝기 조정
-            brightness = self.brightness_var.get()
-            result = cv2.convertScaleAbs(result, alpha=brightness, beta=0)
-            
-            return result
+            return cv2.warpPerspective(frame, matrix, (width, height))
             
         except Exception as e:
             self.log_result(f"각도 조정 처리 오류: {str(e)}")
@@ -314,12 +314,8 @@ class ReflectionHandler:
     def lighting_control(self, frame):
         """조명 제어"""
         try:
-            # 밝기 조정
-            brightness = self.brightness_var.get()
-            result = cv2.convertScaleAbs(frame, alpha=brightness, beta=0)
-            
-            # 대비 조정
-            lab = cv2.cvtColor(result, cv2.COLOR_BGR2LAB)
+            # 밝기는 카메라 자동 노출로 조정됨, 대비 조정
+            lab = cv2.cvtColor(frame, cv2.COLOR_BGR2LAB)
             l, a, b = cv2.split(lab)
             
             # CLAHE (Contrast Limited Adaptive Histogram Equalization) 적용
@@ -360,10 +356,6 @@ class ReflectionHandler:
             # 3. 색상 보정
             result = cv2.bilateralFilter(result, 9, 75, 75)
             
-            # 밝기 조정
-            brightness = self.brightness_var.get()
-            result = cv2.convertScaleAbs(result, alpha=brightness, beta=0)
-            
             return result
             
         except Exception as e:
@@ -372,24 +364,19 @@ class ReflectionHandler:
     
     def optimize_lighting(self):
         """조명 최적화"""
-        if self.current_frame is None:
+        if self.current_frame is None or self.camera is None:
             messagebox.showwarning("경고", "먼저 카메라를 시작하세요.")
             return
         
         try:
-            # 현재 프레임 분석
-            gray = cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2GRAY)
-            
-            # 평균 밝기 계산
-            mean_brightness = np.mean(gray)
-            
-            # 최적 밝기 계산 (128 목표)
-            optimal_alpha = 128.0 / mean_brightness if mean_brightness > 0 else 1.0
-            
-            # 밝기 조정
-            self.brightness_var.set(min(1.0, max(0.1, optimal_alpha)))
-            
-            self.log_result(f"조명 최적화 완료: 평균 밝기 {mean_brightness:.1f} -> 목표 128")
+            # 목표 밝기(중앙값 128)로 되돌리고 카메라 노출/게인을 다시 수렴시킴
+            self.brightness_var.set(1.0)
+            if self.auto_exposure is None:
+                self.auto_exposure = AutoExposureController(self.camera)
+            level = self.auto_exposure.measure(self.current_frame)
+            self.auto_exposure.reset()
+            
+            self.log_result(f"조명 최적화 시작: 중앙 밝기 {level:.1f} -> 목표 128 (카메라 노출/게인 조정)")
             
         except Exception as e:
             self.log_result(f"조명 최적화 오류: {str(e)}")
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검사 결과 일괄 재채점 모듈
+Batch Re-scoring Module
+
+저장된 검사 결과(InspectionController 결과 디렉토리)의 결함 데이터를 불러와
+비전 파이프라인을 다시 실행하지 않고 새 등급 규칙을 벡터 연산으로 일괄 적용
+"""
+
+import csv
+import glob
+import json
+import os
+import numpy as np
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+@dataclass
+class GradeTier:
+    """등급 구간 (모든 조건을 만족하면 해당 등급)"""
+    grade: str
+    base_score: float
+    max_dead_pixels: float = np.inf
+    max_hot_pixels: float = np.inf
+    max_total_defects: float = np.inf
+    max_scratches: float = np.inf
+
+
+@dataclass
+class GradingRules:
+    """등급 규칙 테이블 (위에서부터 먼저 만족하는 구간이 적용됨)"""
+    tiers: List[GradeTier]
+    fail_grade: str = 'F'
+    fail_base_score: float = 50.0
+    density_weight: float = 10.0  # score = base_score + density_weight * (1 - defect_density)
+    name: str = 'custom'
+
+    @classmethod
+    def default(cls) -> 'GradingRules':
+        """PixelDefectDetection.calculate_quality_grade 와 동일한 기본 규칙"""
+        return cls(
+            tiers=[
+                GradeTier('A', 90, max_dead_pixels=1, max_hot_pixels=1, max_total_defects=2),
+                GradeTier('B', 80, max_dead_pixels=3, max_hot_pixels=3, max_total_defects=6),
+                GradeTier('C', 70, max_dead_pixels=5, max_hot_pixels=5, max_total_defects=10),
+                GradeTier('D', 60, max_dead_pixels=10, max_hot_pixels=10, max_total_defects=20),
+            ],
+            name='default'
+        )
+
+    @classmethod
+    def iso_13406_2(cls) -> 'GradingRules':
+        """ISO 13406-2 데드픽셀 클래스 규칙 (quality_standards.md)"""
+        return cls(
+            tiers=[
+                GradeTier('Class 0', 90, max_dead_pixels=0),
+                GradeTier('Class 1', 80, max_dead_pixels=1),
+                GradeTier('Class 2', 70, max_dead_pixels=2),
+                GradeTier('Class 3', 60, max_dead_pixels=3),
+            ],
+            name='iso_13406_2'
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GradingRules':
+        """딕셔너리(JSON)에서 규칙 생성"""
+        tiers = [GradeTier(**tier) for tier in data['tiers']]
+        options = {k: v for k, v in data.items() if k != 'tiers'}
+        return cls(tiers=tiers, **options)
+
+    @classmethod
+    def load(cls, filepath: str) -> 'GradingRules':
+        """JSON 파일에서 규칙 로드"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @property
+    def grades(self) -> List[str]:
+        """규칙의 등급 목록 (불합격 등급 포함)"""
+        return [tier.grade for tier in self.tiers] + [self.fail_grade]
+
+
+@dataclass
+class DefectTable:
+    """저장된 검사 결과의 열 기반(columnar) 결함 데이터"""
+    filenames: List[str] = field(default_factory=list)
+    timestamps: List[str] = field(default_factory=list)
+    dead_pixels: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    hot_pixels: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    stuck_pixels: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    scratches: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    display_area: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    previous_grades: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.filenames)
+
+
+class RescoringEngine:
+    """저장된 검사 결과 일괄 재채점 클래스"""
+
+    def __init__(self, results_directory: str = "inspection_results"):
+        """
+        재채점 엔진 초기화
+
+        Args:
+            results_directory: 검사 결과 디렉토리 (InspectionController.results_directory)
+        """
+        self.results_directory = results_directory
+        self.table = DefectTable()
+
+    def load_results(self, pattern: str = "inspection_*.json") -> DefectTable:
+        """
+        결과 디렉토리의 검사 결과를 열 기반 테이블로 로드
+
+        Args:
+            pattern: 결과 파일 glob 패턴
+
+        Returns:
+            DefectTable: 로드된 결함 데이터
+        """
+        filenames, timestamps, previous_grades = [], [], []
+        rows = []
+
+        for filepath in sorted(glob.glob(os.path.join(self.results_directory, pattern))):
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    result = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"검사 결과 로드 오류 ({filepath}): {e}")
+                continue
+
+            pixel_defects = result.get('pixel_defects', {})
+            quality_grade = result.get('quality_grade', {})
+            region = result.get('display_region') or (0, 0, 0, 0)
+
+            rows.append((
+                len(pixel_defects.get('dead_pixels', [])),
+                len(pixel_defects.get('hot_pixels', [])),
+                len(pixel_defects.get('stuck_pixels', [])),
+                len(result.get('scratches', [])),
+                int(region[2]) * int(region[3])
+            ))
+            filenames.append(os.path.basename(filepath))
+            timestamps.append(result.get('timestamp', ''))
+            previous_grades.append(quality_grade.get('grade', ''))
+
+        columns = np.array(rows, dtype=np.int64).reshape(-1, 5)
+
+        self.table = DefectTable(
+            filenames=filenames,
+            timestamps=timestamps,
+            dead_pixels=columns[:, 0],
+            hot_pixels=columns[:, 1],
+            stuck_pixels=columns[:, 2],
+            scratches=columns[:, 3],
+            display_area=columns[:, 4],
+            previous_grades=previous_grades
+        )
+        return self.table
+
+    def rescore(self, rules: GradingRules, table: Optional[DefectTable] = None) -> Dict[str, np.ndarray]:
+        """
+        등급 규칙을 전체 결과에 한 번에 적용
+
+        Args:
+            rules: 새 등급 규칙
+            table: 결함 데이터 (None이면 마지막으로 로드한 테이블)
+
+        Returns:
+            'grade', 'score', 'defect_density' 배열 딕셔너리
+        """
+        table = self.table if table is None else table
+
+        dead = table.dead_pixels
+        hot = table.hot_pixels
+        total = dead + hot + table.stuck_pixels
+        area = table.display_area
+        density = np.divide(total, area, out=np.zeros(len(table), dtype=np.float64), where=area > 0)
+
+        conditions = [
+            (dead <= tier.max_dead_pixels)
+            & (hot <= tier.max_hot_pixels)
+            & (total <= tier.max_total_defects)
+            & (table.scratches <= tier.max_scratches)
+            for tier in rules.tiers
+        ]
+        tier_index = np.select(conditions, np.arange(len(rules.tiers)), default=len(rules.tiers))
+
+        base_scores = np.array([tier.base_score for tier in rules.tiers] + [rules.fail_base_score])
+        scores = np.clip(base_scores[tier_index] + rules.density_weight * (1 - density), 0, 100)
+
+        return {
+            'grade': np.array(rules.grades, dtype=object)[tier_index],
+            'score': scores,
+            'defect_density': density
+        }
+
+    def write_summary(self, rules: GradingRules, rescored: Dict[str, np.ndarray],
+                      filename: Optional[str] = None) -> str:
+        """
+        재채점 요약 저장 (JSON 요약 + 결과별 CSV)
+
+        Args:
+            rules: 적용한 등급 규칙
+            rescored: rescore() 결과
+            filename: 요약 파일명 (None이면 자동 생성, 확장자 제외)
+
+        Returns:
+            저장된 JSON 요약 파일 경로
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"rescore_{rules.name}_{timestamp}"
+
+        table = self.table
+        grades = rescored['grade']
+        previous = np.array(table.previous_grades, dtype=object)
+
+        distribution = {grade: int(np.count_nonzero(grades == grade)) for grade in rules.grades}
+        changed = int(np.count_nonzero(grades != previous)) if len(table) else 0
+
+        summary = {
+            'rules': rules.name,
+            'generated_at': datetime.now().isoformat(),
+            'total_results': len(table),
+            'grade_distribution': distribution,
+            'changed_grades': changed,
+            'average_score': float(np.mean(rescored['score'])) if len(table) else 0.0,
+            'min_score': float(np.min(rescored['score'])) if len(table) else 0.0,
+            'max_score': float(np.max(rescored['score'])) if len(table) else 0.0
+        }
+
+        json_path = os.path.join(self.results_directory, f"{filename}.json")
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        csv_path = os.path.join(self.results_directory, f"{filename}.csv")
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow([
+                'File', 'Timestamp', 'Previous Grade', 'Grade', 'Score',
+                'Dead Pixels', 'Hot Pixels', 'Stuck Pixels', 'Scratches', 'Defect Density'
+            ])
+            for i in range(len(table)):
+                writer.writerow([
+                    table.filenames[i],
+                    table.timestamps[i],
+                    table.previous_grades[i],
+                    grades[i],
+                    f"{rescored['score'][i]:.2f}",
+                    int(table.dead_pixels[i]),
+                    int(table.hot_pixels[i]),
+                    int(table.stuck_pixels[i]),
+                    int(table.scratches[i]),
+                    f"{rescored['defect_density'][i]:.6f}"
+                ])
+
+        return json_path
+
+    def regrade(self, rules: GradingRules, filename: Optional[str] = None) -> Dict:
+        """
+        결과 로드 → 재채점 → 요약 저장을 한 번에 수행
+
+        Args:
+            rules: 새 등급 규칙
+            filename: 요약 파일명 (선택사항)
+
+        Returns:
+            재채점 결과 및 요약 파일 경로
+        """
+        self.load_results()
+        rescored = self.rescore(rules)
+        summary_path = self.write_summary(rules, rescored, filename)
+        return {
+            'total_results': len(self.table),
+            'rescored': rescored,
+            'summary_path': summary_path
+        }
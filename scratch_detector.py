@@ -12,6 +12,8 @@ from tkinter import ttk, messagebox
 import threading
 import time
 
+from frame_source import open_capture
+
 class ScratchDetector:
     def __init__(self):
         self.camera = None
@@ -24,7 +26,7 @@ class ScratchDetector:
     def start_camera(self):
         """카메라 시작"""
         try:
-            self.camera = cv2.VideoCapture(0)
+            self.camera = open_capture()
             if not self.camera.isOpened():
                 raise Exception("카메라를 열 수 없습니다")
             
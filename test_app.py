@@ -74,13 +74,404 @@ def test_camera():
             print("✓ 카메라 연결 해제 성공")
         else:
             print("⚠️ 카메라 연결 실패 (카메라가 연결되지 않았을 수 있음)")
-            
+
+        # image= 버퍼를 무시하는 소스: 연결 직후 get_frame이 첫 프레임을 기다리고, 풀은 재생성되지 않음
+        import time
+        import numpy as np
+        from frame_source import FrameSource
+
+        class AllocatingSource(FrameSource):
+            def __init__(self):
+                self.opened = False
+
+            def connect(self):
+                self.opened = True
+                return True
+
+            def disconnect(self):
+                self.opened = False
+
+            def is_connected(self):
+                return self.opened
+
+            def read(self, image=None):
+                time.sleep(0.005)
+                return True, np.zeros((48, 64, 3), np.uint8)
+
+        camera = CameraModule(source=AllocatingSource())
+        if camera.connect():
+            first = camera.get_frame()
+            pool = camera.frame_pool
+            for _ in range(10):
+                camera.read()
+            allocations = pool.allocations
+            for _ in range(10):
+                camera.read()
+            camera.disconnect()
+            if first is not None and camera.frame_pool is pool and pool.allocations == allocations:
+                print("✓ 첫 프레임 대기 및 캡처 버퍼 재사용 확인")
+            else:
+                print(f"❌ 첫 프레임 {first is not None}, 풀 유지 {camera.frame_pool is pool}")
+        else:
+            print("❌ 프레임 소스 열기 실패")
+
         return True
         
     except Exception as e:
         print(f"❌ 카메라 테스트 오류: {e}")
         return False
 
+def test_replay_source():
+    """재생 소스 테스트"""
+    try:
+        print("\n재생 소스 테스트 중...")
+
+        import tempfile
+        import numpy as np
+        from camera_module import CameraModule
+        from frame_source import NpyStackSource
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # 카메라 없이 .npy 프레임 스택 재생
+            stack_path = os.path.join(temp_dir, "frames.npy")
+            np.save(stack_path, np.stack([np.full((48, 64, 3), i * 10, np.uint8) for i in range(4)]))
+            replay = CameraModule(source=NpyStackSource(stack_path, realtime=False), threaded=False)
+            if replay.connect():
+                values = [int(replay.read()[1][0, 0, 0]) for _ in range(3)]
+                replay.disconnect()
+                if values == [0, 10, 20] and abs(replay.frame_timestamp - 2 / 30) < 1e-9:
+                    print("✓ 재생 소스 프레임/타임스탬프 확인")
+                else:
+                    print(f"❌ 재생 소스 결과 불일치: {values}")
+            else:
+                print("❌ 재생 소스 열기 실패")
+
+            # 캡처 스레드 재생: 프레임을 건너뛰지 않고, 끝에 도달하면 read가 바로 실패
+            replay = CameraModule(source=NpyStackSource(stack_path, realtime=False))
+            if replay.connect():
+                results = [replay.read() for _ in range(5)]
+                replay.disconnect()
+                values = [int(frame[0, 0, 0]) for ret, frame in results if ret]
+                if values == [0, 10, 20, 30] and not results[-1][0] and replay.eof:
+                    print("✓ 캡처 스레드 재생 순서/종료 확인")
+                else:
+                    print(f"❌ 캡처 스레드 재생 결과 불일치: {values} (eof {replay.eof})")
+            else:
+                print("❌ 재생 소스 열기 실패")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 재생 소스 테스트 오류: {e}")
+        return False
+
+def test_camera_array():
+    """다중 카메라 동기 캡처 테스트"""
+    try:
+        print("\n다중 카메라 테스트 중...")
+
+        import tempfile
+        import numpy as np
+        from camera_array import CameraArray
+        from camera_module import CameraModule
+        from frame_source import NpyStackSource
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # 좌우 타일 재생 소스 2개 → 패널 합성
+            panel = np.random.RandomState(0).randint(0, 255, (4, 60, 100, 3)).astype(np.uint8)
+            np.save(os.path.join(temp_dir, "left.npy"), panel[:, :, :60])
+            np.save(os.path.join(temp_dir, "right.npy"), panel[:, :, 40:])
+            cameras = [CameraModule(source=NpyStackSource(os.path.join(temp_dir, name), loop=True), ring_size=4)
+                       for name in ("left.npy", "right.npy")]
+            shift = np.array([[1, 0, 40], [0, 1, 0], [0, 0, 1]], dtype=np.float64)
+            array = CameraArray(cameras, homographies=[np.eye(3), shift], canvas_size=(100, 60))
+            if array.connect():
+                with array.get_frame_set() as frame_set:
+                    index = int(round(frame_set.timestamps[0] * 30)) % 4
+                    stitched = array.stitch(frame_set)
+                array.shutdown()
+                if frame_set.skew == 0 and np.array_equal(stitched, panel[index]):
+                    print("✓ 다중 카메라 동기 합성 성공")
+                else:
+                    print(f"❌ 다중 카메라 합성 결과 불일치 (시각 차이 {frame_set.skew})")
+            else:
+                print("❌ 카메라 배열 연결 실패")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 다중 카메라 테스트 오류: {e}")
+        return False
+
+def test_capture_telemetry():
+    """캡처 통계 테스트"""
+    try:
+        print("\n캡처 통계 테스트 중...")
+
+        from capture_telemetry import CaptureTelemetry
+
+        # 30fps에서 3번 프레임 누락 → 드롭 1
+        telemetry = CaptureTelemetry(nominal_fps=30)
+        for index in (0, 1, 2, 4, 5):
+            telemetry.record_frame(index / 30, 3.0)
+        stats = telemetry.snapshot()
+        if stats['dropped'] == 1 and abs(stats['effective_fps'] - 24.0) < 1e-6:
+            print("✓ 캡처 통계 드롭 프레임 집계 성공")
+        else:
+            print(f"❌ 캡처 통계 결과 불일치: {stats}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 캡처 통계 테스트 오류: {e}")
+        return False
+
+def test_frame_quality():
+    """프레임 품질 게이트 테스트"""
+    try:
+        print("\n프레임 품질 게이트 테스트 중...")
+
+        import cv2
+        import numpy as np
+        from frame_quality import FrameQualityGate
+
+        # 정상 → 통과, 블러/패턴 전환/과노출 → 제외
+        gate = FrameQualityGate()
+        textured = np.full((240, 320, 3), 100, np.uint8)
+        textured[::16] = 160
+        textured[:, ::16] = 160
+        results = [gate.check(textured)[1]['reason'], gate.check(cv2.GaussianBlur(textured, (9, 9), 0))[1]['reason'],
+                   gate.check(textured)[1]['reason'], gate.check(textured // 2)[1]['reason'],
+                   gate.check(np.full_like(textured, 255))[1]['reason']]
+        if results == [None, 'focus', None, 'change', 'clipped']:
+            print("✓ 프레임 품질 게이트 성공")
+        else:
+            print(f"❌ 프레임 품질 게이트 결과 불일치: {results}")
+
+        # 질감 패턴 → 단색 패턴 전환: 초점 기준이 재설정되어 단색 프레임도 다시 통과
+        # (밝기가 다른 단색은 'change'로 즉시 재설정, 밝기가 같은 단색은 연속 초점 제외 한도 후 재설정)
+        for level, expected in ((40, 'change'), (107, 'focus')):
+            gate = FrameQualityGate()
+            for _ in range(3):
+                gate.check(textured)
+            solid = np.full_like(textured, level)
+            reasons = [gate.check(solid)[1]['reason'] for _ in range(gate.max_focus_rejects + 2)]
+            if reasons[0] == expected and reasons[-1] is None and reasons.count('focus') <= gate.max_focus_rejects:
+                print(f"✓ 패턴 전환 후 초점 기준 재설정 성공 ({reasons.count('focus')}프레임 제외)")
+            else:
+                print(f"❌ 패턴 전환 후 초점 제외 지속: {reasons}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 프레임 품질 게이트 테스트 오류: {e}")
+        return False
+
+def test_auto_exposure():
+    """하드웨어 자동 노출 테스트"""
+    try:
+        print("\n자동 노출 테스트 중...")
+
+        import cv2
+        import numpy as np
+        from auto_exposure import AutoExposureController
+
+        # 노출 1스톱 = 밝기 2배인 가상 장치 (설정은 다음 프레임부터 반영)
+        class SimulatedCamera:
+            def __init__(self):
+                self.props = {cv2.CAP_PROP_EXPOSURE: -10.0, cv2.CAP_PROP_GAIN: 0.0}
+
+            def get(self, prop_id):
+                return self.props.get(prop_id, 0.0)
+
+            def set(self, prop_id, value):
+                self.props[prop_id] = value
+                return True
+
+        device = SimulatedCamera()
+        controller = AutoExposureController(device, target=128)
+        scene = np.tile(np.linspace(0.2, 1.0, 64, dtype=np.float32), (48, 1))
+        for _ in range(40):
+            level = 2000 * scene * 2 ** device.props[cv2.CAP_PROP_EXPOSURE]
+            controller.update(np.clip(level, 0, 255).astype(np.uint8))
+        if controller.converged and abs(controller.level - 128) < 16:
+            print("✓ 하드웨어 자동 노출 수렴 성공")
+        else:
+            print(f"❌ 자동 노출 수렴 실패: 밝기 {controller.level}, 노출 {controller.exposure}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 자동 노출 테스트 오류: {e}")
+        return False
+
+def test_frame_stacker():
+    """프레임 누적 테스트"""
+    try:
+        print("\n프레임 누적 테스트 중...")
+
+        import numpy as np
+        from frame_stacker import FrameStacker
+
+        # 8프레임 평균 → 노이즈 표준편차 약 1/sqrt(8)
+        noise_source = np.random.RandomState(2)
+        for window in ("boxcar", "exponential"):
+            stacker = FrameStacker(8, window)
+            for _ in range(24):
+                stacker.add(np.clip(100.5 + noise_source.normal(0, 6, (48, 64)), 0, 255).astype(np.uint8))
+            noise = stacker.average(dtype=np.float32).std()
+            if stacker.ready and abs(noise - 6 * stacker.noise_factor) < 0.6:
+                print(f"✓ 프레임 누적 ({window}) 노이즈 감소 성공")
+            else:
+                print(f"❌ 프레임 누적 ({window}) 노이즈 불일치: {noise:.2f}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 프레임 누적 테스트 오류: {e}")
+        return False
+
+def test_hdr_capture():
+    """노출 브래킷 HDR 캡처 테스트"""
+    try:
+        print("\nHDR 캡처 테스트 중...")
+
+        import tempfile
+        import numpy as np
+        from camera_module import CameraModule
+        from frame_source import NpyStackSource
+        from hdr_capture import HDRCapture
+
+        # 브래킷 융합 (어두운 노출은 밝은 영역, 밝은 노출은 어두운 영역 담당)
+        dark = np.full((8, 8, 3), 120, np.uint8)
+        dark[:, :4] = 5
+        bright = np.full((8, 8, 3), 255, np.uint8)
+        bright[:, :4] = 120
+        fused = HDRCapture(CameraModule(threaded=False), exposures=(-8, -4)).fuse([dark, bright])
+        if abs(int(fused[0, 0, 0]) - 120) < 10 and abs(int(fused[0, 7, 0]) - 120) < 10:
+            print("✓ HDR 브래킷 융합 성공")
+        else:
+            print(f"❌ HDR 브래킷 융합 결과 불일치: {fused[0, :, 0]}")
+
+        # 브래킷 중에는 자동 노출을 멈추고, 중지하면 같은 목표의 제어기를 다시 연결
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stack_path = os.path.join(temp_dir, "frames.npy")
+            np.save(stack_path, np.stack([np.full((48, 64, 3), i * 10, np.uint8) for i in range(4)]))
+            camera = CameraModule(source=NpyStackSource(stack_path, realtime=False, loop=True))
+            if camera.connect() and camera.enable_auto_exposure(target=100):
+                controller = camera.auto_exposure
+                hdr = HDRCapture(camera, exposures=(-8, -4), settle_frames=0)
+                started = hdr.start() and camera.auto_exposure is None
+                hdr.stop()
+                camera.disconnect()
+                if started and camera.auto_exposure is controller and controller.target == 100:
+                    print("✓ HDR 중지 후 자동 노출 복원 성공")
+                else:
+                    print(f"❌ HDR 중지 후 자동 노출 복원 실패: {camera.auto_exposure}")
+            else:
+                print("❌ 재생 소스 열기 실패")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ HDR 캡처 테스트 오류: {e}")
+        return False
+
+def test_capture_format():
+    """캡처 포맷 협상 테스트"""
+    try:
+        print("\n캡처 포맷 협상 테스트 중...")
+
+        import tempfile
+        import time
+        import cv2
+        import numpy as np
+        from camera_module import CameraModule
+        from capture_format import FormatCache, fourcc_to_str
+
+        class FakeCapture:
+            """1280x720 MJPG만 지원하고 설정 fps의 10배 속도로 프레임을 내는 가상 장치"""
+
+            def __init__(self):
+                self.props = {cv2.CAP_PROP_FRAME_WIDTH: 640, cv2.CAP_PROP_FRAME_HEIGHT: 480, cv2.CAP_PROP_FPS: 30,
+                              cv2.CAP_PROP_FOURCC: cv2.VideoWriter_fourcc(*'YUYV')}
+
+            def getBackendName(self):
+                return "FAKE"
+
+            def get(self, prop_id):
+                return self.props.get(prop_id, 0.0)
+
+            def set(self, prop_id, value):
+                if prop_id == cv2.CAP_PROP_FRAME_WIDTH and value != 1280:
+                    return False
+                if prop_id == cv2.CAP_PROP_FRAME_HEIGHT and value != 720:
+                    return False
+                if prop_id == cv2.CAP_PROP_FOURCC and fourcc_to_str(value) != 'MJPG':
+                    return False
+                self.props[prop_id] = value
+                return True
+
+            def grab(self):
+                time.sleep(0.1 / self.props[cv2.CAP_PROP_FPS])
+                return True
+
+            def retrieve(self, image=None):
+                return True, np.zeros((720, 1280, 3), np.uint8)
+
+            def read(self, image=None):
+                return self.grab() and self.retrieve(image)
+
+            def isOpened(self):
+                return True
+
+            def release(self):
+                pass
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FormatCache(os.path.join(temp_dir, "formats", "camera_formats.json"))
+            camera = CameraModule(format_cache=cache, calibration_file=None)
+            camera.cap = FakeCapture()
+            camera.fps = 60
+
+            # 지원하지 않는 해상도: 협상 실패 결과는 캐시하지 않음
+            camera.resolution = (1920, 1080)
+            if camera.negotiate_format() is None and not os.path.exists(cache.filepath):
+                print("✓ 협상 실패 결과 캐시 제외")
+            else:
+                print("❌ 협상 실패 결과가 캐시됨")
+
+            # 지원 해상도: 가장 빠른 MJPG@60 선택 후 캐시, 다음 협상은 측정 없이 캐시 적용
+            camera.resolution = (1280, 720)
+            selected = camera.negotiate_format()
+            key = FormatCache.device_key(camera.cap, camera.camera_index, 1280, 720, 60)
+            start = time.perf_counter()
+            cached = camera.negotiate_format()
+            cached_ms = (time.perf_counter() - start) * 1000
+            if (selected is not None and selected['fourcc'] == 'MJPG' and selected['fps'] == 60
+                    and cache.get(key)['selected'] == selected and cached == selected and cached_ms < 50):
+                print("✓ 포맷 협상/캐시 성공 (MJPG@60)")
+            else:
+                print(f"❌ 포맷 협상 결과 불일치: {selected}")
+
+            # 백그라운드 협상: 바로 반환하고 작업 스레드에서 측정/적용
+            camera.capture_format = None
+            start = time.perf_counter()
+            pending = camera.negotiate_format(force=True, background=True)
+            returned_ms = (time.perf_counter() - start) * 1000
+            camera.negotiation_thread.join()
+            if (pending is None and returned_ms < 50 and camera.capture_format is not None
+                    and camera.capture_format['fourcc'] == 'MJPG'):
+                print(f"✓ 백그라운드 포맷 협상 성공 ({returned_ms:.1f}ms에 반환)")
+            else:
+                print(f"❌ 백그라운드 포맷 협상 실패: {camera.capture_format}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 캡처 포맷 협상 테스트 오류: {e}")
+        return False
+
 def test_pattern_generator():
     """테스트 패턴 생성기 테스트"""
     try:
@@ -104,7 +495,72 @@ def test_pattern_generator():
             print("✓ 체스보드 패턴 생성 성공")
         else:
             print("❌ 체스보드 패턴 생성 실패")
-            
+
+        # 정합 마커 삽입 패턴 → 마커 기반 패널 정합 테스트
+        import cv2
+        import numpy as np
+        from fiducial_registration import FiducialRegistration
+
+        pattern = generator.generate_pattern(640, 480, 'solid_black', fiducials=True)
+        frame = np.zeros((720, 960, 3), dtype=np.uint8)
+        frame[120:600, 160:800] = pattern
+        corners = FiducialRegistration((640, 480)).locate_panel(frame)
+        expected = np.float32([[160, 120], [799, 120], [799, 599], [160, 599]])
+        if corners is not None and np.abs(corners - expected).max() < 0.5:
+            print("✓ 정합 마커 패널 정합 성공")
+        else:
+            print(f"❌ 정합 마커 패널 정합 실패: {corners}")
+
+        # 정합 마커가 있는 깨끗한 패널 → 마커/여백은 검사에서 제외되어 마커 없는 패널과 같은 결과
+        from panel_geometry import PanelGeometry
+        from test_pattern_inspector import TestPatternInspector
+
+        inspector = TestPatternInspector.__new__(TestPatternInspector)  # GUI 없이 검사 함수만 사용
+        red = generator.generate_pattern(640, 480, 'solid_red')
+        frame = np.zeros((720, 960, 3), dtype=np.uint8)
+        frame[120:600, 160:800] = generator.add_fiducials(red)
+        inspector.fiducial_registration = FiducialRegistration((640, 480))
+        corners = inspector.fiducial_registration.locate_panel(frame)
+        region = PanelGeometry((800, 600)).warp(frame, corners)
+        with_markers = inspector.perform_inspection(region)
+        inspector.fiducial_registration = None
+        without_markers = inspector.perform_inspection(red)
+        if (with_markers['quality_score'] == without_markers['quality_score']
+                and with_markers['quality_details']['dead_pixel_count'] == 0
+                and with_markers['quality_details']['hot_pixel_count'] == 0
+                and not any("불균일성" in defect for defect in with_markers['defects'])):
+            print(f"✓ 정합 마커 제외 검사 성공: 점수 {with_markers['quality_score']}")
+        else:
+            print(f"❌ 정합 마커 제외 검사 실패: {with_markers['defects']} / {without_markers['defects']}")
+
+        # 1/4 스케일 색상 감지: 8px 간격의 두 패널이 모폴로지로 합쳐지지 않고, 코너는 가장자리 픽셀 중심
+        from corner_refinement import CornerRefiner
+        from panel_detection_engine import PanelDetectionEngine
+
+        inspector.detection_scale = 0.25
+        inspector.detection_engine = PanelDetectionEngine()
+        inspector.corner_refiner = CornerRefiner()
+        inspector.log_result = lambda message: None
+        frame = np.zeros((720, 960, 3), dtype=np.uint8)
+        frame[100:620, 80:600] = (0, 0, 255)
+        frame[100:620, 608:880] = (0, 0, 255)
+        contour = inspector.detect_panel_contour(frame)
+        expected = np.float32([[80, 100], [599, 100], [599, 619], [80, 619]])
+        if contour is not None and np.abs(inspector.panel_corners - expected).max() < 0.5:
+            print("✓ 1/4 스케일 색상 패널 감지 성공")
+        else:
+            print(f"❌ 1/4 스케일 색상 패널 감지 실패: {inspector.panel_corners}")
+
+        # 원본 해상도 기준 필터 크기의 감지 스케일 환산 (홀수, 적응적 임계값 블록은 최소 3)
+        from corner_refinement import scaled_kernel_size
+
+        sizes = [scaled_kernel_size(3), scaled_kernel_size(5), scaled_kernel_size(11, minimum=3),
+                 scaled_kernel_size(11, 1.0), scaled_kernel_size(21, 0.5)]
+        if sizes == [1, 1, 3, 11, 11]:
+            print("✓ 감지 스케일 커널 크기 환산 성공")
+        else:
+            print(f"❌ 감지 스케일 커널 크기 불일치: {sizes}")
+
         return True
         
     except Exception as e:
@@ -133,13 +589,161 @@ def test_edge_detection():
             print("✓ 엣지 디텍션 성공")
         else:
             print("⚠️ 엣지 디텍션 실패 (더미 이미지)")
-            
+
+        # 패널 추적 테스트 (두 번째 프레임은 엣지 띠 검사만으로 추적)
+        panel_image = np.zeros((480, 640, 3), dtype=np.uint8)
+        cv2.rectangle(panel_image, (100, 100), (539, 379), (255, 255, 255), -1)
+        detector.track_display(panel_image)
+        shifted = np.roll(panel_image, (3, 5), axis=(0, 1))
+        tracked = detector.track_display(shifted)
+        if tracked == (105, 103, 440, 280) and detector.tracker.full_detections == 1:
+            print("✓ 패널 추적 성공")
+        else:
+            print(f"⚠️ 패널 추적 결과 불일치: {tracked}")
+
+        # 코너 보정 정확도 테스트 (8배 슈퍼샘플링으로 안티앨리어싱한 기울어진 패널,
+        # 정답 코너는 가장자리 픽셀 중심 = 연속 외곽을 0.5px 안쪽으로 줄인 사각형의 꼭짓점)
+        from corner_refinement import CornerRefiner, order_corners
+
+        def render_panel(center, size, angle, scale=8):
+            outline = order_corners(cv2.boxPoints((center, (size[0] + 1, size[1] + 1), angle)))
+            canvas = np.zeros((480 * scale, 640 * scale), dtype=np.uint8)
+            points = np.round(((outline + 0.5) * scale - 0.5) * 16).astype(np.int32)
+            cv2.fillPoly(canvas, [points], 255, shift=4)
+            image = cv2.resize(canvas, (640, 480), interpolation=cv2.INTER_AREA)
+            return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR), order_corners(cv2.boxPoints((center, size, angle)))
+
+        offsets = np.random.RandomState(3).uniform(-3, 3, (4, 2)).astype(np.float32)
+        errors = []
+        for angle, center in ((0.0, (320.3, 240.6)), (4.0, (318.7, 241.2)), (-7.0, (321.5, 239.4))):
+            image, truth = render_panel(center, (400, 260), angle)
+            refined = CornerRefiner().refine(image, truth + offsets)
+            errors.append(np.linalg.norm(refined - truth, axis=1))
+        errors = np.concatenate(errors)
+        if errors.max() < 0.3:
+            print(f"✓ 코너 보정 정확도 확인 (평균 {errors.mean():.3f}px, 최대 {errors.max():.3f}px)")
+        else:
+            print(f"❌ 코너 보정 오차 초과: 평균 {errors.mean():.3f}px, 최대 {errors.max():.3f}px")
+
+        # 기울어진 패널 추적 테스트 (2° → 3° 회전 + 이동도 변 직선 피팅으로 전체 감지 없이 추적)
+        detector = EdgeDetection()
+        errors = []
+        for angle, center in ((2.0, (320, 240)), (2.5, (323, 242)), (3.0, (327, 245))):
+            tilted_image, truth = render_panel(center, (440, 280), angle)
+            detector.track_display(tilted_image)
+            nearest = [np.linalg.norm(truth - corner, axis=1).min() for corner in detector.last_corners]
+            errors.append(max(nearest))
+        if detector.tracker.full_detections == 1 and max(errors) < 0.5:
+            print(f"✓ 기울어진 패널 추적 성공 (최대 코너 오차 {max(errors):.2f}px)")
+        else:
+            print(f"⚠️ 기울어진 패널 추적 결과 불일치: 전체 감지 {detector.tracker.full_detections}회, 오차 {errors}")
+
+        # 고정 지그 잠금 테스트 (지그보다 어두운 패턴은 통과, 이동 + 재감지 실패 시 윤곽선 유지)
+        from fixture_lock import FixtureLock
+
+        def fixture_scene(level, dx=0):
+            scene = np.full((240, 320, 3), 50, np.uint8)
+            scene[60:180, 80 + dx:240 + dx] = level
+            return scene
+
+        lock = FixtureLock(lambda frame: None)
+        lock.lock(fixture_scene(200), np.array([[80, 60], [239, 60], [239, 179], [80, 179]]))
+        states = []
+        for scene in (fixture_scene(10), fixture_scene(200, dx=8), fixture_scene(200)):
+            contour = lock.update(scene)
+            states.append((contour is not None, lock.flagged))
+        if states == [(True, False), (True, True), (True, False)] and lock.is_locked:
+            print("✓ 고정 지그 잠금 성공")
+        else:
+            print(f"❌ 고정 지그 잠금 결과 불일치: {states}")
+
         return True
         
     except Exception as e:
         print(f"❌ 엣지 디텍션 테스트 오류: {e}")
         return False
 
+def test_panel_geometry():
+    """카메라 보정 + 패널 왜곡 보정/원근 변환 합성 remap 테스트"""
+    try:
+        print("\n패널 기하 보정 테스트 중...")
+
+        import cv2
+        import numpy as np
+        from panel_geometry import PanelGeometry, calibrate_chessboard
+
+        # 알려진 내부 파라미터/방사 왜곡을 가진 가상 카메라 (640x480)
+        camera_matrix = np.array([[700, 0, 322], [0, 700, 238], [0, 0, 1]], dtype=np.float64)
+        dist_coeffs = np.array([-0.25, 0.08, 0, 0, 0], dtype=np.float64)
+
+        # 내부 코너 9x6 체스보드 (칸당 32px, 여백 1칸), 보드 좌표 1 = 한 칸
+        square = 32
+        board = np.full((9 * square, 12 * square), 255, dtype=np.uint8)
+        for i in range(7):
+            for j in range(10):
+                if (i + j) % 2 == 0:
+                    board[(i + 1) * square:(i + 2) * square, (j + 1) * square:(j + 2) * square] = 0
+
+        # 출력 픽셀 → 왜곡 보정된 정규화 광선 → 보드 평면 교점 → 보드 텍스처 좌표
+        ys, xs = np.mgrid[0:480, 0:640].astype(np.float32)
+        rays = cv2.undistortPoints(np.stack([xs, ys], axis=-1).reshape(-1, 1, 2), camera_matrix, dist_coeffs)
+        rays = np.column_stack([rays.reshape(-1, 2), np.ones(rays.shape[0])])
+
+        def render_view(rvec, tvec):
+            rotation, _ = cv2.Rodrigues(np.array(rvec, dtype=np.float64))
+            plane = np.column_stack([rotation[:, 0], rotation[:, 1], tvec])
+            points = rays @ np.linalg.inv(plane).T
+            map_x = ((points[:, 0] / points[:, 2] + 2) * square - 0.5).reshape(480, 640).astype(np.float32)
+            map_y = ((points[:, 1] / points[:, 2] + 2) * square - 0.5).reshape(480, 640).astype(np.float32)
+            return cv2.remap(board, map_x, map_y, cv2.INTER_LINEAR, borderValue=255)
+
+        poses = [((0, 0, 0), (-4, -2.5, 14)), ((0.3, 0, 0), (-4, -2.5, 14)), ((-0.3, 0, 0), (-4, -2.5, 14)),
+                 ((0, 0.35, 0), (-4, -2.5, 14)), ((0, -0.35, 0), (-4, -2.5, 13)),
+                 ((0.2, 0.2, 0.1), (-4.5, -2, 13)), ((-0.2, 0.25, -0.1), (-3, -3, 15)),
+                 ((0.25, -0.2, 0.2), (-4, -2, 12))]
+        calibration = calibrate_chessboard([render_view(r, np.array(t, dtype=np.float64)) for r, t in poses])
+        recovered = calibration.get('camera_matrix')
+        if (calibration['calibrated'] and calibration['rms_error'] < 0.2
+                and np.abs(recovered - camera_matrix).max() < 3.0
+                and abs(calibration['distortion_coefficients'][0] - dist_coeffs[0]) < 0.02):
+            print(f"✓ 체스보드 카메라 보정 성공 (f={recovered[0, 0]:.1f}, 재투영 오차 {calibration['rms_error']:.3f}px)")
+        else:
+            print(f"❌ 체스보드 카메라 보정 결과 불일치: {calibration}")
+            return False
+
+        # 기울어진 16x9 패널의 코너/변 중점을 실제 카메라로 투영 (변은 왜곡으로 휘어짐)
+        panel = np.float64([[0, 0, 0], [16, 0, 0], [16, 9, 0], [0, 9, 0], [8, 0, 0], [0, 4.5, 0]])
+        projected, _ = cv2.projectPoints(panel, np.array([0.15, -0.2, 0.05]), np.array([-7.5, -4.5, 18.0]),
+                                         camera_matrix, dist_coeffs)
+        projected = projected.reshape(-1, 2)
+        raster = np.float32([[0, 0], [480, 0], [480, 270], [0, 270], [240, 0], [0, 135]])
+
+        errors = {}
+        for name, geometry_calibration in (('보정', calibration), ('미보정', None)):
+            geometry = PanelGeometry((481, 271))
+            geometry.set_calibration(geometry_calibration)
+            geometry.update_pose(projected[:4])
+            map_x, map_y = cv2.convertMaps(geometry.map1, geometry.map2, cv2.CV_32FC1)
+            sampled = np.array([[map_x[int(y), int(x)], map_y[int(y), int(x)]] for x, y in raster])
+            errors[name] = np.linalg.norm(sampled - projected, axis=1)
+            if name == '보정':
+                inverse = np.linalg.norm(geometry.panel_to_frame(raster) - projected, axis=1)
+
+        # 코너는 래스터 코너에 정확히, 휘어진 변의 중점은 왜곡 보정이 있어야만 래스터 변 위에 대응
+        if errors['보정'][:4].max() < 0.05 and errors['보정'].max() < 0.5 and inverse.max() < 0.5 \
+                and errors['미보정'][4:].min() > 2.0:
+            print(f"✓ 왜곡 보정 + 원근 변환 합성 remap 성공 (변 중점 오차 {errors['보정'][4:].max():.2f}px, "
+                  f"보정 없이 {errors['미보정'][4:].max():.1f}px)")
+        else:
+            print(f"❌ 합성 remap 대응 불일치: 보정 {errors['보정']}, 미보정 {errors['미보정']}")
+            return False
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 패널 기하 보정 테스트 오류: {e}")
+        return False
+
 def test_inspection_controller():
     """검사 제어기 테스트"""
     try:
@@ -166,13 +770,94 @@ def test_inspection_controller():
             print("✓ 검사 중지 성공")
         else:
             print("❌ 검사 중지 실패")
-            
+
+        # 다중 패널 병렬 검사 테스트
+        import cv2
+        import numpy as np
+        from edge_detection import EdgeDetection
+        from scratch_detection import ScratchDetection
+        from pixel_defect_detection import PixelDefectDetection
+
+        frame = np.zeros((480, 960, 3), dtype=np.uint8)
+        cv2.rectangle(frame, (40, 60), (419, 419), (255, 255, 255), -1)
+        cv2.rectangle(frame, (520, 60), (899, 419), (255, 255, 255), -1)
+        panels = EdgeDetection().detect_displays(frame)
+        results = controller.inspect_panels(frame, panels, ScratchDetection(), PixelDefectDetection())
+        controller.shutdown()
+        if sorted(results) == [1, 2] and results[2].display_region == (520, 60, 380, 360):
+            print("✓ 다중 패널 검사 성공")
+        else:
+            print(f"❌ 다중 패널 검사 실패: {sorted(results)}")
+
         return True
         
     except Exception as e:
         print(f"❌ 검사 제어기 테스트 오류: {e}")
         return False
 
+def test_rescoring():
+    """저장된 검사 결과 일괄 재채점 테스트"""
+    try:
+        print("\n일괄 재채점 테스트 중...")
+
+        import csv
+        import json
+        import tempfile
+        from inspection_controller import InspectionController
+        from rescoring_engine import GradeTier, GradingRules
+
+        # (데드, 핫, 고착 픽셀 수, 저장 당시 등급)
+        saved = [(0, 0, 0, 'A'), (2, 1, 0, 'B'), (4, 0, 1, 'C'), (12, 0, 0, 'F')]
+        strict = GradingRules(tiers=[GradeTier('A', 90, max_dead_pixels=0, max_total_defects=0),
+                                     GradeTier('B', 80, max_dead_pixels=2, max_total_defects=3)],
+                              name='strict')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index, (dead, hot, stuck, grade) in enumerate(saved):
+                result = {
+                    'timestamp': f"2026-01-0{index + 1}T00:00:00",
+                    'display_region': [0, 0, 100, 100],
+                    'scratches': [],
+                    'pixel_defects': {'dead_pixels': [[i, 0] for i in range(dead)],
+                                      'hot_pixels': [[i, 1] for i in range(hot)],
+                                      'stuck_pixels': [[i, 2] for i in range(stuck)]},
+                    'quality_grade': {'grade': grade}
+                }
+                with open(os.path.join(temp_dir, f"inspection_{index}.json"), 'w', encoding='utf-8') as f:
+                    json.dump(result, f)
+
+            controller = InspectionController()
+            controller.results_directory = temp_dir
+            default = controller.rescore_results(filename="default")
+            stricter = controller.rescore_results(strict, filename="strict")
+
+            with open(stricter['summary_path'], encoding='utf-8') as f:
+                summary = json.load(f)
+            with open(os.path.join(temp_dir, "strict.csv"), newline='', encoding='utf-8') as f:
+                rows = list(csv.reader(f))[1:]
+
+        checks = {
+            '기본 규칙 등급': list(default['rescored']['grade']) == ['A', 'B', 'C', 'F'],
+            '강화 규칙 등급': list(stricter['rescored']['grade']) == ['A', 'B', 'F', 'F'],
+            '점수': abs(stricter['rescored']['score'][1] - (80 + 10 * (1 - 3 / 10000))) < 1e-9,
+            '요약 분포': summary['grade_distribution'] == {'A': 1, 'B': 1, 'F': 2},
+            '변경 등급 수': summary['changed_grades'] == 1 and summary['total_results'] == 4,
+            '요약 규칙/점수': summary['rules'] == 'strict' and summary['max_score'] == 100.0,
+            'CSV': [(row[0], row[2], row[3]) for row in rows] == [
+                ('inspection_0.json', 'A', 'A'), ('inspection_1.json', 'B', 'B'),
+                ('inspection_2.json', 'C', 'F'), ('inspection_3.json', 'F', 'F')],
+        }
+        failed = [name for name, ok in checks.items() if not ok]
+        if failed:
+            print(f"❌ 일괄 재채점 결과 불일치: {failed}")
+            return False
+        print("✓ 일괄 재채점 성공 (기본/강화 규칙, 요약 JSON/CSV)")
+        return True
+
+    except Exception as e:
+        print(f"❌ 일괄 재채점 테스트 오류: {e}")
+        return False
+
 def main():
     """메인 테스트 함수"""
     print("=== 디스플레이 품질 검사 시스템 테스트 ===\n")
@@ -192,9 +877,19 @@ def main():
     tests = [
         ("모듈 Import", test_imports),
         ("카메라", test_camera),
+        ("재생 소스", test_replay_source),
+        ("다중 카메라", test_camera_array),
+        ("캡처 통계", test_capture_telemetry),
+        ("프레임 품질 게이트", test_frame_quality),
+        ("자동 노출", test_auto_exposure),
+        ("프레임 누적", test_frame_stacker),
+        ("HDR 캡처", test_hdr_capture),
+        ("캡처 포맷 협상", test_capture_format),
         ("테스트 패턴 생성기", test_pattern_generator),
         ("엣지 디텍션", test_edge_detection),
-        ("검사 제어기", test_inspection_controller)
+        ("패널 기하 보정", test_panel_geometry),
+        ("검사 제어기", test_inspection_controller),
+        ("일괄 재채점", test_rescoring)
     ]
     
     passed = 0
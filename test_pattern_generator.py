@@ -12,8 +12,13 @@ import numpy as np
 from typing import Tuple, Optional
 import math
 
+from fiducial_registration import draw_markers
+
 
 class TestPatternGenerator:
+    # 픽셀 결함/감마 측정용 계조 레벨 (위에서 아래 순서)
+    GRAY_LEVELS = [0, 32, 64, 96, 128, 160, 192, 224, 255]
+    
     def __init__(self):
         """테스트 패턴 생성기 초기화"""
         self.patterns = {
@@ -31,7 +36,8 @@ class TestPatternGenerator:
             'lines': self.generate_lines
         }
         
-    def generate_pattern(self, width: int, height: int, pattern_type: str = 'solid_red') -> Optional[np.ndarray]:
+    def generate_pattern(self, width: int, height: int, pattern_type: str = 'solid_red',
+                         fiducials: bool = False) -> Optional[np.ndarray]:
         """
         테스트 패턴 생성
         
@@ -39,6 +45,7 @@ class TestPatternGenerator:
             width: 패턴 너비
             height: 패턴 높이
             pattern_type: 패턴 타입
+            fiducials: 네 모서리에 정합 마커 삽입 여부 (FiducialRegistration으로 패널 정합)
             
         Returns:
             np.ndarray: 생성된 패턴 이미지
@@ -47,7 +54,8 @@ class TestPatternGenerator:
             pattern_type = 'solid_red'
             
         try:
-            return self.patterns[pattern_type](width, height)
+            pattern = self.patterns[pattern_type](width, height)
+            return self.add_fiducials(pattern) if fiducials else pattern
         except Exception as e:
             print(f"패턴 생성 오류: {e}")
             return None
@@ -195,7 +203,7 @@ class TestPatternGenerator:
         pattern = np.zeros((height, width, 3), dtype=np.uint8)
         
         # 다양한 밝기 레벨
-        brightness_levels = [0, 32, 64, 96, 128, 160, 192, 224, 255]
+        brightness_levels = self.GRAY_LEVELS
         section_height = height // len(brightness_levels)
         
         for i, brightness in enumerate(brightness_levels):
@@ -215,6 +223,19 @@ class TestPatternGenerator:
         
         return pattern
         
+    def add_fiducials(self, pattern: np.ndarray, marker_size: Optional[int] = None) -> np.ndarray:
+        """
+        패턴 네 모서리에 ArUco 정합 마커 삽입
+        
+        Args:
+            pattern: 원본 패턴
+            marker_size: 마커 크기 (None이면 짧은 변의 10%)
+            
+        Returns:
+            np.ndarray: 마커가 삽입된 패턴 (원본은 수정하지 않음)
+        """
+        return draw_markers(pattern, marker_size)
+        
     def get_available_patterns(self) -> list:
         """사용 가능한 패턴 목록 반환"""
         return list(self.patterns.keys())
@@ -17,6 +17,13 @@ import json
 import os
 import math
 
+from corner_refinement import (DETECTION_SCALE, CornerRefiner, contour_to_corners,
+                               corners_to_contour, corners_to_rectangle, downscale)
+from fiducial_registration import FiducialRegistration, draw_markers
+from frame_source import open_capture
+from panel_detection_engine import STRATEGY_NAMES, PanelDetectionEngine, evaluate_contour_quality
+from panel_geometry import PanelGeometry
+
 class TestPatternInspector:
     """테스트 패턴 생성 및 검사 시스템"""
     
@@ -26,6 +33,13 @@ class TestPatternInspector:
         self.current_frame = None
         self.test_pattern = None
         self.panel_rectangle = None
+        self.panel_corners = None  # 서브픽셀 코너 (좌상, 우상, 우하, 좌하)
+        self.detection_scale = DETECTION_SCALE  # 패널 후보 감지 스케일
+        self.corner_refiner = CornerRefiner()
+        self.detection_engine = PanelDetectionEngine()  # 단일 패스 다중 임계값 패널 감지
+        self.panel_geometry = PanelGeometry()  # 왜곡 보정 + 원근 변환 remap (자세가 바뀔 때만 재생성)
+        self.panel_geometry.load_calibration()  # 메인 앱에서 저장한 카메라 보정 결과가 있으면 적용
+        self.fiducial_registration = None  # 마커가 삽입된 패턴 표시 중일 때 마커 기반 정합기
         self.inspection_running = False
         self.inspection_results = {}
         self.polarizer_angle = 0  # 편광필터 각도 (0-180도)
@@ -123,6 +137,11 @@ class TestPatternInspector:
         ttk.Button(pattern_frame, text="불량픽셀 시뮬레이션", 
                   command=self.generate_defect_simulation).pack(side=tk.LEFT, padx=2)
         
+        # 피듀셜 마커 삽입 체크박스 (마커 기반 패널 정합)
+        self.fiducials_enabled = tk.BooleanVar(value=False)
+        ttk.Checkbutton(pattern_frame, text="정합 마커",
+                       variable=self.fiducials_enabled).pack(side=tk.LEFT, padx=5)
+        
         # 검사 제어 탭
         inspect_tab = ttk.Frame(control_notebook)
         control_notebook.add(inspect_tab, text="검사 제어")
@@ -286,6 +305,7 @@ class TestPatternInspector:
             pattern = np.zeros((height, width, 3), dtype=np.uint8)
             pattern[:, :, 2] = 255  # Red 채널만 활성화 (BGR 형식: 0,0,255)
             
+            pattern = self.apply_fiducials(pattern)
             self.test_pattern = pattern
             self.display_pattern(pattern)
             self.log_result("Red 테스트 패턴이 생성되었습니다 (순수한 빨간색).")
@@ -303,6 +323,7 @@ class TestPatternInspector:
             pattern = np.zeros((height, width, 3), dtype=np.uint8)
             pattern[:, :, 1] = 255  # Green 채널만 활성화 (BGR 형식: 0,255,0)
             
+            pattern = self.apply_fiducials(pattern)
             self.test_pattern = pattern
             self.display_pattern(pattern)
             self.log_result("Green 테스트 패턴이 생성되었습니다 (순수한 초록색).")
@@ -320,6 +341,7 @@ class TestPatternInspector:
             pattern = np.zeros((height, width, 3), dtype=np.uint8)
             pattern[:, :, 0] = 255  # Blue 채널만 활성화 (BGR 형식: 255,0,0)
             
+            pattern = self.apply_fiducials(pattern)
             self.test_pattern = pattern
             self.display_pattern(pattern)
             self.log_result("Blue 테스트 패턴이 생성되었습니다 (순수한 파란색).")
@@ -645,6 +667,7 @@ class TestPatternInspector:
                 color = colors[np.random.randint(0, len(colors))]
                 cv2.rectangle(pattern, (x, y), (x+size, y+size), color, -1)
             
+            pattern = self.apply_fiducials(pattern)
             self.test_pattern = pattern
             self.display_pattern(pattern)
             self.log_result("불량픽셀 시뮬레이션 패턴이 생성되었습니다.")
@@ -689,6 +712,7 @@ class TestPatternInspector:
             
             # 제목 제거 (깔끔한 패턴)
             
+            pattern = self.apply_fiducials(pattern)
             self.test_pattern = pattern
             self.display_pattern(pattern)
             self.log_result("데드픽셀 테스트 패턴이 생성되었습니다.")
@@ -726,6 +750,7 @@ class TestPatternInspector:
             
             # 제목 제거 (깔끔한 패턴)
             
+            pattern = self.apply_fiducials(pattern)
             self.test_pattern = pattern
             self.display_pattern(pattern)
             self.log_result("색상 균일성 테스트 패턴이 생성되었습니다.")
@@ -733,6 +758,16 @@ class TestPatternInspector:
         except Exception as e:
             self.log_result(f"색상 균일성 테스트 패턴 생성 오류: {str(e)}")
     
+    def apply_fiducials(self, pattern):
+        """정합 마커 옵션이 켜져 있으면 패턴 네 모서리에 마커 삽입"""
+        if not self.fiducials_enabled.get():
+            self.fiducial_registration = None
+            return pattern
+        
+        height, width = pattern.shape[:2]
+        self.fiducial_registration = FiducialRegistration((width, height))
+        return draw_markers(pattern)
+    
     def display_pattern(self, pattern):
         """패턴을 UI에 표시"""
         try:
@@ -765,7 +800,7 @@ class TestPatternInspector:
     def start_camera(self):
         """웹캠 시작"""
         try:
-            self.camera = cv2.VideoCapture(0)
+            self.camera = open_capture()
             if not self.camera.isOpened():
                 messagebox.showerror("오류", "웹캠을 열 수 없습니다.")
                 return
@@ -961,8 +996,8 @@ class TestPatternInspector:
             panel_contour = self.detect_panel_contour(self.current_frame)
             
             if panel_contour is not None:
-                # 정확한 사각형 추출
-                rectangle = self.extract_rectangle_from_contour(panel_contour)
+                # 서브픽셀 코너로 정확한 사각형 추출
+                rectangle = corners_to_rectangle(self.panel_corners)
                 
                 if rectangle is not None:
                     # 패널 완전성 검사
@@ -1027,284 +1062,45 @@ class TestPatternInspector:
             return False
     
     def detect_panel_contour(self, frame):
-        """RGB 색상 영역을 직접 감지하여 패널 찾기"""
+        """
+        패널 윤곽선 감지
+        
+        정합 마커가 삽입된 패턴이면 마커 호모그래피로 코너를 계산하고,
+        아니면 1/4 스케일 영상에서 감지 엔진으로 후보를 찾아 원본 해상도의 좁은 창에서
+        네 변을 다시 맞춰 서브픽셀 코너(self.panel_corners)를 계산합니다.
+        """
         try:
-            # BGR 채널 분리
-            b, g, r = cv2.split(frame)
-            
-            # 각 채널별로 강한 색상 영역 찾기
-            # 빨간색 영역 (Red 테스트)
-            red_strong = cv2.threshold(r, 150, 255, cv2.THRESH_BINARY)[1]
-            red_weak = cv2.threshold(g, 100, 255, cv2.THRESH_BINARY_INV)[1]
-            red_weak2 = cv2.threshold(b, 100, 255, cv2.THRESH_BINARY_INV)[1]
-            red_mask = cv2.bitwise_and(red_strong, red_weak)
-            red_mask = cv2.bitwise_and(red_mask, red_weak2)
-            
-            # 초록색 영역 (Green 테스트)
-            green_strong = cv2.threshold(g, 150, 255, cv2.THRESH_BINARY)[1]
-            green_weak = cv2.threshold(r, 100, 255, cv2.THRESH_BINARY_INV)[1]
-            green_weak2 = cv2.threshold(b, 100, 255, cv2.THRESH_BINARY_INV)[1]
-            green_mask = cv2.bitwise_and(green_strong, green_weak)
-            green_mask = cv2.bitwise_and(green_mask, green_weak2)
-            
-            # 파란색 영역 (Blue 테스트)
-            blue_strong = cv2.threshold(b, 150, 255, cv2.THRESH_BINARY)[1]
-            blue_weak = cv2.threshold(r, 100, 255, cv2.THRESH_BINARY_INV)[1]
-            blue_weak2 = cv2.threshold(g, 100, 255, cv2.THRESH_BINARY_INV)[1]
-            blue_mask = cv2.bitwise_and(blue_strong, blue_weak)
-            blue_mask = cv2.bitwise_and(blue_mask, blue_weak2)
-            
-            # 모든 색상 마스크 결합
-            color_mask = red_mask + green_mask + blue_mask
-            
-            # 마스크 정리 (노이즈 제거)
-            kernel = np.ones((3, 3), np.uint8)
-            color_mask = cv2.morphologyEx(color_mask, cv2.MORPH_CLOSE, kernel)
-            color_mask = cv2.morphologyEx(color_mask, cv2.MORPH_OPEN, kernel)
-            
-            # 컨투어 찾기
-            contours, _ = cv2.findContours(color_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            if contours:
-                # 면적별로 정렬
-                contours = sorted(contours, key=cv2.contourArea, reverse=True)
-                
-                for contour in contours[:5]:  # 상위 5개 검사
-                    area = cv2.contourArea(contour)
-                    if area > 2000:  # 최소 면적 (더 낮게 설정)
-                        # 사각형으로 근사 (매우 유연하게)
-                        epsilon = 0.1 * cv2.arcLength(contour, True)  # 매우 큰 epsilon
-                        approx = cv2.approxPolyDP(contour, epsilon, True)
-                        
-                        if len(approx) >= 4:  # 4개 이상의 꼭짓점
-                            self.log_result(f"RGB 색상 기반 패널 감지 성공: 면적 {area}")
-                            return contour
+            # 정합 마커가 있는 패턴이면 마커로 바로 패널 코너 계산 (패턴 색상 무관)
+            if self.fiducial_registration is not None:
+                corners = self.fiducial_registration.locate_panel(frame)
+                if corners is not None:
+                    self.panel_corners = corners
+                    self.log_result("정합 마커 기반 패널 감지 성공")
+                    return corners_to_contour(corners)
+                self.log_result("정합 마커 감지 실패, 윤곽선 기반으로 시도")
+            
+            # 색상/Otsu/다중 Otsu/적응적 임계값/Canny 후보를 한 번에 평가
+            small = downscale(frame, self.detection_scale)
+            detection = self.detection_engine.detect(small, self.detection_scale)
+            if detection is None:
+                self.log_result("모든 감지 방법 실패")
+                return None
             
-            # RGB 색상 감지가 실패하면 밝기 기반으로 시도
-            self.log_result("RGB 색상 감지 실패, 밝기 기반으로 시도")
-            return self.detect_by_brightness(frame)
+            contour = detection['contour']
+            self.log_result(f"{STRATEGY_NAMES[detection['strategy']]} 기반 패널 감지 성공: "
+                            f"점수 {detection['score']:.2f}, 면적 {detection['area'] / self.detection_scale ** 2:.0f}")
+            corners = (contour_to_corners(contour) + 0.5) / self.detection_scale - 0.5
+            self.panel_corners = self.corner_refiner.refine(frame, corners)
+            return corners_to_contour(self.panel_corners)
             
         except Exception as e:
             self.log_result(f"패널 윤곽선 감지 오류: {str(e)}")
             return None
     
-    def detect_by_brightness(self, frame):
-        """밝기 기반으로 패널 감지 - 개선된 방법"""
-        try:
-            # 그레이스케일 변환
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            
-            # 적응적 임계값으로 밝은 영역 찾기
-            thresh = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                                         cv2.THRESH_BINARY, 11, 2)
-            
-            # 모폴로지 연산으로 노이즈 제거
-            kernel = np.ones((3, 3), np.uint8)
-            thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-            thresh = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
-            
-            # 컨투어 찾기
-            contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            if contours:
-                # 면적별로 정렬
-                contours = sorted(contours, key=cv2.contourArea, reverse=True)
-                
-                for contour in contours[:5]:  # 상위 5개 검사
-                    area = cv2.contourArea(contour)
-                    if area > 2000:  # 최소 면적 (더 낮게 설정)
-                        # 사각형으로 근사 (매우 유연하게)
-                        epsilon = 0.1 * cv2.arcLength(contour, True)  # 매우 큰 epsilon
-                        approx = cv2.approxPolyDP(contour, epsilon, True)
-                        
-                        if len(approx) >= 4:  # 4개 이상의 꼭짓점
-                            self.log_result(f"밝기 기반 패널 감지 성공: 면적 {area}")
-                            return contour
-            
-            # 밝기 기반도 실패하면 간단한 임계값으로 시도
-            self.log_result("적응적 임계값 실패, 단순 임계값으로 시도")
-            return self.detect_by_simple_threshold(frame)
-            
-        except Exception as e:
-            self.log_result(f"밝기 기반 감지 오류: {str(e)}")
-            return None
-    
-    def detect_by_simple_threshold(self, frame):
-        """단순 임계값으로 패널 감지"""
-        try:
-            # 그레이스케일 변환
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            
-            # 여러 임계값으로 시도
-            thresholds = [80, 100, 120, 150]
-            
-            for thresh_val in thresholds:
-                _, thresh = cv2.threshold(gray, thresh_val, 255, cv2.THRESH_BINARY)
-                
-                # 모폴로지 연산
-                kernel = np.ones((5, 5), np.uint8)
-                thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-                
-                # 컨투어 찾기
-                contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                
-                if contours:
-                    # 면적별로 정렬
-                    contours = sorted(contours, key=cv2.contourArea, reverse=True)
-                    
-                    for contour in contours[:3]:
-                        area = cv2.contourArea(contour)
-                        if area > 1500:  # 매우 낮은 임계값
-                            # 사각형으로 근사 (매우 유연하게)
-                            epsilon = 0.15 * cv2.arcLength(contour, True)  # 매우 큰 epsilon
-                            approx = cv2.approxPolyDP(contour, epsilon, True)
-                            
-                            if len(approx) >= 4:  # 4개 이상의 꼭짓점
-                                self.log_result(f"단순 임계값({thresh_val}) 패널 감지 성공: 면적 {area}")
-                                return contour
-            
-            self.log_result("모든 감지 방법 실패")
-            return None
-            
-        except Exception as e:
-            self.log_result(f"단순 임계값 감지 오류: {str(e)}")
-            return None
-    
-    def detect_by_canny(self, blurred, frame):
-        """Canny 엣지 감지로 패널 찾기"""
-        try:
-            # Canny 엣지 감지
-            edges = cv2.Canny(blurred, 50, 150)
-            
-            # 모폴로지 연산으로 엣지 강화
-            kernel = np.ones((3, 3), np.uint8)
-            edges = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, kernel)
-            
-            # 컨투어 찾기
-            contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            if contours:
-                # 면적별로 정렬
-                contours = sorted(contours, key=cv2.contourArea, reverse=True)
-                
-                for contour in contours[:3]:  # 상위 3개만 검사
-                    area = cv2.contourArea(contour)
-                    if area > 5000:  # 최소 면적
-                        # 사각형으로 근사
-                        epsilon = 0.02 * cv2.arcLength(contour, True)
-                        approx = cv2.approxPolyDP(contour, epsilon, True)
-                        
-                        if len(approx) >= 4:  # 4개 이상의 꼭짓점
-                            return contour
-            
-            return None
-            
-        except Exception as e:
-            return None
-    
-    def detect_by_threshold(self, blurred, frame):
-        """임계값 기반으로 패널 찾기"""
-        try:
-            # 적응적 임계값
-            thresh = cv2.adaptiveThreshold(blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                                         cv2.THRESH_BINARY, 11, 2)
-            
-            # 모폴로지 연산
-            kernel = np.ones((5, 5), np.uint8)
-            thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-            thresh = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
-            
-            # 컨투어 찾기
-            contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            if contours:
-                # 면적별로 정렬
-                contours = sorted(contours, key=cv2.contourArea, reverse=True)
-                
-                for contour in contours[:3]:
-                    area = cv2.contourArea(contour)
-                    if area > 5000:
-                        # 사각형으로 근사
-                        epsilon = 0.02 * cv2.arcLength(contour, True)
-                        approx = cv2.approxPolyDP(contour, epsilon, True)
-                        
-                        if len(approx) >= 4:
-                            return contour
-            
-            return None
-            
-        except Exception as e:
-            return None
-    
-    def detect_by_color_variance(self, blurred, frame):
-        """색상 분산으로 패널 영역 찾기"""
-        try:
-            # 색상 분산 계산 (RGB 영상이 있는 영역)
-            b, g, r = cv2.split(frame)
-            
-            # 각 채널의 분산 계산
-            b_var = cv2.Laplacian(b, cv2.CV_64F).var()
-            g_var = cv2.Laplacian(g, cv2.CV_64F).var()
-            r_var = cv2.Laplacian(r, cv2.CV_64F).var()
-            
-            # 색상 변화가 큰 영역 찾기
-            color_variance = cv2.Laplacian(blurred, cv2.CV_64F)
-            color_variance = np.uint8(np.absolute(color_variance))
-            
-            # 임계값 적용
-            _, thresh = cv2.threshold(color_variance, 30, 255, cv2.THRESH_BINARY)
-            
-            # 모폴로지 연산
-            kernel = np.ones((5, 5), np.uint8)
-            thresh = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-            
-            # 컨투어 찾기
-            contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            if contours:
-                # 면적별로 정렬
-                contours = sorted(contours, key=cv2.contourArea, reverse=True)
-                
-                for contour in contours[:3]:
-                    area = cv2.contourArea(contour)
-                    if area > 5000:
-                        # 사각형으로 근사
-                        epsilon = 0.02 * cv2.arcLength(contour, True)
-                        approx = cv2.approxPolyDP(contour, epsilon, True)
-                        
-                        if len(approx) >= 4:
-                            return contour
-            
-            return None
-            
-        except Exception as e:
-            return None
-    
     def evaluate_contour_quality(self, contour, frame):
-        """컨투어 품질 평가"""
+        """컨투어 품질 평가 (프레임 크기 대비 감지 스케일 면적 기준)"""
         try:
-            # 면적 점수
-            area = cv2.contourArea(contour)
-            area_score = min(area / 10000, 1.0)  # 10000 이상이면 1점
-            
-            # 사각형 근사 점수
-            epsilon = 0.02 * cv2.arcLength(contour, True)
-            approx = cv2.approxPolyDP(contour, epsilon, True)
-            rect_score = 1.0 if len(approx) == 4 else 0.5
-            
-            # 종횡비 점수
-            x, y, w, h = cv2.boundingRect(contour)
-            aspect_ratio = w / h
-            if 0.5 <= aspect_ratio <= 2.0:  # 합리적인 비율
-                ratio_score = 1.0
-            else:
-                ratio_score = 0.3
-            
-            # 전체 점수 계산
-            total_score = (area_score * 0.4 + rect_score * 0.4 + ratio_score * 0.2)
-            
-            return total_score
-            
+            return evaluate_contour_quality(contour, 10000 * self.detection_scale ** 2)
         except Exception as e:
             return 0.0
     
@@ -1392,6 +1188,10 @@ class TestPatternInspector:
     def extract_rectangle_region(self, frame, rectangle):
         """정확한 사각형 영역 추출"""
         try:
+            # 서브픽셀 코너가 있으면 기울어진 패널도 정면 래스터로 변환 (remap 1회)
+            if self.panel_corners is not None:
+                return self.panel_geometry.warp(frame, self.panel_corners)
+            
             x, y, w, h = rectangle
             
             # 경계 확인
@@ -1415,20 +1215,23 @@ class TestPatternInspector:
         }
         
         try:
+            # 정합 마커가 삽입된 패턴이면 마커/여백 영역은 패널 화면이 아니므로 제외
+            mask = self.inspection_mask(panel_region)
+            
             # 1. 데드픽셀 감지
-            dead_pixels = self.detect_dead_pixels(panel_region)
+            dead_pixels = self.detect_dead_pixels(panel_region, mask)
             results['defects'].extend(dead_pixels)
             
             # 2. 핫픽셀 감지
-            hot_pixels = self.detect_hot_pixels(panel_region)
+            hot_pixels = self.detect_hot_pixels(panel_region, mask)
             results['defects'].extend(hot_pixels)
             
             # 3. 색상 균일성 검사
-            color_issues = self.check_color_uniformity(panel_region)
+            color_issues = self.check_color_uniformity(panel_region, mask)
             results['defects'].extend(color_issues)
             
             # 4. RGB 채널 분석
-            rgb_analysis = self.analyze_rgb_channels(panel_region)
+            rgb_analysis = self.analyze_rgb_channels(panel_region, mask)
             results['defects'].extend(rgb_analysis)
             
             # 5. 품질 점수 계산
@@ -1439,8 +1242,14 @@ class TestPatternInspector:
         
         return results
     
-    def detect_dead_pixels(self, region):
-        """데드픽셀 감지 (개선된 알고리즘)"""
+    def inspection_mask(self, region):
+        """정합 마커/여백을 제외한 검사 마스크 (마커 미사용 시 None)"""
+        if self.fiducial_registration is None:
+            return None
+        return self.fiducial_registration.exclusion_mask(region.shape[:2])
+    
+    def detect_dead_pixels(self, region, mask=None):
+        """데드픽셀 감지 (개선된 알고리즘, mask가 0인 영역 제외)"""
         dead_pixels = []
         
         try:
@@ -1449,6 +1258,8 @@ class TestPatternInspector:
             # 1. 적응적 임계값으로 어두운 영역 감지
             dark_threshold = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
                                                  cv2.THRESH_BINARY_INV, 11, 2)
+            if mask is not None:
+                dark_threshold = cv2.bitwise_and(dark_threshold, mask)
             
             # 2. 모폴로지 연산으로 노이즈 제거
             kernel = np.ones((3, 3), np.uint8)
@@ -1468,7 +1279,10 @@ class TestPatternInspector:
             kernel = np.ones((5, 5), np.float32) / 25
             local_mean = cv2.filter2D(gray.astype(np.float32), -1, kernel)
             diff = np.abs(gray.astype(np.float32) - local_mean)
-            additional_dead = np.sum(diff > (0.3 * 255))
+            outliers = diff > (0.3 * 255)
+            if mask is not None:
+                outliers &= mask > 0
+            additional_dead = np.sum(outliers)
             
             total_dead_pixels = dead_pixel_count + (additional_dead // 10)  # 정규화
             
@@ -1482,8 +1296,8 @@ class TestPatternInspector:
         
         return dead_pixels
     
-    def detect_hot_pixels(self, region):
-        """핫픽셀 감지 (개선된 알고리즘)"""
+    def detect_hot_pixels(self, region, mask=None):
+        """핫픽셀 감지 (개선된 알고리즘, mask가 0인 영역 제외)"""
         hot_pixels = []
         
         try:
@@ -1492,6 +1306,8 @@ class TestPatternInspector:
             # 1. 적응적 임계값으로 밝은 영역 감지
             bright_threshold = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
                                                    cv2.THRESH_BINARY, 11, 2)
+            if mask is not None:
+                bright_threshold = cv2.bitwise_and(bright_threshold, mask)
             
             # 2. 모폴로지 연산으로 노이즈 제거
             kernel = np.ones((3, 3), np.uint8)
@@ -1511,7 +1327,10 @@ class TestPatternInspector:
             kernel = np.ones((5, 5), np.float32) / 25
             local_mean = cv2.filter2D(gray.astype(np.float32), -1, kernel)
             diff = np.abs(gray.astype(np.float32) - local_mean)
-            additional_hot = np.sum(diff > (0.4 * 255))
+            outliers = diff > (0.4 * 255)
+            if mask is not None:
+                outliers &= mask > 0
+            additional_hot = np.sum(outliers)
             
             total_hot_pixels = hot_pixel_count + (additional_hot // 15)  # 정규화
             
@@ -1525,15 +1344,13 @@ class TestPatternInspector:
         
         return hot_pixels
     
-    def check_color_uniformity(self, region):
-        """색상 균일성 검사"""
+    def check_color_uniformity(self, region, mask=None):
+        """색상 균일성 검사 (mask가 0인 영역 제외)"""
         color_issues = []
         
         try:
-            b, g, r = cv2.split(region)
-            std_b = np.std(b)
-            std_g = np.std(g)
-            std_r = np.std(r)
+            _, std = cv2.meanStdDev(region, mask=mask)
+            std_b, std_g, std_r = std.ravel()[:3]
             
             threshold = 30  # 더 엄격한 임계값
             if std_b > threshold or std_g > threshold or std_r > threshold:
@@ -1544,17 +1361,13 @@ class TestPatternInspector:
         
         return color_issues
     
-    def analyze_rgb_channels(self, region):
-        """RGB 채널 분석"""
+    def analyze_rgb_channels(self, region, mask=None):
+        """RGB 채널 분석 (mask가 0인 영역 제외)"""
         rgb_issues = []
         
         try:
-            b, g, r = cv2.split(region)
-            
             # 각 채널의 평균값 계산
-            mean_b = np.mean(b)
-            mean_g = np.mean(g)
-            mean_r = np.mean(r)
+            mean_b, mean_g, mean_r = cv2.mean(region, mask=mask)[:3]
             
             # 채널 간 균형 확인
             total_mean = (mean_b + mean_g + mean_r) / 3
@@ -1756,6 +1569,7 @@ class TestPatternInspector:
         
         if self.camera:
             self.camera.release()
+        self.detection_engine.shutdown()
         
         self.root.destroy()
     
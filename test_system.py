@@ -71,6 +71,22 @@ def test_basic_functionality():
     analyzer = AdvancedDisplayAnalyzer()
     
     try:
+        # 스크래치 감지 테스트
+        scratches = analyzer.detect_scratches(test_image)
+        print(f"✓ 스크래치 감지: {scratches['count']}개 감지")
+        
+        # DisplayInspector 스크래치 검사가 detect_scratches 결과('segments', 'angle')를 그대로 사용
+        inspector = DisplayInspector.__new__(DisplayInspector)  # GUI 없이 검사 함수만 사용
+        inspector.current_image = test_image
+        messages = []
+        inspector.log_result = messages.append
+        inspector.run_scratch_inspection()
+        angles = sorted(float(line.split("각도 ")[1].rstrip("°")) for line in messages[2:])
+        if (messages[1] != f"감지된 스크래치: {scratches['count']}개" or len(angles) != scratches['count']
+                or np.abs(np.array(angles) - [18.4, 26.6]).max() > 0.5):
+            raise AssertionError(f"DisplayInspector 스크래치 결과 불일치: {messages}")
+        print(f"✓ DisplayInspector 스크래치 검사 결과 표시 (각도 {angles})")
+        
         # 데드 픽셀 감지 테스트
         dead_pixels = analyzer.detect_dead_pixels(test_image)
         print(f"✓ 데드 픽셀 감지: {dead_pixels['count']}개 감지")
@@ -83,6 +99,10 @@ def test_basic_functionality():
         color_uniformity = analyzer.analyze_color_uniformity(test_image)
         print(f"✓ 색상 균일성 분석: 점수 {color_uniformity['uniformity_score']:.2f}")
         
+        # ΔE 색상 균일성 분석 테스트
+        delta_e = analyzer.analyze_color_uniformity_delta_e(test_image)
+        print(f"✓ ΔE 색상 균일성 분석: 최대 ΔE {delta_e['max_delta_e']:.2f} ({delta_e['grade']})")
+        
         # 무라 결함 감지 테스트
         mura_defects = analyzer.detect_mura_defects(test_image)
         print(f"✓ 무라 결함 감지: {mura_defects['count']}개 감지")
@@ -90,17 +110,246 @@ def test_basic_functionality():
         # 픽셀 응답 분석 테스트
         pixel_response = analyzer.analyze_pixel_response(test_image)
         print(f"✓ 픽셀 응답 분석: 동적 범위 {pixel_response['dynamic_range']}")
+
+        # 빈 마스크 통계는 같은 키에 NaN, 감마 측정은 픽셀이 없는 레벨을 제외
+        from gamma_response import GammaResponseAnalyzer
+        from histogram_statistics import HistogramStatistics
+        gray = cv2.cvtColor(test_image, cv2.COLOR_BGR2GRAY)
+        empty_mask = np.zeros(gray.shape, dtype=np.uint8)
+        empty_stats = HistogramStatistics.from_image(gray, empty_mask).channel_stats()
+        if empty_stats['count'] != 0 or not np.isnan(empty_stats['percentiles'][75.0]):
+            raise AssertionError(f"빈 마스크 통계 불일치: {empty_stats}")
+        gamma = GammaResponseAnalyzer()
+        for level in (0, 64, 128, 192, 255):
+            capture = np.full((48, 64), int(255 * (level / 255.0) ** 2.2), dtype=np.uint8)
+            gamma.add_gray_capture(capture, level, empty_mask[:48, :64] if level == 64 else None)
+        sequence = gamma.measure_sequence()
+        if [band['level'] for band in sequence['bands']] != [0, 128, 192, 255]:
+            raise AssertionError(f"빈 계조 레벨 제외 실패: {sequence['bands']}")
+        print(f"✓ 빈 마스크 통계/감마 측정: 감마 {sequence['gamma']:.2f}")
         
         # 종합 분석 테스트
         report = analyzer.create_analysis_report(test_image)
         print(f"✓ 종합 분석 완료: 품질 점수 {report['overall_quality_score']:.1f}/100")
-        
+
+        # 결과 시각화 (보고서 생성 때 구한 마스크를 떼어 두었다가 다시 계산하지 않고 사용)
+        full_report = analyzer.create_analysis_report(test_image, include_artifacts=True)
+        artifacts = analyzer.compact_report(full_report)
+        if any(isinstance(value, np.ndarray) for section in full_report.values()
+               if isinstance(section, dict) for value in section.values()):
+            raise AssertionError("압축한 보고서에 대용량 결과가 남아 있습니다")
+        if artifacts['bright_spots']['labels'].shape != test_image.shape[:2]:
+            raise AssertionError("떼어낸 대용량 결과 크기 불일치")
+        canvas = analyzer.visualize_results(test_image, full_report, artifacts=artifacts)
+        print(f"✓ 결과 시각화 완료: {canvas.shape[1]}x{canvas.shape[0]}")
+
+        # 한 분석기를 여러 스레드가 공유해도 작업 버퍼가 섞이지 않음
+        from concurrent.futures import ThreadPoolExecutor
+        images = [test_image, cv2.flip(test_image, 1)] * 4
+        expected = [AdvancedDisplayAnalyzer().detect_dead_pixels(image)['count'] for image in images[:2]] * 4
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            counts = [result['count'] for result in executor.map(analyzer.detect_dead_pixels, images)]
+        if counts != expected:
+            raise AssertionError(f"스레드 공유 분석 결과 불일치: {counts} != {expected}")
+        print("✓ 스레드 공유 분석 결과 일치")
+
+        # 실시간 검사 루프: ROI가 조금씩 흔들려도 첫 프레임 이후 작업 버퍼 재할당 없음
+        loop_analyzer = AdvancedDisplayAnalyzer()
+        loop_analyzer.quick_inspection(test_image)
+        loop_analyzer._block_means(test_image[:, :, 0], 10)  # 채널 수가 바뀌어도 reduce 출력 버퍼 사용 가능
+        allocations = loop_analyzer.workspace.allocations
+        rng = np.random.default_rng(0)
+        for _ in range(10):
+            dy, dx = rng.integers(0, 8, size=2)
+            roi = test_image[dy:dy + 590, dx:dx + 790]
+            loop_analyzer.quick_inspection(roi)
+            loop_analyzer._block_means(roi[:, :, 0], 10)
+        if loop_analyzer.workspace.allocations != allocations:
+            raise AssertionError(f"반복 검사 중 작업 버퍼 재할당: "
+                                 f"{allocations} → {loop_analyzer.workspace.allocations}")
+        print(f"✓ 반복 빠른 검사 작업 버퍼 재할당 없음 (버퍼 {allocations}개)")
+
         return True
         
     except Exception as e:
         print(f"✗ 테스트 실패: {str(e)}")
         return False
 
+def test_compact_report():
+    """압축 보고서 크기 테스트 (노이즈가 많은 프레임에서도 목록 개수 제한)"""
+    print("\n=== 압축 보고서 테스트 ===")
+    
+    try:
+        import json
+        
+        noisy = np.random.RandomState(0).randint(0, 255, (1080, 1920, 3)).astype(np.uint8)
+        analyzer = AdvancedDisplayAnalyzer()
+        report = analyzer.create_analysis_report(noisy)
+        limit = analyzer.MAX_REPORT_COORDINATES
+        for section, key in (('dead_pixels', 'coordinates'), ('bright_spots', 'spots'),
+                             ('mura_defects', 'defects')):
+            items = report[section][key]
+            if len(items) > limit or report[section][f'{key}_truncated'] != (report[section]['count'] > limit):
+                raise AssertionError(f"{section} 목록 제한 실패: {len(items)}개 / 전체 {report[section]['count']}개")
+        
+        text = json.dumps(report)
+        restored = json.loads(text)
+        if restored['bright_spots']['count'] != report['bright_spots']['count'] or len(text) > 32 * 1024:
+            raise AssertionError(f"압축 보고서 JSON 크기 초과: {len(text) / 1024:.1f}KB")
+        print(f"✓ 압축 보고서 JSON {len(text) / 1024:.1f}KB (밝은 점 {report['bright_spots']['count']}개, "
+              f"무라 {report['mura_defects']['count']}개)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 압축 보고서 테스트 실패: {str(e)}")
+        return False
+
+def test_delta_e_uniformity():
+    """ΔE 색상 균일성 분석 테스트"""
+    print("\n=== ΔE 색상 균일성 테스트 ===")
+    
+    try:
+        from color_lut import LabLookupTable, bgr_to_lab
+        
+        # 6비트 LUT Lab은 픽셀 단위 cv2 변환과 양자화 오차 이내로 일치
+        lut = LabLookupTable(cache_dir=None)
+        image = np.random.RandomState(0).randint(0, 256, (64, 64, 3)).astype(np.uint8)
+        exact = cv2.cvtColor(image.astype(np.float32) / 255.0, cv2.COLOR_BGR2Lab)
+        error = np.linalg.norm(lut.convert(image) - exact, axis=2)
+        if error.mean() > 1.5 or error.max() > 4.0:
+            raise AssertionError(f"LUT Lab 오차 초과: 평균 {error.mean():.2f}, 최대 {error.max():.2f}")
+        print(f"✓ LUT Lab 변환 일치 (평균 ΔE {error.mean():.2f})")
+        
+        analyzer = AdvancedDisplayAnalyzer()
+        analyzer.lab_lut = lut
+        
+        # 균일한 화면은 모든 ΔE 지표가 0
+        uniform = np.full((200, 200, 3), 128, dtype=np.uint8)
+        for per_pixel in (False, True):
+            result = analyzer.analyze_color_uniformity_delta_e(uniform, per_pixel=per_pixel)
+            values = [result['max_delta_e'], result['mean_delta_e'], result['p95_delta_e']]
+            if max(values) > 1e-4 or result['grade'] != '우수':
+                raise AssertionError(f"균일 화면 ΔE 불일치 (per_pixel={per_pixel}): {values}")
+        print("✓ 균일 화면 ΔE 0 확인")
+        
+        # 한 셀(20x20)만 색이 다른 화면: 최대 ΔE = 그 셀과 중앙 셀의 Lab 거리, 평균은 1/100
+        gray_lab = bgr_to_lab([128, 128, 128])
+        for tint, grade in (([128, 128, 136], '양호'), ([128, 128, 144], '불량')):
+            tinted = uniform.copy()
+            tinted[:20, :20] = tint
+            expected = float(np.linalg.norm(bgr_to_lab(tint) - gray_lab))
+            result = analyzer.analyze_color_uniformity_delta_e(tinted)
+            if (abs(result['max_delta_e'] - expected) > 1e-3 or result['grade'] != grade
+                    or abs(result['mean_delta_e'] - expected / 100) > 1e-4 or result['p95_delta_e'] > 1e-4
+                    or abs(result['delta_e'][0][0] - expected) > 1e-3):
+                raise AssertionError(f"색 얼룩 ΔE 불일치: {result['max_delta_e']:.3f} != {expected:.3f} "
+                                     f"({result['grade']})")
+            print(f"✓ 색 얼룩 셀 ΔE {expected:.2f} → {grade}")
+        return True
+        
+    except Exception as e:
+        print(f"✗ ΔE 색상 균일성 테스트 실패: {str(e)}")
+        return False
+
+def test_gamma_response():
+    """감마 응답 측정 테스트 (계단형 패턴 / 계조 캡처 시퀀스)"""
+    print("\n=== 감마 응답 측정 테스트 ===")
+    
+    try:
+        from gamma_response import GammaResponseAnalyzer
+        from test_pattern_generator import TestPatternGenerator
+        
+        # 감마 2.2 패널을 흑/백 레벨 오프셋과 노이즈가 있는 카메라로 찍은 합성 캡처
+        rng = np.random.default_rng(1)
+        def capture(levels):
+            response = 12 + 230 * np.power(levels / 255.0, 2.2) + rng.normal(0, 1.5, levels.shape)
+            return np.clip(response, 0, 255).round().astype(np.uint8)
+        
+        # 계단형 계조 패턴 (밴드 경계가 흐려진 한 장의 캡처)
+        pattern = TestPatternGenerator().generate_pixel_defect_test(640, 480)
+        stepped = cv2.GaussianBlur(capture(pattern.astype(np.float64)), (5, 5), 0)
+        
+        # 전체 화면 계조 캡처 시퀀스 (레벨마다 프레임 3장 누적)
+        streaming = GammaResponseAnalyzer()
+        for level in TestPatternGenerator.GRAY_LEVELS:
+            for _ in range(3):
+                streaming.add_gray_capture(capture(np.full((120, 160), level, np.float64)), level)
+        
+        for mode, result in (("계단형 패턴", GammaResponseAnalyzer().measure_stepped_pattern(stepped)),
+                             ("계조 캡처 시퀀스", streaming.measure_sequence())):
+            if (abs(result['gamma'] - 2.2) > 0.1 or result['r_squared'] < 0.999
+                    or not result['monotonic'] or len(result['bands']) != len(TestPatternGenerator.GRAY_LEVELS)):
+                raise AssertionError(f"{mode} 감마 측정 불일치: 감마 {result['gamma']:.3f}, "
+                                     f"R² {result['r_squared']:.4f}")
+            print(f"✓ {mode}: 감마 {result['gamma']:.2f}, R² {result['r_squared']:.4f}")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 감마 응답 측정 테스트 실패: {str(e)}")
+        return False
+
+def test_report_renderer():
+    """보고서 렌더링 테스트 (작업 스레드에서 4K 합성 보고서)"""
+    print("\n=== 보고서 렌더링 테스트 ===")
+    
+    try:
+        import threading
+        from report_renderer import ReportRenderer
+        
+        height, width = 2160, 3840
+        image = np.full((height, width, 3), 90, dtype=np.uint8)
+        dead_mask = np.zeros((height, width), dtype=bool)
+        dead_mask[1000, 2000] = True  # 단일 픽셀 결함도 축소 후 남아야 함
+        labels = np.zeros((height, width), dtype=np.int32)
+        labels[400:440, 600:640] = 1
+        mura_mask = np.zeros((height, width), dtype=np.uint8)
+        mura_mask[1500:1600, 3000:3200] = 1
+        grid_colors = [[40, 80, 200]] * 100
+        report = {
+            'dead_pixels': {'count': 1},
+            'bright_spots': {'count': 1},
+            'color_uniformity': {'uniformity_score': 0.9, 'grid_colors': grid_colors},
+            'mura_defects': {'count': 1},
+            'pixel_response': {'histogram': np.bincount([90] * 10, minlength=256).tolist()},
+        }
+        artifacts = {
+            'dead_pixels': {'mask': dead_mask},
+            'bright_spots': {'labels': labels},
+            'mura_defects': {'mask': mura_mask},
+        }
+        
+        result = {}
+        worker = threading.Thread(target=lambda: result.update(
+            canvas=ReportRenderer((1500, 1000)).render(image, report, artifacts)))
+        worker.start()
+        worker.join()
+        canvas = result['canvas']
+        if canvas.shape != (1000, 1500, 3):
+            raise AssertionError(f"보고서 크기 불일치: {canvas.shape}")
+        
+        # 셀 (500x500, 제목 28px) 안의 패널: 4K → 500x281, 세로 가운데 배치
+        def panel(index):
+            x, y = (index % 3) * 500, (index // 3) * 500 + ReportRenderer.TITLE_HEIGHT
+            return canvas[y:y + 472, x:x + 500]
+        scale, top = 500 / width, (472 - 281) // 2
+        checks = {
+            '원본': np.all(panel(0)[top + 140, 250] == 90),
+            '데드 픽셀': panel(1)[top + int(1000 * scale), int(2000 * scale)].max() > 200,
+            '밝은 점': panel(2)[top + int(420 * scale), int(620 * scale)].any(),
+            '색상 균일성': np.all(panel(3)[236, 250] == (40, 80, 200)),
+            '무라': np.all(panel(4)[top + int(1550 * scale), int(3100 * scale)] == 255),
+            '히스토그램': np.any((panel(5)[..., 0] > 200) & (panel(5)[..., 2] < 120)),
+        }
+        failed = [name for name, ok in checks.items() if not ok]
+        if failed:
+            raise AssertionError(f"보고서 패널 누락: {failed}")
+        print("✓ 작업 스레드 보고서 렌더링 성공 (6개 패널)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 보고서 렌더링 테스트 실패: {str(e)}")
+        return False
+
 def test_camera_functionality():
     """카메라 기능 테스트"""
     print("\n=== 카메라 기능 테스트 ===")
@@ -183,6 +432,12 @@ def run_performance_test():
         
         analyzer = AdvancedDisplayAnalyzer()
         
+        # 스크래치 감지 시간 측정 (실시간 검사 루프 10 FPS 예산)
+        start_time = time.time()
+        analyzer.detect_scratches(test_image)
+        scratch_time = time.time() - start_time
+        print(f"  스크래치 감지 시간: {scratch_time * 1000:.1f}ms")
+        
         # 분석 시간 측정
         start_time = time.time()
         report = analyzer.create_analysis_report(test_image)
@@ -209,6 +464,10 @@ def main():
     # 테스트 실행
     tests = [
         ("기본 기능", test_basic_functionality),
+        ("압축 보고서", test_compact_report),
+        ("ΔE 색상 균일성", test_delta_e_uniformity),
+        ("감마 응답 측정", test_gamma_response),
+        ("보고서 렌더링", test_report_renderer),
         ("카메라 기능", test_camera_functionality),
         ("UI 기능", test_ui_functionality),
     ]
@@ -18,6 +18,8 @@ from typing import Tuple, List, Dict, Optional
 import threading
 import time
 
+from edge_detection import PanelTracker
+
 class WorkingDisplayInspector:
     """실제 작동하는 디스플레이 검사 시스템"""
     
@@ -29,6 +31,8 @@ class WorkingDisplayInspector:
         self.inspection_running = False
         self.inspection_thread = None
         self.test_pattern = None
+        self.analyzer = None  # 검사 루프에서 재사용하는 분석기 (작업 버퍼 보유)
+        self.panel_tracker = PanelTracker(self.auto_detect_display_area)  # 검사 루프 패널 추적기
         self.setup_ui()
         
     def setup_ui(self):
@@ -776,6 +780,7 @@ F급 (60점 미만): 데드픽셀 11개 이상, 핫픽셀 11개 이상"""
         self.show_pattern_on_monitor_for_inspection()
         
         self.inspection_running = True
+        self.panel_tracker.reset()
         self.inspection_thread = threading.Thread(target=self.inspection_loop, daemon=True)
         self.inspection_thread.start()
         self.log_result("검사가 시작되었습니다. 모니터의 테스트 패턴을 카메라로 촬영하세요.")
@@ -807,8 +812,8 @@ F급 (60점 미만): 데드픽셀 11개 이상, 핫픽셀 11개 이상"""
                 if ret and frame is not None:
                     frame_count += 1
                     
-                    # 매 프레임마다 디스플레이 영역 감지 시도
-                    display_roi = self.auto_detect_display_area(frame)
+                    # 이전 패널 엣지 주변만 확인하고, 실패할 때만 전체 프레임 감지
+                    display_roi = self.panel_tracker.update(frame)
                     
                     if display_roi is not None:
                         x, y, w, h = display_roi
@@ -906,25 +911,13 @@ F급 (60점 미만): 데드픽셀 11개 이상, 핫픽셀 11개 이상"""
     def quick_inspection(self, roi_image):
         """빠른 검사 실행"""
         try:
-            from advanced_analysis import AdvancedDisplayAnalyzer
-            analyzer = AdvancedDisplayAnalyzer()
-            
-            results = {}
-            
-            # 스크래치 검사
-            scratches = analyzer.detect_scratches(roi_image)
-            results['scratches'] = scratches['count']
-            
-            # 불량화소 검사
-            dead_pixels = analyzer.detect_dead_pixels(roi_image)
-            bright_spots = analyzer.detect_bright_spots(roi_image)
-            results['defects'] = dead_pixels['count'] + bright_spots['count']
-            
-            # 색상 균일성
-            color_uniformity = analyzer.analyze_color_uniformity(roi_image)
-            results['uniformity'] = color_uniformity['uniformity_score']
+            # 분석기는 한 번만 생성하여 작업 버퍼를 프레임 간에 재사용
+            if self.analyzer is None:
+                from advanced_analysis import AdvancedDisplayAnalyzer
+                self.analyzer = AdvancedDisplayAnalyzer()
             
-            return results
+            # 스크래치 / 불량화소 / 색상 균일성 검사
+            return self.analyzer.quick_inspection(roi_image)
             
         except Exception as e:
             self.log_result(f"빠른 검사 오류: {str(e)}")